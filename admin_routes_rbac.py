@@ -4,15 +4,35 @@ Admin Routes with Complete RBAC Protection
 Production-ready admin panel with role-based access control
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app
 from flask_login import login_required, current_user
-from models import db, User, Student, Attendance, RiskProfile, Alert
+from app import cache
+from models import db, User, Student, Attendance, RiskProfile, Alert, student_search_filter
 from rbac_system import admin_required, role_required, filter_student_query_for_current_user
 from sqlalchemy import func, desc
 from datetime import datetime, date, timedelta
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
+SYSTEM_COUNTS_CACHE_KEY = 'rbac_admin_system_counts'
+
+def get_system_counts():
+    """Dashboard counters, shared across requests for DASHBOARD_COUNTS_CACHE_TIMEOUT seconds"""
+    stats = cache.get(SYSTEM_COUNTS_CACHE_KEY)
+    if stats is None:
+        # All seven counters come back from one statement
+        stats = db.session.query(
+            db.session.query(func.count(User.id)).scalar_subquery().label('total_users'),
+            db.session.query(func.count(Student.id)).scalar_subquery().label('total_students'),
+            db.session.query(func.count(User.id)).filter(User.role == 'faculty').scalar_subquery().label('total_faculty'),
+            db.session.query(func.count(User.id)).filter(User.role == 'admin').scalar_subquery().label('total_admins'),
+            db.session.query(func.count(Attendance.id)).scalar_subquery().label('total_attendance'),
+            db.session.query(func.count(Alert.id)).scalar_subquery().label('total_alerts'),
+            db.session.query(func.count(Alert.id)).filter(Alert.status == 'Active').scalar_subquery().label('active_alerts')
+        ).one()._asdict()
+        cache.set(SYSTEM_COUNTS_CACHE_KEY, stats, timeout=current_app.config['DASHBOARD_COUNTS_CACHE_TIMEOUT'])
+    return stats
+
 @admin_bp.route('/')
 @admin_bp.route('/dashboard')
 @admin_required
@@ -22,15 +42,7 @@ def dashboard():
     Only accessible by admin users
     """
     # Get system statistics
-    stats = {
-        'total_users': User.query.count(),
-        'total_students': Student.query.count(),
-        'total_faculty': User.query.filter_by(role='faculty').count(),
-        'total_admins': User.query.filter_by(role='admin').count(),
-        'total_attendance': Attendance.query.count(),
-        'total_alerts': Alert.query.count(),
-        'active_alerts': Alert.query.filter_by(status='Active').count()
-    }
+    stats = get_system_counts()
     
     # Get recent students
     recent_students = Student.query.order_by(desc(Student.enrollment_date)).limit(5).all()
@@ -88,7 +100,7 @@ def student_detail(student_id):
         .order_by(desc(Alert.created_at)).limit(10).all()
     
     # Get student's user account
-    user = User.query.get(student.user_id) if student.user_id else None
+    user = db.session.get(User, student.user_id) if student.user_id else None
     
     return render_template('admin/student_detail.html',
                          student=student,
@@ -320,10 +332,7 @@ def api_search_students():
     
     # Search students
     students = Student.query.filter(
-        (Student.first_name.ilike(f'%{query}%')) |
-        (Student.last_name.ilike(f'%{query}%')) |
-        (Student.student_id.ilike(f'%{query}%')) |
-        (Student.email.ilike(f'%{query}%'))
+        student_search_filter(query)
     ).limit(10).all()
     
     results = [{
@@ -3,13 +3,14 @@ AI Assistant Routes
 Intelligent chat-based assistant for students
 """
 
-from flask import Blueprint, render_template, request, jsonify, session
+from flask import Blueprint, render_template, request, jsonify, session, redirect, url_for
 from flask_login import login_required, current_user
 from models_enhanced import db, AIInteraction, Student, Scholarship, ScholarshipApplication
 from datetime import datetime
 import json
 import re
 from rbac_system import student_required, get_student_for_current_user
+from rate_limit import rate_limited, chat_bucket
 
 ai_assistant_bp = Blueprint('ai_assistant', __name__, url_prefix='/ai-assistant')
 
@@ -42,6 +43,7 @@ def chat_interface():
 @ai_assistant_bp.route('/api/chat', methods=['POST'])
 @login_required
 @student_required
+@rate_limited(chat_bucket)
 def api_chat():
     """API endpoint for AI Assistant chat"""
     
@@ -140,61 +142,44 @@ def api_feedback():
 # AI Processing Functions
 # ================================
 
+def _keyword_pattern(*keywords):
+    """Compile keywords into one case-insensitive substring alternation"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+# Intent rules in priority order: (topic pattern, sub-intents, fallback intent)
+INTENT_RULES = (
+    (_keyword_pattern('scholarship', 'scholarships', 'award', 'financial aid'), (
+        (_keyword_pattern('eligible', 'qualify', 'can i apply'), 'scholarship_eligibility', 0.9),
+        (_keyword_pattern('apply', 'application', 'how to'), 'scholarship_application', 0.9),
+        (_keyword_pattern('recommend', 'suggest', 'find'), 'scholarship_recommendation', 0.9),
+        (_keyword_pattern('deadline', 'due date', 'when'), 'scholarship_deadline', 0.8),
+    ), ('scholarship_general', 0.8)),
+    (_keyword_pattern('gpa', 'grade', 'academic', 'performance'), (
+        (_keyword_pattern('improve', 'increase', 'better'), 'academic_improvement', 0.9),
+    ), ('academic_general', 0.8)),
+    (_keyword_pattern('career', 'job', 'future', 'profession'), (
+        (_keyword_pattern('advice', 'guidance', 'suggest'), 'career_guidance', 0.9),
+    ), ('career_general', 0.8)),
+    (_keyword_pattern('application', 'apply', 'submitted', 'status'), (
+        (_keyword_pattern('track', 'status', 'check'), 'application_status', 0.9),
+        (_keyword_pattern('help', 'tips', 'improve'), 'application_help', 0.9),
+    ), ('application_general', 0.8)),
+    (_keyword_pattern('help', 'assist', 'support', 'guidance'), (), ('general_help', 0.8)),
+    (_keyword_pattern('hello', 'hi', 'hey', 'good morning', 'good afternoon'), (), ('greeting', 0.9)),
+    (_keyword_pattern('thank', 'thanks', 'appreciate'), (), ('thanks', 0.9)),
+)
+
 def classify_intent(message):
     """Classify user intent using keyword-based approach"""
     
-    message_lower = message.lower()
-    
-    # Scholarship-related intents
-    if any(word in message_lower for word in ['scholarship', 'scholarships', 'award', 'financial aid']):
-        if any(word in message_lower for word in ['eligible', 'qualify', 'can i apply']):
-            return 'scholarship_eligibility', 0.9
-        elif any(word in message_lower for word in ['apply', 'application', 'how to']):
-            return 'scholarship_application', 0.9
-        elif any(word in message_lower for word in ['recommend', 'suggest', 'find']):
-            return 'scholarship_recommendation', 0.9
-        elif any(word in message_lower for word in ['deadline', 'due date', 'when']):
-            return 'scholarship_deadline', 0.8
-        else:
-            return 'scholarship_general', 0.8
-    
-    # Academic-related intents
-    elif any(word in message_lower for word in ['gpa', 'grade', 'academic', 'performance']):
-        if any(word in message_lower for word in ['improve', 'increase', 'better']):
-            return 'academic_improvement', 0.9
-        else:
-            return 'academic_general', 0.8
-    
-    # Career-related intents
-    elif any(word in message_lower for word in ['career', 'job', 'future', 'profession']):
-        if any(word in message_lower for word in ['advice', 'guidance', 'suggest']):
-            return 'career_guidance', 0.9
-        else:
-            return 'career_general', 0.8
-    
-    # Application-related intents
-    elif any(word in message_lower for word in ['application', 'apply', 'submitted', 'status']):
-        if any(word in message_lower for word in ['track', 'status', 'check']):
-            return 'application_status', 0.9
-        elif any(word in message_lower for word in ['help', 'tips', 'improve']):
-            return 'application_help', 0.9
-        else:
-            return 'application_general', 0.8
-    
-    # General help
-    elif any(word in message_lower for word in ['help', 'assist', 'support', 'guidance']):
-        return 'general_help', 0.8
-    
-    # Greeting
-    elif any(word in message_lower for word in ['hello', 'hi', 'hey', 'good morning', 'good afternoon']):
-        return 'greeting', 0.9
-    
-    # Thanks
-    elif any(word in message_lower for word in ['thank', 'thanks', 'appreciate']):
-        return 'thanks', 0.9
+    for topic_pattern, sub_intents, fallback in INTENT_RULES:
+        if topic_pattern.search(message):
+            for pattern, intent, confidence in sub_intents:
+                if pattern.search(message):
+                    return intent, confidence
+            return fallback
     
-    else:
-        return 'general_query', 0.5
+    return 'general_query', 0.5
 
 def generate_ai_response(message, student, intent, session_id):
     """Generate context-aware AI response"""
@@ -690,7 +675,7 @@ def get_scholarship_recommendations(student):
             'title': scholarship.title,
             'provider': scholarship.provider,
             'amount': scholarship.amount,
-            'deadline': scholarship.application_deadline.isoformat(),
+            'deadline': scholarship.application_deadline,
             'score': rec['score'],
             'reason': rec['reason']
         })
@@ -6,10 +6,121 @@ Integrates with OpenAI API and provides intelligent fallback responses
 
 import os
 import json
+import random
+import threading
 import requests
 from datetime import datetime
 from typing import Dict, List, Optional
 import re
+from functools import lru_cache
+from keyword_matcher import KeywordMatcher
+
+# Fallback categories in priority order (first match wins)
+FALLBACK_KEYWORDS = (
+    ('greeting', ['hello', 'hi', 'hey', 'greetings']),
+    ('help', ['help', 'assist', 'support', 'guide']),
+    ('computer_science', ['computer science', 'cs']),
+    ('programming', ['programming', 'coding', 'code']),
+    ('study', ['study', 'learn', 'exam', 'test', 'homework', 'assignment']),
+    ('motivation', ['motivate', 'encourage', 'inspire', 'motivation']),
+    ('stress', ['stress', 'anxious', 'overwhelmed', 'pressure']),
+    ('career', ['career', 'job', 'future', 'profession', 'work']),
+    ('time', ['time', 'schedule', 'plan', 'organize', 'manage']),
+)
+
+# Emotional states in priority order (first match wins)
+EMOTION_KEYWORDS = (
+    ('sad', ['sad', 'depressed', 'unhappy', 'down', 'blue', 'low', 'miserable']),
+    ('stressed', ['stressed', 'overwhelmed', 'anxious', 'worried', 'tense', 'pressure']),
+    ('tired', ['tired', 'exhausted', 'fatigued', 'burnout', 'weary', 'drained']),
+    ('confused', ['confused', 'lost', 'uncertain', 'unsure', 'clueless', 'puzzled']),
+    ('demotivated', ['demotivated', 'unmotivated', 'lazy', 'procrastinate', 'no energy']),
+)
+
+_emotion_matcher = KeywordMatcher(EMOTION_KEYWORDS)
+
+# Fallback responses per category; tuples since they are never mutated
+FALLBACK_RESPONSES = {
+    'greeting': (
+        "Hello! I'm here to help you. How can I assist you today?",
+        "Hi there! I'm your AI assistant. What's on your mind?",
+        "Greetings! How can I support you today?"
+    ),
+    'help': (
+        "I can help you with study strategies, time management, career guidance, and motivation. What specific area would you like assistance with?",
+        "I'm here to support your academic journey. I can help with studying, motivation, career planning, and personal development. What do you need help with?",
+        "I'm your AI assistant for student success. I can provide study tips, motivational support, career advice, and academic guidance. How can I help?"
+    ),
+    'study': (
+        "Here are some effective study strategies:\n1. Use the Pomodoro Technique (25 min study, 5 min break)\n2. Create a structured study schedule\n3. Use active recall instead of passive reading\n4. Practice with past papers\n5. Study in a distraction-free environment",
+        "For better studying, try these methods:\n• Break large topics into smaller chunks\n• Use spaced repetition for memory\n• Teach concepts to others\n• Create mind maps and visual aids\n• Take regular breaks to maintain focus"
+    ),
+    'computer_science': (
+        "Computer Science Career Path:\n\n**Popular Specializations:**\n• Software Development\n• Data Science/AI\n• Cybersecurity\n• Web Development\n• Mobile Development\n• Cloud Computing\n\n**Key Skills to Develop:**\n• Programming (Python, Java, JavaScript)\n• Data Structures & Algorithms\n• Database Management\n• System Design\n• Problem Solving\n\n**Career Opportunities:**\n• Software Engineer ($70K-150K)\n• Data Scientist ($80K-180K)\n• Cybersecurity Analyst ($65K-130K)\n• Full Stack Developer ($75K-140K)\n\n**Next Steps:**\n1. Start with fundamentals (Python/Java)\n2. Build personal projects\n3. Get certifications (AWS, Google)\n4. Join coding communities\n5. Apply for internships",
+    ),
+    'programming': (
+        "Programming Learning Path:\n\n**Beginner Steps:**\n1. Choose your first language (Python recommended)\n2. Learn basic syntax and concepts\n3. Practice with simple problems\n4. Build small projects\n\n**Intermediate Skills:**\n• Data structures (arrays, lists, trees)\n• Algorithms (sorting, searching)\n• Object-oriented programming\n• Database basics\n\n**Advanced Topics:**\n• System design\n• Machine learning\n• Cloud platforms\n• DevOps\n\n**Resources:**\n• Free: Codecademy, freeCodeCamp, YouTube\n• Paid: Coursera, Udemy, Bootcamps\n• Practice: LeetCode, HackerRank, GitHub",
+    ),
+    'career': (
+        "Career planning advice:\n1. Identify your interests and strengths through self-reflection\n2. Research different career options that match your profile\n3. Talk to professionals in fields that interest you\n4. Gain relevant skills through courses and internships\n5. Build a professional network through LinkedIn and events\n6. Create a compelling resume and portfolio",
+    ),
+    'motivation': (
+        "Remember: Every expert was once a beginner. Keep going, you're making progress even when it doesn't feel like it!",
+        "Success is not final, failure is not fatal: it is the courage to continue that counts. You've got this!",
+        "The secret of getting ahead is getting started. Take that first step, no matter how small.",
+        "Believe you can and you're halfway there. Your potential is limitless!"
+    ),
+    'stress': (
+        "Stress management tips:\n1. Practice deep breathing exercises (4-7-8 technique)\n2. Take regular breaks and stretch\n3. Exercise regularly - even 15 minutes helps\n4. Get 7-8 hours of quality sleep\n5. Talk to friends, family, or counselors\n6. Break large tasks into smaller, manageable steps",
+        "When feeling overwhelmed, try this:\n• Pause and take 3 deep breaths\n• Write down everything that's stressing you\n• Prioritize what's most important\n• Ask for help when needed\n• Remember: it's okay to not be okay sometimes"
+    ),
+    'time': (
+        "Time management strategies:\n1. Use a digital calendar or planner\n2. Prioritize tasks using the Eisenhower Matrix (Urgent/Important)\n3. Break large projects into smaller milestones\n4. Use time-blocking for focused work\n5. Eliminate distractions (turn off notifications)\n6. Review and adjust your schedule weekly",
+    ),
+    'default': (
+        "I'm here to help! Could you tell me more about what you need assistance with? I can help with studying, motivation, career planning, and stress management.",
+        "I'd be happy to help you! Whether you need study tips, motivational support, or career advice, I'm here for you. What specific challenge are you facing?",
+        "I'm your AI assistant dedicated to your success. Feel free to ask me anything about studying, motivation, career planning, or personal development."
+    )
+}
+
+# One Random per worker thread so concurrent responses don't share generator state
+_thread_local = threading.local()
+
+def _rng() -> random.Random:
+    rng = getattr(_thread_local, 'rng', None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random()
+    return rng
+
+def _choice(seq):
+    return _rng().choice(seq)
+
+# Matcher payloads are the response tuples themselves, so no category lookup per message
+_fallback_matcher = KeywordMatcher(
+    (FALLBACK_RESPONSES[category], keywords) for category, keywords in FALLBACK_KEYWORDS
+)
+_DEFAULT_RESPONSES = FALLBACK_RESPONSES['default']
+
+_WHITESPACE = re.compile(r'\s+')
+_CLASSIFY_CACHE_MAX_LENGTH = 256
+
+@lru_cache(maxsize=4096)
+def _classify_cached(message_lower: str) -> tuple:
+    return _fallback_matcher.search(message_lower, default=_DEFAULT_RESPONSES)
+
+def _classify(message_lower: str) -> tuple:
+    """Resolve the fallback responses for a lowercased message"""
+    normalized = _WHITESPACE.sub(' ', message_lower).strip()
+    
+    # Too short to contain any keyword; keep filler like "k" out of the cache
+    if len(normalized) < _fallback_matcher.min_length:
+        return _DEFAULT_RESPONSES
+    
+    # Long one-off messages are scanned directly so they can't flood the cache
+    if len(normalized) > _CLASSIFY_CACHE_MAX_LENGTH:
+        return _fallback_matcher.search(normalized, default=_DEFAULT_RESPONSES)
+    return _classify_cached(normalized)
 
 class AIChatbotService:
     """Intelligent AI Chatbot with multiple response strategies"""
@@ -20,119 +131,26 @@ class AIChatbotService:
         self.max_history = 10  # Keep last 10 messages per session
         
         # Motivational keywords for emotional detection
-        self.motivational_keywords = {
-            'sad': ['sad', 'depressed', 'unhappy', 'down', 'blue', 'low', 'miserable'],
-            'stressed': ['stressed', 'overwhelmed', 'anxious', 'worried', 'tense', 'pressure'],
-            'tired': ['tired', 'exhausted', 'fatigued', 'burnout', 'weary', 'drained'],
-            'confused': ['confused', 'lost', 'uncertain', 'unsure', 'clueless', 'puzzled'],
-            'demotivated': ['demotivated', 'unmotivated', 'lazy', 'procrastinate', 'no energy']
-        }
+        self.motivational_keywords = dict(EMOTION_KEYWORDS)
         
         # Smart fallback responses
-        self.fallback_responses = {
-            'greeting': [
-                "Hello! I'm here to help you. How can I assist you today?",
-                "Hi there! I'm your AI assistant. What's on your mind?",
-                "Greetings! How can I support you today?"
-            ],
-            'help': [
-                "I can help you with study strategies, time management, career guidance, and motivation. What specific area would you like assistance with?",
-                "I'm here to support your academic journey. I can help with studying, motivation, career planning, and personal development. What do you need help with?",
-                "I'm your AI assistant for student success. I can provide study tips, motivational support, career advice, and academic guidance. How can I help?"
-            ],
-            'study': [
-                "Here are some effective study strategies:\n1. Use the Pomodoro Technique (25 min study, 5 min break)\n2. Create a structured study schedule\n3. Use active recall instead of passive reading\n4. Practice with past papers\n5. Study in a distraction-free environment",
-                "For better studying, try these methods:\n• Break large topics into smaller chunks\n• Use spaced repetition for memory\n• Teach concepts to others\n• Create mind maps and visual aids\n• Take regular breaks to maintain focus"
-            ],
-            'computer_science': [
-                "Computer Science Career Path:\n\n**Popular Specializations:**\n• Software Development\n• Data Science/AI\n• Cybersecurity\n• Web Development\n• Mobile Development\n• Cloud Computing\n\n**Key Skills to Develop:**\n• Programming (Python, Java, JavaScript)\n• Data Structures & Algorithms\n• Database Management\n• System Design\n• Problem Solving\n\n**Career Opportunities:**\n• Software Engineer ($70K-150K)\n• Data Scientist ($80K-180K)\n• Cybersecurity Analyst ($65K-130K)\n• Full Stack Developer ($75K-140K)\n\n**Next Steps:**\n1. Start with fundamentals (Python/Java)\n2. Build personal projects\n3. Get certifications (AWS, Google)\n4. Join coding communities\n5. Apply for internships"
-            ],
-            'programming': [
-                "Programming Learning Path:\n\n**Beginner Steps:**\n1. Choose your first language (Python recommended)\n2. Learn basic syntax and concepts\n3. Practice with simple problems\n4. Build small projects\n\n**Intermediate Skills:**\n• Data structures (arrays, lists, trees)\n• Algorithms (sorting, searching)\n• Object-oriented programming\n• Database basics\n\n**Advanced Topics:**\n• System design\n• Machine learning\n• Cloud platforms\n• DevOps\n\n**Resources:**\n• Free: Codecademy, freeCodeCamp, YouTube\n• Paid: Coursera, Udemy, Bootcamps\n• Practice: LeetCode, HackerRank, GitHub"
-            ],
-            'career': [
-                "Career planning advice:\n1. Identify your interests and strengths through self-reflection\n2. Research different career options that match your profile\n3. Talk to professionals in fields that interest you\n4. Gain relevant skills through courses and internships\n5. Build a professional network through LinkedIn and events\n6. Create a compelling resume and portfolio"
-            ],
-            'motivation': [
-                "Remember: Every expert was once a beginner. Keep going, you're making progress even when it doesn't feel like it!",
-                "Success is not final, failure is not fatal: it is the courage to continue that counts. You've got this!",
-                "The secret of getting ahead is getting started. Take that first step, no matter how small.",
-                "Believe you can and you're halfway there. Your potential is limitless!"
-            ],
-            'stress': [
-                "Stress management tips:\n1. Practice deep breathing exercises (4-7-8 technique)\n2. Take regular breaks and stretch\n3. Exercise regularly - even 15 minutes helps\n4. Get 7-8 hours of quality sleep\n5. Talk to friends, family, or counselors\n6. Break large tasks into smaller, manageable steps",
-                "When feeling overwhelmed, try this:\n• Pause and take 3 deep breaths\n• Write down everything that's stressing you\n• Prioritize what's most important\n• Ask for help when needed\n• Remember: it's okay to not be okay sometimes"
-            ],
-            'time': [
-                "Time management strategies:\n1. Use a digital calendar or planner\n2. Prioritize tasks using the Eisenhower Matrix (Urgent/Important)\n3. Break large projects into smaller milestones\n4. Use time-blocking for focused work\n5. Eliminate distractions (turn off notifications)\n6. Review and adjust your schedule weekly"
-            ],
-            'default': [
-                "I'm here to help! Could you tell me more about what you need assistance with? I can help with studying, motivation, career planning, and stress management.",
-                "I'd be happy to help you! Whether you need study tips, motivational support, or career advice, I'm here for you. What specific challenge are you facing?",
-                "I'm your AI assistant dedicated to your success. Feel free to ask me anything about studying, motivation, career planning, or personal development."
-            ]
-        }
+        self.fallback_responses = FALLBACK_RESPONSES
     
-    def detect_emotional_state(self, message: str) -> Optional[str]:
+    def detect_emotional_state(self, message: str, message_lower: str = None) -> Optional[str]:
         """
         Detect user's emotional state from message
         """
-        message_lower = message.lower()
-        
-        for emotion, keywords in self.motivational_keywords.items():
-            if any(keyword in message_lower for keyword in keywords):
-                return emotion
-        
-        return None
+        if message_lower is None:
+            message_lower = message.lower()
+        return _emotion_matcher.search(message_lower)
     
-    def get_fallback_response(self, message: str) -> str:
+    def get_fallback_response(self, message: str, message_lower: str = None) -> str:
         """
         Generate intelligent fallback response based on message content
         """
-        message_lower = message.lower()
-        
-        # Check for greeting
-        if any(word in message_lower for word in ['hello', 'hi', 'hey', 'greetings']):
-            return self._get_random_response('greeting')
-        
-        # Check for help request
-        if any(word in message_lower for word in ['help', 'assist', 'support', 'guide']):
-            return self._get_random_response('help')
-        
-        # Check for computer science related queries
-        if any(word in message_lower for word in ['computer science', 'cs', 'programming', 'coding', 'software', 'developer', 'code']):
-            if 'computer science' in message_lower or 'cs' in message_lower:
-                return self._get_random_response('computer_science')
-            elif any(word in message_lower for word in ['programming', 'coding', 'code']):
-                return self._get_random_response('programming')
-        
-        # Check for study-related queries
-        if any(word in message_lower for word in ['study', 'learn', 'exam', 'test', 'homework', 'assignment']):
-            return self._get_random_response('study')
-        
-        # Check for motivational needs
-        if any(word in message_lower for word in ['motivate', 'encourage', 'inspire', 'motivation']):
-            return self._get_random_response('motivation')
-        
-        # Check for stress-related queries
-        if any(word in message_lower for word in ['stress', 'anxious', 'overwhelmed', 'pressure']):
-            return self._get_random_response('stress')
-        
-        # Check for career-related queries
-        if any(word in message_lower for word in ['career', 'job', 'future', 'profession', 'work']):
-            return self._get_random_response('career')
-        
-        # Check for time management queries
-        if any(word in message_lower for word in ['time', 'schedule', 'plan', 'organize', 'manage']):
-            return self._get_random_response('time')
-        
-        # Default response
-        return self._get_random_response('default')
-    
-    def _get_random_response(self, category: str) -> str:
-        """Get a random response from a category"""
-        import random
-        return random.choice(self.fallback_responses.get(category, self.fallback_responses['default']))
+        if message_lower is None:
+            message_lower = message.lower()
+        return _choice(_classify(message_lower))
     
     def call_openai_api(self, message: str, session_id: str = None) -> Optional[str]:
         """
@@ -232,8 +250,11 @@ class AIChatbotService:
                 "error_type": "empty_input"
             }
         
+        # Lowercase once for every keyword scan below
+        message_lower = message.lower()
+        
         # Detect emotional state
-        emotional_state = self.detect_emotional_state(message)
+        emotional_state = self.detect_emotional_state(message, message_lower)
         
         # Try OpenAI API first
         ai_response = self.call_openai_api(message, session_id)
@@ -243,7 +264,7 @@ class AIChatbotService:
             response_source = "openai"
         else:
             # Use intelligent fallback
-            response = self.get_fallback_response(message)
+            response = self.get_fallback_response(message, message_lower)
             response_source = "fallback"
         
         # Add motivational touch if user seems to need it
@@ -256,7 +277,7 @@ class AIChatbotService:
             "status": "success",
             "source": response_source,
             "emotional_state": emotional_state,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
     
     def _get_motivational_touch(self, emotional_state: str) -> str:
@@ -3,13 +3,22 @@ AI Dashboard Routes
 Comprehensive analytics, insights, and predictive analytics
 """
 
-from flask import Blueprint, render_template, request, jsonify
+from flask import Blueprint, render_template, request, jsonify, redirect, url_for
 from flask_login import login_required, current_user
 from models_enhanced import db, Scholarship, ScholarshipApplication, Student, User, AnalyticsData, ApplicationStatus, ScholarshipStatus
 from datetime import datetime, timedelta, date
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, select
+import numpy as np
 import json
 from rbac_system import admin_required, student_required, get_student_for_current_user
+from response_cache import cached_json_response
+
+# Numba is optional; without it at-risk scoring runs as plain NumPy
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 ai_dashboard_bp = Blueprint('ai_dashboard', __name__, url_prefix='/ai-dashboard')
 
@@ -182,6 +191,7 @@ def student_dashboard():
 @ai_dashboard_bp.route('/api/metrics')
 @login_required
 @admin_required
+@cached_json_response('ai_dashboard:metrics', timeout=30)
 def api_metrics():
     """API endpoint for dashboard metrics"""
     
@@ -203,6 +213,7 @@ def api_metrics():
 @ai_dashboard_bp.route('/api/trends')
 @login_required
 @admin_required
+@cached_json_response(lambda: f"ai_dashboard:trends:{request.args.get('days', 30)}", timeout=60)
 def api_trends():
     """API endpoint for application trends"""
     
@@ -221,7 +232,7 @@ def api_trends():
     data = []
     for trend in trends:
         data.append({
-            'date': trend.date.isoformat(),
+            'date': trend.date,
             'total': trend.count,
             'approved': trend.approved or 0,
             'rejected': trend.rejected or 0
@@ -338,63 +349,105 @@ def predict_success_rates():
     
     return predictions
 
+# At-risk factor labels (bit i of a factor mask) and the score each contributes
+AT_RISK_FACTORS = ('Low GPA', 'Poor Attendance', 'Insufficient Credits', 'Low Income', 'High Financial Need')
+AT_RISK_WEIGHTS = np.array([30, 25, 20, 25, 15], dtype=np.int16)
+AT_RISK_LIMIT = 10
+
+def _score_at_risk_numpy(gpa, attendance, credits, income, high_need):
+    """Return (risk_scores, factor_masks) for column arrays; unset (0) values never count as a risk"""
+    hits = np.column_stack((
+        (gpa != 0) & (gpa < 2.5),
+        (attendance != 0) & (attendance < 75),
+        (credits != 0) & (credits < 30),
+        (income != 0) & (income < 20000),
+        high_need
+    ))
+    risk_scores = np.minimum(hits @ AT_RISK_WEIGHTS, 100).astype(np.int16)
+    factor_masks = hits.astype(np.int32) @ (1 << np.arange(len(AT_RISK_FACTORS), dtype=np.int32))
+    return risk_scores, factor_masks
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _score_at_risk_jit(gpa, attendance, credits, income, high_need):
+        n = gpa.shape[0]
+        risk_scores = np.zeros(n, np.int16)
+        factor_masks = np.zeros(n, np.int32)
+        for i in prange(n):
+            risk = 0
+            factors = 0
+            if gpa[i] != 0 and gpa[i] < 2.5:
+                risk += 30
+                factors |= 1
+            if attendance[i] != 0 and attendance[i] < 75:
+                risk += 25
+                factors |= 2
+            if credits[i] != 0 and credits[i] < 30:
+                risk += 20
+                factors |= 4
+            if income[i] != 0 and income[i] < 20000:
+                risk += 25
+                factors |= 8
+            if high_need[i]:
+                risk += 15
+                factors |= 16
+            risk_scores[i] = min(risk, 100)
+            factor_masks[i] = factors
+        return risk_scores, factor_masks
+    
+    # Compiled on the first call (and cached on disk), not at import
+    score_at_risk = _score_at_risk_jit
+else:
+    score_at_risk = _score_at_risk_numpy
+
 def identify_at_risk_students():
     """Identify students at risk of academic or financial issues"""
     
-    # Academic risk factors
-    academic_risk_students = Student.query.filter(
-        or_(
-            Student.gpa < 2.5,
-            Student.attendance_rate < 75,
-            Student.credits_completed < 30
+    # Academic or financial risk factors; only the scored columns are fetched
+    rows = db.session.execute(
+        select(
+            Student.id,
+            Student.gpa,
+            Student.attendance_rate,
+            Student.credits_completed,
+            Student.annual_income,
+            Student.financial_need_level
+        ).where(
+            or_(
+                Student.gpa < 2.5,
+                Student.attendance_rate < 75,
+                Student.credits_completed < 30,
+                Student.annual_income < 20000,
+                Student.financial_need_level == 'High'
+            )
         )
     ).all()
     
-    # Financial risk factors
-    financial_risk_students = Student.query.filter(
-        or_(
-            Student.annual_income < 20000,
-            Student.financial_need_level == 'High'
-        )
-    ).all()
+    if not rows:
+        return []
     
-    # Combine and score
-    at_risk = []
-    for student in academic_risk_students + financial_risk_students:
-        risk_score = 0
-        risk_factors = []
-        
-        if student.gpa and student.gpa < 2.5:
-            risk_score += 30
-            risk_factors.append('Low GPA')
-        
-        if student.attendance_rate and student.attendance_rate < 75:
-            risk_score += 25
-            risk_factors.append('Poor Attendance')
-        
-        if student.credits_completed and student.credits_completed < 30:
-            risk_score += 20
-            risk_factors.append('Insufficient Credits')
-        
-        if student.annual_income and student.annual_income < 20000:
-            risk_score += 25
-            risk_factors.append('Low Income')
-        
-        if student.financial_need_level == 'High':
-            risk_score += 15
-            risk_factors.append('High Financial Need')
-        
-        if risk_score > 0:
-            at_risk.append({
-                'student': student,
-                'risk_score': min(risk_score, 100),
-                'risk_factors': risk_factors
-            })
+    count = len(rows)
+    gpa = np.fromiter((r.gpa or 0 for r in rows), dtype=np.float64, count=count)
+    attendance = np.fromiter((r.attendance_rate or 0 for r in rows), dtype=np.float64, count=count)
+    credits = np.fromiter((r.credits_completed or 0 for r in rows), dtype=np.float64, count=count)
+    income = np.fromiter((r.annual_income or 0 for r in rows), dtype=np.float64, count=count)
+    high_need = np.fromiter((r.financial_need_level == 'High' for r in rows), dtype=np.bool_, count=count)
+    
+    risk_scores, factor_masks = score_at_risk(gpa, attendance, credits, income, high_need)
+    
+    # Highest scores first, ties keep query order
+    order = np.argsort(-risk_scores, kind='stable')
+    order = order[risk_scores[order] > 0][:AT_RISK_LIMIT]
     
-    # Sort by risk score
-    at_risk.sort(key=lambda x: x['risk_score'], reverse=True)
+    # Hydrate full Student objects for the returned rows only
+    top_ids = [rows[i].id for i in order]
+    students = {student.id: student for student in Student.query.filter(Student.id.in_(top_ids))}
     
-    return at_risk[:10]  # Top 10 at-risk students
+    return [{
+        'student': students[rows[i].id],
+        'risk_score': int(risk_scores[i]),
+        'risk_factors': [name for bit, name in enumerate(AT_RISK_FACTORS) if factor_masks[i] >> bit & 1]
+    } for i in order]
 
 def generate_scholarship_recommendations():
     """Generate recommendations for new scholarships"""
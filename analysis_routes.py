@@ -1,8 +1,7 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
-from models import db, Student, RiskProfile, Attendance
-from datetime import datetime, timedelta
-import pandas as pd
+from models import db, Student, RiskProfile, Attendance, RISK_LEVELS, ATTENDANCE_STATUSES
+from datetime import datetime, date, timedelta
 import numpy as np
 from sqlalchemy import func, and_, or_
 
@@ -49,13 +48,11 @@ def get_comprehensive_analysis():
     total_students = Student.query.count()
     active_students = Student.query.filter(Student.enrollment_date >= datetime.now() - timedelta(days=365)).count()
     
-    # 2. Risk Analysis
-    risk_distribution = db.session.query(
-        RiskProfile.risk_level,
-        func.count(RiskProfile.id)
-    ).group_by(RiskProfile.risk_level).all()
-    
-    risk_data = {level: count for level, count in risk_distribution}
+    # 2. Risk Analysis (pivoted in SQL: one row, a count column per level)
+    risk_data = db.session.query(*(
+        func.count(RiskProfile.id).filter(RiskProfile.risk_level == level).label(level)
+        for level in RISK_LEVELS
+    )).one()._asdict()
     
     # 3. Academic Performance
     performance_stats = db.session.query(
@@ -67,12 +64,10 @@ def get_comprehensive_analysis():
     
     # 4. Attendance Analysis
     thirty_days_ago = datetime.now() - timedelta(days=30)
-    attendance_stats = db.session.query(
-        Attendance.status,
-        func.count(Attendance.id).label('count')
-    ).filter(Attendance.date >= thirty_days_ago).group_by(Attendance.status).all()
-    
-    attendance_data = {status: count for status, count in attendance_stats}
+    attendance_data = db.session.query(*(
+        func.count(Attendance.id).filter(Attendance.status == status).label(status)
+        for status in ATTENDANCE_STATUSES
+    )).filter(Attendance.date >= thirty_days_ago).one()._asdict()
     
     # 5. Department-wise Analysis
     dept_analysis = db.session.query(
@@ -181,36 +176,42 @@ def get_recent_trends():
     """Get recent performance trends"""
     
     # Last 30 days attendance trend
-    thirty_days_ago = datetime.now() - timedelta(days=30)
+    thirty_days_ago = date.today() - timedelta(days=30)
     
+    # Daily rate computed in SQL; every group has at least one row, so no zero guard is needed.
+    # Attendance.date is already a DATE, so group on the bare column: wrapping it in date()
+    # hides it from ix_attendance_date_status, which otherwise covers this whole query.
     attendance_trend = db.session.query(
-        func.date(Attendance.date).label('date'),
-        func.count(func.case([(Attendance.status == 'Present', 1)])).label('present'),
-        func.count(Attendance.id).label('total')
+        Attendance.date,
+        (func.sum(db.case((Attendance.status == 'Present', 1), else_=0)) * 100.0
+         / func.count(Attendance.id)).label('attendance_rate')
     ).filter(Attendance.date >= thirty_days_ago)\
-     .group_by(func.date(Attendance.date))\
-     .order_by(func.date(Attendance.date)).all()
+     .group_by(Attendance.date)\
+     .order_by(Attendance.date).all()
     
     return [
         {
-            'date': str(date),
-            'attendance_rate': (present / total * 100) if total > 0 else 0
+            'date': day.isoformat(),
+            'attendance_rate': attendance_rate
         }
-        for date, present, total in attendance_trend
+        for day, attendance_rate in attendance_trend
     ]
 
 def get_ai_predictions_summary():
     """Get AI predictions summary"""
     
-    # Get risk profile statistics
-    risk_profiles = RiskProfile.query.all()
+    # Get risk profile statistics; only the confidence column, bucketed as one array
+    confidence = np.fromiter(
+        (value or 0 for (value,) in db.session.query(RiskProfile.ml_confidence)),
+        dtype=np.float64
+    )
     
     predictions = {
-        'total_predictions': len(risk_profiles),
-        'high_confidence': len([rp for rp in risk_profiles if (rp.ml_confidence or 0) > 0.8]),
-        'medium_confidence': len([rp for rp in risk_profiles if 0.5 <= (rp.ml_confidence or 0) <= 0.8]),
-        'low_confidence': len([rp for rp in risk_profiles if (rp.ml_confidence or 0) < 0.5]),
-        'average_confidence': round(sum(rp.ml_confidence or 0 for rp in risk_profiles) / len(risk_profiles) * 100, 1) if risk_profiles else 0
+        'total_predictions': int(confidence.size),
+        'high_confidence': int(np.count_nonzero(confidence > 0.8)),
+        'medium_confidence': int(np.count_nonzero((confidence >= 0.5) & (confidence <= 0.8))),
+        'low_confidence': int(np.count_nonzero(confidence < 0.5)),
+        'average_confidence': round(float(confidence.mean()) * 100, 1) if confidence.size else 0
     }
     
     return predictions
@@ -281,9 +282,12 @@ def generate_recommendations(risk_data, performance_stats):
 def get_ai_insights():
     """Get quick AI insights for popup"""
     
-    total_students = Student.query.count()
-    at_risk_count = RiskProfile.query.filter(RiskProfile.risk_level.in_(['High', 'Critical'])).count()
-    avg_gpa = db.session.query(func.avg(Student.gpa)).scalar() or 0
+    total_students, at_risk_count, avg_gpa = db.session.query(
+        db.session.query(func.count(Student.id)).scalar_subquery(),
+        db.session.query(func.count(RiskProfile.id)).filter(RiskProfile.risk_level.in_(['High', 'Critical'])).scalar_subquery(),
+        db.session.query(func.avg(Student.gpa)).scalar_subquery()
+    ).one()
+    avg_gpa = avg_gpa or 0
     
     insights = []
     
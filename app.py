@@ -3,35 +3,110 @@ EduGuard Application
 Clean, production-ready Flask application with real-time notifications
 """
 
-from flask import Flask, render_template, request
+from flask import Flask, render_template, request, current_app
 from flask_login import LoginManager
 from flask_mail import Mail
+from flask_caching import Cache
 from config import config
+from json_provider import OrjsonProvider
 import os
+import atexit
+import importlib
 import logging
+import logging.handlers
+import queue
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize extensions
-db = None
+from models import db, User
 login_manager = LoginManager()
 mail = Mail()
+cache = Cache()
 socketio = None
 
-def create_app(config_name='default'):
-    """Application factory"""
+# Login and error handlers live at module level and are registered on each app,
+# so create_app doesn't build a fresh set of closures per call
+@login_manager.user_loader
+def load_user(user_id):
+    # Flask-Login keeps the result on g for the rest of the request; session.get
+    # also answers from the identity map when the user is already loaded
+    try:
+        return db.session.get(User, int(user_id))
+    except (ValueError, TypeError):
+        # Malformed id in a tampered or stale session cookie
+        return None
+
+def not_found_error(error):
+    return render_template('errors/404.html'), 404
+
+def internal_error(error):
+    db.session.rollback()
+    return render_template('errors/500.html'), 500
+
+def handle_exception(e):
+    db.session.rollback()
+    # exception() logs the traceback; the message is only formatted if a handler emits it
+    current_app.logger.exception('Unhandled exception: %s', e)
+    return render_template('errors/500.html'), 500
+
+# Database URIs create_app has already run create_all() against in this process
+_SCHEMA_INITIALIZED = set()
+
+# Blueprint modules registered by create_app, in order: (module path, blueprint attribute)
+BLUEPRINTS = (
+    ('routes', 'main_bp'),
+    ('auth_routes', 'auth_bp'),                   # auth with RBAC
+    ('scholarship_routes', 'scholarship_bp'),     # scholarship system
+    ('ai_dashboard_routes', 'ai_dashboard_bp'),   # AI dashboard
+    ('ai_assistant_routes', 'ai_assistant_bp'),   # AI assistant
+    ('counselling_routes', 'counselling_bp'),     # counselling system
+    ('parent_routes', 'parent_bp'),
+    ('support_routes', 'support_bp'),
+    ('analysis_routes', 'analysis_bp'),
+    ('update_routes', 'update_bp'),               # daily update system
+)
+
+def register_blueprints(app, blueprints=BLUEPRINTS):
+    """Import each blueprint module by path and register its blueprint"""
+    for module_path, attr in blueprints:
+        app.register_blueprint(getattr(importlib.import_module(module_path), attr))
+    # One summary line for the whole table rather than a line per blueprint,
+    # and its arguments are only built when debug logging is on
+    if app.logger.isEnabledFor(logging.DEBUG):
+        app.logger.debug('Registered %d blueprints (%s), %d URL rules',
+                         len(blueprints), ', '.join(attr for _, attr in blueprints),
+                         sum(1 for _ in app.url_map.iter_rules()))
+
+def create_app(config_name='default', worker_mode=False, auto_create_tables=None, blueprints=BLUEPRINTS):
+    """
+    Application factory. worker_mode builds the app Celery workers run tasks
+    under: extensions and models only, no blueprints or socket server.
+    auto_create_tables overrides the AUTO_CREATE_TABLES setting; scripts that
+    drop/create the schema in their own app context pass False.
+    blueprints is a (module path, attribute) table like BLUEPRINTS, for entry
+    points that serve a different set of routes.
+    """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    # '/students/' and '/students' both match, instead of a 308 redirect and a second request
+    # (must be set before any blueprint rules are bound)
+    app.url_map.strict_slashes = False
     
     # Load configuration
     app.config.from_object(config[config_name])
     
     # Initialize extensions
-    from models import db
     db.init_app(app)
     login_manager.init_app(app)
     mail.init_app(app)
+    cache.init_app(app)
+    configure_file_logging(app)
+    
+    if worker_mode:
+        return app
     
     # Initialize real-time notifications
     global socketio
@@ -47,81 +122,84 @@ def create_app(config_name='default'):
     login_manager.login_message = 'Please log in to access this page.'
     login_manager.login_message_category = 'info'
     
-    @login_manager.user_loader
-    def load_user(user_id):
-        from models import User
-        return User.query.get(int(user_id))
-    
     # Register blueprints
-    from routes import main_bp
-    app.register_blueprint(main_bp)
-    
-    # Register auth blueprint with RBAC
-    from auth_routes import auth_bp
-    app.register_blueprint(auth_bp)
-    
-    # Register scholarship system
-    from scholarship_routes import scholarship_bp
-    app.register_blueprint(scholarship_bp)
-    
-    # Register AI Dashboard
-    from ai_dashboard_routes import ai_dashboard_bp
-    app.register_blueprint(ai_dashboard_bp)
-    
-    # Register AI Assistant
-    from ai_assistant_routes import ai_assistant_bp
-    app.register_blueprint(ai_assistant_bp)
-    
-    # Register Counselling System
-    from counselling_routes import counselling_bp
-    app.register_blueprint(counselling_bp)
-    
-    # Register parent blueprint
-    from parent_routes import parent_bp
-    app.register_blueprint(parent_bp)
-    
-    # Register support blueprint
-    from support_routes import support_bp
-    app.register_blueprint(support_bp)
-    
-    # Register analysis blueprint
-    from analysis_routes import analysis_bp
-    app.register_blueprint(analysis_bp)
-    
-    # Register daily update system
-    from update_routes import update_bp
-    app.register_blueprint(update_bp)
+    register_blueprints(app, blueprints)
     
     # Error handlers
-    @app.errorhandler(404)
-    def not_found_error(error):
-        return render_template('errors/404.html'), 404
+    app.register_error_handler(404, not_found_error)
+    app.register_error_handler(500, internal_error)
+    app.register_error_handler(Exception, handle_exception)
     
-    @app.errorhandler(500)
-    def internal_error(error):
-        db.session.rollback()
-        return render_template('errors/500.html'), 500
+    # Queue risk recomputes marked during the request, once per student
+    from services.risk_tasks import flush_risk_refreshes
+    app.teardown_request(flush_risk_refreshes)
     
-    @app.errorhandler(Exception)
-    def handle_exception(e):
-        db.session.rollback()
-        app.logger.error(f'Unhandled exception: {str(e)}')
-        return render_template('errors/500.html'), 500
+    app.cli.command('init-db')(init_db_command)
     
-    # Create database tables
-    with app.app_context():
-        try:
-            # Import all models to ensure they're registered
-            from models_parent import ParentMessage
-            from models_support import StudentGoal, MoodLog
-            
-            db.create_all()
-            app.logger.info('Database tables created successfully')
-        except Exception as e:
-            app.logger.error(f'Error creating database tables: {str(e)}')
+    # Create database tables, once per database per process
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI')
+    if auto_create_tables is None:
+        auto_create_tables = app.config.get('AUTO_CREATE_TABLES', True)
+    if auto_create_tables and uri not in _SCHEMA_INITIALIZED:
+        with app.app_context():
+            create_tables(app)
+        # Every app gets a fresh in-memory database, so those are never skipped
+        if ':memory:' not in uri:
+            _SCHEMA_INITIALIZED.add(uri)
     
     return app
 
+# Log file path -> listener thread writing it, shared by every app in the process
+_LOG_LISTENERS = {}
+
+def configure_file_logging(app):
+    """
+    Mirror app logs to LOG_FILE. Request threads only enqueue records; a
+    listener thread does the file I/O. No-op when testing or LOG_FILE is unset.
+    """
+    log_file = app.config.get('LOG_FILE')
+    if app.testing or not log_file:
+        return
+    
+    listener = _LOG_LISTENERS.get(log_file)
+    if listener is None:
+        os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+        # Watched handler reopens the file if it's rotated or removed underneath it
+        file_handler = logging.handlers.WatchedFileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        listener = logging.handlers.QueueListener(queue.SimpleQueue(), file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        _LOG_LISTENERS[log_file] = listener
+    
+    # Apps built by the same factory share one logger; attach the queue to it once
+    if not any(getattr(handler, 'queue', None) is listener.queue for handler in app.logger.handlers):
+        app.logger.addHandler(logging.handlers.QueueHandler(listener.queue))
+
+def create_tables(app):
+    """Create any missing tables; needs an app context"""
+    try:
+        # Import all models to ensure they're registered
+        from models_parent import ParentMessage
+        from models_support import StudentGoal, MoodLog
+        
+        db.create_all()
+        # create_all skips existing tables along with their indexes, so older
+        # databases get the search table and any newer indexes here
+        from models import create_student_fts
+        with db.engine.begin() as connection:
+            for table in db.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
+            create_student_fts(connection=connection)
+        app.logger.info('Database tables created successfully')
+    except Exception as e:
+        app.logger.error('Error creating database tables: %s', e)
+
+def init_db_command():
+    """Create the database tables"""
+    create_tables(current_app)
+
 def run_app():
     """Run the application with SocketIO if available"""
     app = create_app(os.getenv('FLASK_CONFIG') or 'default')
@@ -157,18 +235,27 @@ def run_app():
             port=5000
         )
 
+# Fixed sample students (student_id, first, last, email, department) so re-seeding is a no-op
+SAMPLE_STUDENTS = (
+    ('ST001', 'John', 'Doe', 'john.doe@eduguard.edu', 'Computer Science'),
+    ('ST002', 'Jane', 'Smith', 'jane.smith@eduguard.edu', 'Engineering'),
+    ('ST003', 'Mike', 'Johnson', 'mike.johnson@eduguard.edu', 'Business'),
+    ('ST004', 'Sarah', 'Williams', 'sarah.williams@eduguard.edu', 'Arts'),
+    ('ST005', 'Alex', 'Brown', 'alex.brown@eduguard.edu', 'Science'),
+)
+
 # Create app instance for direct running
 def create_initial_data():
     """Create initial data for the application"""
-    from models import User, Student, Attendance, RiskProfile, db
+    from models import User, Student, Attendance, RiskProfile, db, bump_attendance_version
     from datetime import date, timedelta
+    from sqlalchemy import select
     import hashlib
     import random
     
     try:
-        # Check if admin user exists
-        admin = User.query.filter_by(email='admin@eduguard.edu').first()
-        if not admin:
+        # Check if admin user exists (id only; the row itself isn't needed)
+        if db.session.scalar(select(User.id).where(User.email == 'admin@eduguard.edu')) is None:
             admin = User(
                 username='admin',
                 email='admin@eduguard.edu',
@@ -179,8 +266,7 @@ def create_initial_data():
             print("✅ Created admin user")
         
         # Check if faculty user exists
-        faculty = User.query.filter_by(email='faculty@eduguard.edu').first()
-        if not faculty:
+        if db.session.scalar(select(User.id).where(User.email == 'faculty@eduguard.edu')) is None:
             faculty = User(
                 username='faculty',
                 email='faculty@eduguard.edu',
@@ -190,15 +276,29 @@ def create_initial_data():
             db.session.add(faculty)
             print("✅ Created faculty user")
         
-        # Create sample students
-        if Student.query.count() < 5:
+        # Sample students only go into an empty or near-empty database; inside that,
+        # fixtures whose student, email or username already exists are skipped
+        sample_students = []
+        if Student.query.count() < len(SAMPLE_STUDENTS):
+            existing_ids = {
+                row.student_id for row in
+                Student.query.with_entities(Student.student_id)
+                .filter(Student.student_id.in_([fixture[0] for fixture in SAMPLE_STUDENTS]))
+            }
+            taken_users = set()
+            for username, email in User.query.with_entities(User.username, User.email).filter(
+                db.or_(User.email.in_([fixture[3] for fixture in SAMPLE_STUDENTS]),
+                       User.username.in_([fixture[0].lower() for fixture in SAMPLE_STUDENTS]))
+            ):
+                taken_users.update((username, email))
             sample_students = [
-                ('ST001', 'John', 'Doe', 'john.doe@eduguard.edu', 'Computer Science'),
-                ('ST002', 'Jane', 'Smith', 'jane.smith@eduguard.edu', 'Engineering'),
-                ('ST003', 'Mike', 'Johnson', 'mike.johnson@eduguard.edu', 'Business'),
-                ('ST004', 'Sarah', 'Williams', 'sarah.williams@eduguard.edu', 'Arts'),
-                ('ST005', 'Alex', 'Brown', 'alex.brown@eduguard.edu', 'Science')
+                fixture for fixture in SAMPLE_STUDENTS
+                if fixture[0] not in existing_ids
+                and fixture[0].lower() not in taken_users and fixture[3] not in taken_users
             ]
+        if sample_students:
+            new_students = []
+            risk_profiles = []
             
             for student_id, first_name, last_name, email, department in sample_students:
                 # Create user
@@ -207,13 +307,12 @@ def create_initial_data():
                     email=email,
                     role='student'
                 )
-                student_user.set_password('student123')
-                db.session.add(student_user)
-                db.session.flush()  # Get the user ID
+                student_user.set_seed_password('student123')
                 
-                # Create student profile
+                # Create student profile, linked through the relationship so no
+                # flush is needed per row to learn the user id
                 student = Student(
-                    user_id=student_user.id,
+                    user=student_user,
                     student_id=student_id,
                     first_name=first_name,
                     last_name=last_name,
@@ -228,8 +327,7 @@ def create_initial_data():
                     parent_email=f"parent.{first_name.lower()}@example.com",
                     parent_phone="555-0100"
                 )
-                db.session.add(student)
-                db.session.flush()  # Get the student ID
+                new_students.append(student)
                 
                 # Create risk profile with random holistic factors
                 financial = random.choice([True, False, False, False])
@@ -238,8 +336,8 @@ def create_initial_data():
                 isolation = random.choice([True, False, False, False])
                 mental_score = random.randint(4, 10)
                 
-                risk_profile = RiskProfile(
-                    student_id=student.id,
+                risk_profiles.append(RiskProfile(
+                    student=student,
                     attendance_rate=85.0,
                     academic_performance=75.0,
                     financial_issues=financial,
@@ -247,24 +345,30 @@ def create_initial_data():
                     health_issues=health,
                     social_isolation=isolation,
                     mental_wellbeing_score=mental_score
-                )
-                # Calculate initial risk score
-                risk_profile.update_risk_score()
-                
-                db.session.add(risk_profile)
-                
-                # Create sample attendance records
-                for i in range(30):
-                    attendance_date = date.today() - timedelta(days=i)
-                    status = random.choice(['Present', 'Present', 'Present', 'Absent', 'Late'])
-                    attendance = Attendance(
-                        student_id=student.id,
-                        date=attendance_date,
-                        status=status,
-                        course=f'Course {random.randint(100, 999)}'
-                    )
-                    db.session.add(attendance)
+                ))
+            
+            # Calculate initial risk scores
+            RiskProfile.update_risk_scores(risk_profiles)
+            
+            # One flush writes each table as a single multi-row INSERT and assigns the ids
+            db.session.add_all(new_students)
+            db.session.flush()
+            
+            # Queue sample attendance records for one bulk insert below
+            attendance_rows = [
+                {
+                    'student_id': student.id,
+                    'date': date.today() - timedelta(days=i),
+                    'status': random.choice(['Present', 'Present', 'Present', 'Absent', 'Late']),
+                    'course': f'{student.department} 101'
+                }
+                for student in new_students
+                for i in range(30)
+            ]
             
+            # Plain dicts skip per-row ORM instance construction
+            db.session.bulk_insert_mappings(Attendance, attendance_rows)
+            bump_attendance_version()
             print("✅ Created sample students with data")
         
         db.session.commit()
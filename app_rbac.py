@@ -47,7 +47,7 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB
 # ================================
 
 # Database (use the shared models extension instance)
-from models import db
+from models import db, User
 db.init_app(app)
 
 # CSRF Protection
@@ -69,8 +69,13 @@ def load_user(user_id):
     """
     Load user from database for Flask-Login
     """
-    from models import User
-    return User.query.get(int(user_id))
+    # Flask-Login keeps the result on g for the rest of the request; session.get
+    # also answers from the identity map when the user is already loaded
+    try:
+        return db.session.get(User, int(user_id))
+    except (ValueError, TypeError):
+        # Malformed id in a tampered or stale session cookie
+        return None
 
 # ================================
 # BLUEPRINT REGISTRATION
@@ -243,39 +248,21 @@ def init_database():
 # APPLICATION FACTORY
 # ================================
 
+# Blueprints the RBAC deployment serves, in the shared factory's table format
+RBAC_BLUEPRINTS = (
+    ('auth_routes', 'auth_bp'),
+    ('admin_routes_rbac', 'admin_bp'),
+    ('student_routes_rbac', 'student_bp'),
+)
+
 def create_app(config_name='development'):
     """
-    Application factory for different environments
+    Application factory for different environments: the shared app.create_app
+    with the RBAC blueprints and CSRF protection
     """
-    app = Flask(__name__)
-    
-    # Shared core config required by extensions
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-change-in-production')
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///eduguard.db')
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['WTF_CSRF_ENABLED'] = True
-    app.config['WTF_CSRF_TIME_LIMIT'] = 3600
-
-    # Load configuration based on environment
-    if config_name == 'production':
-        app.config['DEBUG'] = False
-        app.config['SQLALCHEMY_ECHO'] = False
-        app.config['SESSION_COOKIE_SECURE'] = True
-    else:
-        app.config['DEBUG'] = True
-        app.config['SQLALCHEMY_ECHO'] = True
-        app.config['SESSION_COOKIE_SECURE'] = False
-    
-    # Initialize extensions
-    db.init_app(app)
-    login_manager.init_app(app)
+    from app import create_app as create_base_app
+    app = create_base_app(config_name, blueprints=RBAC_BLUEPRINTS)
     csrf.init_app(app)
-    
-    # Register blueprints
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(admin_bp)
-    app.register_blueprint(student_bp)
-    
     return app
 
 # ================================
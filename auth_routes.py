@@ -6,6 +6,7 @@ Production-ready Flask authentication system
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify
 from flask_login import login_user, logout_user, login_required, current_user
+from sqlalchemy import select
 from models import db, User, Student
 from rbac_system import set_user_session, clear_user_session, is_admin, is_student, secure_redirect
 from werkzeug.security import check_password_hash
@@ -114,12 +115,12 @@ def register():
             flash('Password must be at least 6 characters long', 'danger')
             return render_template('auth/register.html')
         
-        # Check if user already exists
-        if User.query.filter_by(email=email).first():
+        # Check if user already exists; selecting only the id skips loading the row
+        if db.session.scalar(select(User.id).where(User.email == email)) is not None:
             flash('Email already registered', 'danger')
             return render_template('auth/register.html')
         
-        if User.query.filter_by(username=username).first():
+        if db.session.scalar(select(User.id).where(User.username == username)) is not None:
             flash('Username already taken', 'danger')
             return render_template('auth/register.html')
         
@@ -9,6 +9,7 @@ import time
 import logging
 from datetime import datetime, date, timedelta
 from models import db, Student, RiskProfile, Attendance, Alert
+from sqlalchemy.orm import selectinload
 from enhanced_ai_predictor import EnhancedRiskPredictor
 from services.ml_service import ml_service
 from app import create_app
@@ -48,13 +49,13 @@ class AutoDataUpdater:
                 logger.info("Daily updates completed successfully!")
                 
             except Exception as e:
-                logger.error(f"Error during daily updates: {e}")
+                logger.error("Error during daily updates: %s", e)
     
     def update_attendance_records(self):
         """Update attendance records and calculate rates"""
         logger.info("Updating attendance records...")
         
-        students = Student.query.all()
+        students = Student.query.options(selectinload(Student.risk_profile)).all()
         updated_count = 0
         
         for student in students:
@@ -73,56 +74,64 @@ class AutoDataUpdater:
                     attendance_rate = 85.0  # Default if no records
                 
                 # Update risk profile
-                risk_profile = RiskProfile.query.filter_by(student_id=student.id).first()
+                risk_profile = student.risk_profile
                 if risk_profile:
                     risk_profile.attendance_rate = attendance_rate
                     updated_count += 1
                 
             except Exception as e:
-                logger.error(f"Error updating attendance for student {student.id}: {e}")
+                logger.error("Error updating attendance for student %s: %s", student.id, e)
         
-        logger.info(f"Updated attendance for {updated_count} students")
+        logger.info("Updated attendance for %s students", updated_count)
     
     def update_risk_assessments(self):
         """Update risk assessments for all students"""
         logger.info("Updating risk assessments...")
         
-        students = Student.query.all()
-        updated_count = 0
+        students = Student.query.options(selectinload(Student.risk_profile)).all()
+        risk_profiles = []
+        ml_batch = []  # (risk_profile, ml_input) scored together below
         
         for student in students:
             try:
-                risk_profile = RiskProfile.query.filter_by(student_id=student.id).first()
+                risk_profile = student.risk_profile
                 if not risk_profile:
                     risk_profile = RiskProfile(student_id=student.id)
-                    db.session.add(risk_profile)
-                
-                # Update risk score using holistic model
-                risk_profile.update_risk_score()
+                    student.risk_profile = risk_profile
+                risk_profiles.append(risk_profile)
                 
-                # Add ML prediction if available
-                try:
-                    ml_input = {
-                        'attendance_rate': risk_profile.attendance_rate or 85,
-                        'average_score': risk_profile.academic_performance or 75,
-                        'assignment_completion_rate': 80,
-                        'quiz_average': risk_profile.academic_performance or 75,
-                        'lms_engagement_score': 60
-                    }
-                    ml_result = ml_service.predict_risk(ml_input)
+            except Exception as e:
+                logger.error("Error updating risk assessment for student %s: %s", student.id, e)
+        
+        # Update risk scores using holistic model, one batch pass for all students
+        RiskProfile.update_risk_scores(risk_profiles)
+        updated_count = len(risk_profiles)
+        
+        for risk_profile in risk_profiles:
+            # Queue ML prediction input
+            ml_input = {
+                'attendance_rate': risk_profile.attendance_rate or 85,
+                'average_score': risk_profile.academic_performance or 75,
+                'assignment_completion_rate': 80,
+                'quiz_average': risk_profile.academic_performance or 75,
+                'lms_engagement_score': 60
+            }
+            ml_batch.append((risk_profile, ml_input))
+        
+        # Add ML predictions if available, one batched model call for all students
+        try:
+            scaled = ml_service.scale_features([ml_input for _, ml_input in ml_batch]) if ml_batch else None
+            if scaled is not None:
+                ml_results = ml_service.predict_risk_scaled(scaled)
+                for (risk_profile, ml_input), ml_result in zip(ml_batch, ml_results):
                     risk_profile.ml_prediction = ml_result['risk_score']
                     risk_profile.ml_confidence = ml_result['probability']
                     risk_profile.ml_features = str(ml_input)
-                except Exception as ml_err:
-                    logger.warning(f"ML prediction failed for student {student.id}: {ml_err}")
-                
-                updated_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error updating risk assessment for student {student.id}: {e}")
+        except Exception as ml_err:
+            logger.warning("ML prediction failed for risk assessment batch: %s", ml_err)
         
         db.session.commit()
-        logger.info(f"Updated risk assessments for {updated_count} students")
+        logger.info("Updated risk assessments for %s students", updated_count)
     
     def generate_daily_alerts(self):
         """Generate daily alerts based on risk assessments"""
@@ -180,16 +189,16 @@ class AutoDataUpdater:
                         alerts_created += 1
                 
             except Exception as e:
-                logger.error(f"Error generating alerts for student {student.id}: {e}")
+                logger.error("Error generating alerts for student %s: %s", student.id, e)
         
         db.session.commit()
-        logger.info(f"Generated {alerts_created} new alerts")
+        logger.info("Generated %s new alerts", alerts_created)
     
     def update_ai_predictions(self):
         """Update AI predictions for all students"""
         logger.info("Updating AI predictions...")
         
-        students = Student.query.all()
+        students = Student.query.options(selectinload(Student.risk_profile)).all()
         updated_count = 0
         
         for student in students:
@@ -221,10 +230,10 @@ class AutoDataUpdater:
                 updated_count += 1
                 
             except Exception as e:
-                logger.error(f"Error updating AI prediction for student {student.id}: {e}")
+                logger.error("Error updating AI prediction for student %s: %s", student.id, e)
         
         db.session.commit()
-        logger.info(f"Updated AI predictions for {updated_count} students")
+        logger.info("Updated AI predictions for %s students", updated_count)
     
     def cleanup_old_data(self):
         """Clean up old data to maintain database performance"""
@@ -256,10 +265,10 @@ class AutoDataUpdater:
                 db.session.delete(mood_log)
             
             db.session.commit()
-            logger.info(f"Deactivated {len(old_alerts)} old alerts, deleted {deleted_count} old mood logs")
+            logger.info("Deactivated %s old alerts, deleted %s old mood logs", len(old_alerts), deleted_count)
             
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
     
     def start_scheduler(self):
         """Start the scheduled task runner"""
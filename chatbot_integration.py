@@ -4,39 +4,24 @@ Chatbot Integration with Main Flask Application
 Complete integration of AI chatbot with existing EduGuard system
 """
 
-from flask import Flask, render_template, request, redirect, url_for
-from flask_sqlalchemy import SQLAlchemy
-from flask_login import LoginManager, current_user
-from chatbot_routes import chatbot_bp
+from flask import render_template, request, redirect, url_for
+from flask_login import current_user
 from ai_chatbot_service import chatbot_service
+from app import create_app, login_manager
+from models import db
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Create Flask app
-app = Flask(__name__)
-
-# Configuration
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-change-in-production')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///eduguard.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-# Initialize extensions
-db = SQLAlchemy(app)
-login_manager = LoginManager()
-login_manager.init_app(app)
-login_manager.login_view = 'login'
-
-# Register chatbot blueprint
-app.register_blueprint(chatbot_bp)
-
-# Load user (simplified for demo)
-@login_manager.user_loader
-def load_user(user_id):
-    from models import User
-    return User.query.get(int(user_id))
+# Chatbot demo app: the shared factory with only the chatbot blueprint
+CHATBOT_BLUEPRINTS = (
+    ('chatbot_routes', 'chatbot_bp'),
+)
+app = create_app(os.getenv('FLASK_CONFIG') or 'default', blueprints=CHATBOT_BLUEPRINTS)
+# There is no auth blueprint here; send chatbot API logins to the demo page
+login_manager.blueprint_login_views['chatbot'] = 'login'
 
 # Main routes
 @app.route('/')
@@ -4,14 +4,58 @@ Chatbot Routes - Flask API endpoints for AI chatbot
 Production-ready chatbot with error handling and session management
 """
 
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, request, jsonify, session, Response
 from flask_login import login_required, current_user
 from ai_chatbot_service import chatbot_service
 from datetime import datetime
+import re
 import uuid
+import orjson
 
 chatbot_bp = Blueprint('chatbot', __name__, url_prefix='/api')
 
+# Static /chat failure body, serialized once at import
+CHAT_SERVER_ERROR_BODY = orjson.dumps({
+    "error": "Internal server error",
+    "status": "error",
+    "error_type": "server_error"
+})
+
+# Blueprint error handler bodies, also static
+BAD_REQUEST_BODY = orjson.dumps({
+    "error": "Bad request",
+    "status": "error",
+    "message": "The request was invalid or malformed"
+})
+NOT_FOUND_BODY = orjson.dumps({
+    "error": "Endpoint not found",
+    "status": "error",
+    "message": "The requested chatbot endpoint does not exist"
+})
+INTERNAL_ERROR_BODY = orjson.dumps({
+    "error": "Internal server error",
+    "status": "error",
+    "message": "An unexpected error occurred"
+})
+
+# Sentiment lexicon for /analyze
+POSITIVE_WORDS = ('happy', 'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'excited')
+NEGATIVE_WORDS = ('bad', 'terrible', 'awful', 'hate', 'angry', 'frustrated', 'disappointed', 'sad', 'worried')
+
+_SENTIMENT_POLARITY = dict.fromkeys(POSITIVE_WORDS, 'positive')
+_SENTIMENT_POLARITY.update(dict.fromkeys(NEGATIVE_WORDS, 'negative'))
+
+# Zero-width lookahead reports every start position, so overlapping words still match
+_SENTIMENT_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, _SENTIMENT_POLARITY)) + '))'
+)
+
+def count_sentiment_words(message_lower):
+    """Return (positive, negative) counts of distinct lexicon words in the message"""
+    found = set(_SENTIMENT_PATTERN.findall(message_lower))
+    positive_count = sum(1 for word in found if _SENTIMENT_POLARITY[word] == 'positive')
+    return positive_count, len(found) - positive_count
+
 @chatbot_bp.route('/chat', methods=['POST'])
 def chat():
     """
@@ -49,18 +93,15 @@ def chat():
         response = chatbot_service.generate_response(message, session_id)
         
         # Log the interaction
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Chat: {message[:50]}...")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Reply: {response['reply'][:50]}...")
+        logged_at = f"{datetime.now():%Y-%m-%d %H:%M:%S}"
+        print(f"[{logged_at}] Chat: {message[:50]}...")
+        print(f"[{logged_at}] Reply: {response['reply'][:50]}...")
         
         return jsonify(response)
         
     except Exception as e:
         print(f"Chat endpoint error: {e}")
-        return jsonify({
-            "error": "Internal server error",
-            "status": "error",
-            "error_type": "server_error"
-        }), 500
+        return Response(CHAT_SERVER_ERROR_BODY, status=500, mimetype='application/json')
 
 @chatbot_bp.route('/chat/history', methods=['GET'])
 @login_required
@@ -81,7 +122,7 @@ def chat_history():
         return jsonify({
             "status": "success",
             "summary": summary,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         })
         
     except Exception as e:
@@ -108,7 +149,7 @@ def clear_chat():
         return jsonify({
             "message": "Chat history cleared successfully",
             "status": "success",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         })
         
     except Exception as e:
@@ -133,7 +174,7 @@ def chat_status():
                 "motivational_support": True
             },
             "session_active": bool(session.get('chatbot_session_id')),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         })
         
     except Exception as e:
@@ -167,12 +208,7 @@ def analyze_message():
         emotional_state = chatbot_service.detect_emotional_state(message)
         
         # Basic sentiment analysis
-        positive_words = ['happy', 'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'excited']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'angry', 'frustrated', 'disappointed', 'sad', 'worried']
-        
-        message_lower = message.lower()
-        positive_count = sum(1 for word in positive_words if word in message_lower)
-        negative_count = sum(1 for word in negative_words if word in message_lower)
+        positive_count, negative_count = count_sentiment_words(message.lower())
         
         sentiment = 'neutral'
         if positive_count > negative_count:
@@ -186,7 +222,7 @@ def analyze_message():
             "sentiment": sentiment,
             "positive_words": positive_count,
             "negative_words": negative_count,
-            "analysis_timestamp": datetime.now().isoformat()
+            "analysis_timestamp": datetime.now()
         })
         
     except Exception as e:
@@ -199,24 +235,12 @@ def analyze_message():
 # Error handlers for chatbot blueprint
 @chatbot_bp.errorhandler(400)
 def bad_request(error):
-    return jsonify({
-        "error": "Bad request",
-        "status": "error",
-        "message": "The request was invalid or malformed"
-    }), 400
+    return Response(BAD_REQUEST_BODY, status=400, mimetype='application/json')
 
 @chatbot_bp.errorhandler(404)
 def not_found(error):
-    return jsonify({
-        "error": "Endpoint not found",
-        "status": "error",
-        "message": "The requested chatbot endpoint does not exist"
-    }), 404
+    return Response(NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 @chatbot_bp.errorhandler(500)
 def internal_error(error):
-    return jsonify({
-        "error": "Internal server error",
-        "status": "error",
-        "message": "An unexpected error occurred"
-    }), 500
+    return Response(INTERNAL_ERROR_BODY, status=500, mimetype='application/json')
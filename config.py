@@ -6,11 +6,26 @@ Clean, production-ready configuration
 import os
 from datetime import timedelta
 
+DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///eduguard.db'
+# SQLite runs one writer at a time, so a large pool only multiplies the
+# per-connection page caches (see models._set_sqlite_pragmas)
+_SQLITE = DATABASE_URI.startswith('sqlite')
+
 class Config:
     """Base configuration"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'eduguard-secret-key-change-in-production'
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///eduguard.db'
+    SQLALCHEMY_DATABASE_URI = DATABASE_URI
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Reuse warm connections: LIFO keeps the hot few busy and lets overflow idle out,
+    # pre-ping swaps out connections the server dropped instead of failing a request
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 5 if _SQLITE else 20)),
+        'max_overflow': int(os.environ.get('DB_POOL_OVERFLOW', 5 if _SQLITE else 30)),
+        'pool_timeout': 30,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+        'pool_use_lifo': True,
+    }
     
     # Email configuration
     MAIL_SERVER = os.environ.get('MAIL_SERVER', 'smtp.gmail.com')
@@ -29,6 +44,12 @@ class Config:
     # Debug settings
     DEBUG = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
     
+    # Run db.create_all() in create_app (each worker would introspect the schema at boot)
+    AUTO_CREATE_TABLES = os.environ.get('FLASK_INIT_DB', 'True').lower() == 'true'
+    
+    # Optional log file, e.g. logs/eduguard.log (what `manage.py cleanup_logs` prunes)
+    LOG_FILE = os.environ.get('LOG_FILE')
+    
     # Risk thresholds
     RISK_THRESHOLD_LOW = 30
     RISK_THRESHOLD_MEDIUM = 60
@@ -36,6 +57,17 @@ class Config:
     
     # Pagination
     ITEMS_PER_PAGE = 20
+    
+    # Caching (shared Redis cache when CACHE_REDIS_URL is set, per-process otherwise)
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+    CACHE_TYPE = 'RedisCache' if CACHE_REDIS_URL else 'SimpleCache'
+    CACHE_DEFAULT_TIMEOUT = 300
+    AI_DASHBOARD_CACHE_TIMEOUT = 30
+    DASHBOARD_COUNTS_CACHE_TIMEOUT = 30
+    
+    # Werkzeug method string for new password hashes; existing hashes keep the
+    # method and cost they were created with
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256')
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -46,11 +78,17 @@ class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
     SESSION_COOKIE_SECURE = True
+    # Schema is created once with `flask init-db`, not by every worker
+    AUTO_CREATE_TABLES = os.environ.get('FLASK_INIT_DB', 'False').lower() == 'true'
 
 class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}  # in-memory SQLite uses a single-connection pool
+    CACHE_TYPE = 'NullCache'
+    LOG_FILE = None  # tests never open log files
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'  # tests hash and check many passwords
 
 config = {
     'development': DevelopmentConfig,
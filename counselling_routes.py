@@ -7,8 +7,10 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash,
 from flask_login import login_required, current_user
 from models_enhanced import db, CounsellingRequest, Student, User, CounsellingStatus
 from datetime import datetime, timedelta
+from sqlalchemy import func
 from rbac_system import admin_required, student_required, get_student_for_current_user
 import json
+from functools import lru_cache
 
 counselling_bp = Blueprint('counselling', __name__, url_prefix='/counselling')
 
@@ -52,7 +54,7 @@ def create_request():
                 topic=request.form.get('topic'),
                 description=request.form.get('description'),
                 priority=request.form.get('priority', 'medium'),
-                preferred_date=datetime.strptime(request.form.get('preferred_date'), '%Y-%m-%d') if request.form.get('preferred_date') else None,
+                preferred_date=datetime.fromisoformat(request.form.get('preferred_date')) if request.form.get('preferred_date') else None,
                 preferred_time=request.form.get('preferred_time'),
                 duration_minutes=int(request.form.get('duration_minutes', 60))
             )
@@ -114,7 +116,7 @@ def edit_request(request_id):
             counselling_request.topic = request.form.get('topic')
             counselling_request.description = request.form.get('description')
             counselling_request.priority = request.form.get('priority', 'medium')
-            counselling_request.preferred_date = datetime.strptime(request.form.get('preferred_date'), '%Y-%m-%d') if request.form.get('preferred_date') else None
+            counselling_request.preferred_date = datetime.fromisoformat(request.form.get('preferred_date')) if request.form.get('preferred_date') else None
             counselling_request.preferred_time = request.form.get('preferred_time')
             counselling_request.duration_minutes = int(request.form.get('duration_minutes', 60))
             
@@ -242,7 +244,7 @@ def schedule_request(request_id):
             counselling_request.status = CounsellingStatus.SCHEDULED
             counselling_request.assigned_counsellor_id = int(request.form.get('assigned_counsellor'))
             counselling_request.assigned_date = datetime.utcnow()
-            counselling_request.scheduled_date = datetime.strptime(request.form.get('scheduled_date'), '%Y-%m-%d')
+            counselling_request.scheduled_date = datetime.fromisoformat(request.form.get('scheduled_date'))
             counselling_request.scheduled_date = counselling_request.scheduled_date.replace(
                 hour=int(request.form.get('scheduled_time').split(':')[0]),
                 minute=int(request.form.get('scheduled_time').split(':')[1])
@@ -289,7 +291,7 @@ def complete_request(request_id):
             counselling_request.status = CounsellingStatus.COMPLETED
             counselling_request.session_notes = request.form.get('session_notes')
             counselling_request.follow_up_required = 'follow_up_required' in request.form
-            counselling_request.follow_up_date = datetime.strptime(request.form.get('follow_up_date'), '%Y-%m-%d') if request.form.get('follow_up_date') else None
+            counselling_request.follow_up_date = datetime.fromisoformat(request.form.get('follow_up_date')) if request.form.get('follow_up_date') else None
             
             db.session.commit()
             
@@ -344,11 +346,11 @@ def api_request_status(request_id):
         'id': counselling_request.id,
         'status': counselling_request.status.value,
         'topic': counselling_request.topic,
-        'scheduled_date': counselling_request.scheduled_date.isoformat() if counselling_request.scheduled_date else None,
+        'scheduled_date': counselling_request.scheduled_date,
         'assigned_counsellor': counselling_request.assigned_counsellor.username if counselling_request.assigned_counsellor else None,
         'session_notes': counselling_request.session_notes,
         'follow_up_required': counselling_request.follow_up_required,
-        'follow_up_date': counselling_request.follow_up_date.isoformat() if counselling_request.follow_up_date else None
+        'follow_up_date': counselling_request.follow_up_date
     })
 
 @counselling_bp.route('/api/analytics')
@@ -463,53 +465,54 @@ def classify_topic(topic, counselling_type):
     else:
         return counselling_type or 'general'
 
+# Counsellor recommendations by counselling type
+COUNSELLING_TYPE_RECOMMENDATIONS = {
+    'academic': (
+        'Review current academic performance and study habits',
+        'Consider academic support services',
+        'Explore time management strategies'
+    ),
+    'career': (
+        'Assess skills and interests',
+        'Explore career resources and tools',
+        'Consider internship opportunities'
+    ),
+    'personal': (
+        'Provide supportive listening environment',
+        'Discuss coping strategies',
+        'Consider referral to specialized services if needed'
+    ),
+    'financial': (
+        'Review financial aid options',
+        'Discuss budgeting strategies',
+        'Connect with financial aid office'
+    )
+}
+
+# (description keywords, recommendation) added when any keyword appears
+DESCRIPTION_RECOMMENDATIONS = (
+    (('stress', 'anxiety'), 'Discuss stress management techniques'),
+    (('family',), 'Consider family dynamics and support systems'),
+    (('future', 'goal'), 'Focus on goal setting and planning')
+)
+
+@lru_cache(maxsize=64)
+def _recommendations_text(counselling_type, content_matches):
+    recommendations = COUNSELLING_TYPE_RECOMMENDATIONS.get(counselling_type, ()) + tuple(
+        recommendation
+        for (_, recommendation), matched in zip(DESCRIPTION_RECOMMENDATIONS, content_matches)
+        if matched
+    )
+    return '; '.join(recommendations) if recommendations else 'Provide general support and guidance'
+
 def generate_recommendations(description, counselling_type):
     """Generate AI recommendations for counsellors"""
     
-    recommendations = []
-    
     description_lower = description.lower()
     
-    # Academic recommendations
-    if counselling_type == 'academic':
-        recommendations.extend([
-            'Review current academic performance and study habits',
-            'Consider academic support services',
-            'Explore time management strategies'
-        ])
-    
-    # Career recommendations
-    elif counselling_type == 'career':
-        recommendations.extend([
-            'Assess skills and interests',
-            'Explore career resources and tools',
-            'Consider internship opportunities'
-        ])
-    
-    # Personal recommendations
-    elif counselling_type == 'personal':
-        recommendations.extend([
-            'Provide supportive listening environment',
-            'Discuss coping strategies',
-            'Consider referral to specialized services if needed'
-        ])
-    
-    # Financial recommendations
-    elif counselling_type == 'financial':
-        recommendations.extend([
-            'Review financial aid options',
-            'Discuss budgeting strategies',
-            'Connect with financial aid office'
-        ])
-    
-    # Based on content analysis
-    if 'stress' in description_lower or 'anxiety' in description_lower:
-        recommendations.append('Discuss stress management techniques')
-    
-    if 'family' in description_lower:
-        recommendations.append('Consider family dynamics and support systems')
-    
-    if 'future' in description_lower or 'goal' in description_lower:
-        recommendations.append('Focus on goal setting and planning')
-    
-    return '; '.join(recommendations) if recommendations else 'Provide general support and guidance'
+    # Based on content analysis; the text only depends on type and which keyword groups matched
+    content_matches = tuple(
+        any(keyword in description_lower for keyword in keywords)
+        for keywords, _ in DESCRIPTION_RECOMMENDATIONS
+    )
+    return _recommendations_text(counselling_type, content_matches)
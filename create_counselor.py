@@ -71,7 +71,7 @@ def create_counselor_and_show_structure():
             print(f"   GPA: {student.gpa}")
             
             # Check if has user account
-            user = User.query.get(student.user_id) if student.user_id else None
+            user = db.session.get(User, student.user_id) if student.user_id else None
             if user:
                 print(f"   ✅ Has User Account: {user.email}")
             else:
@@ -86,8 +86,8 @@ def create_counselor_and_show_structure():
         
         if counselling_sessions:
             for session in counselling_sessions[:3]:
-                student = Student.query.get(session.student_id)
-                counsellor = User.query.get(session.counsellor_id)
+                student = db.session.get(Student, session.student_id)
+                counsellor = db.session.get(User, session.counsellor_id)
                 print(f"\nSession {session.id}:")
                 print(f"   Student: {student.first_name if student else 'Unknown'}")
                 print(f"   Counselor: {counsellor.email if counsellor else 'Unknown'}")
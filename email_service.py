@@ -8,9 +8,9 @@ def send_async_email(app, msg):
         try:
             from flask_mail import mail
             mail.send(msg)
-            current_app.logger.info(f"Email sent successfully to {msg.recipients}")
+            current_app.logger.info("Email sent successfully to %s", msg.recipients)
         except Exception as e:
-            current_app.logger.error(f"Failed to send email: {str(e)}")
+            current_app.logger.error("Failed to send email: %s", e)
 
 def send_email(subject, recipients, html_body, text_body=None):
     """
@@ -19,11 +19,17 @@ def send_email(subject, recipients, html_body, text_body=None):
     if not current_app.config.get('MAIL_USERNAME'):
         current_app.logger.warning("Email not configured. Skipping email send.")
         return False
+    
+    # Prefer the Celery email queue (retries with backoff); fall back to a thread without a broker
+    from services.email_tasks import queue_email
+    sender = current_app.config['MAIL_DEFAULT_SENDER']
+    if queue_email(subject, sender, recipients, html_body, text_body):
+        return True
         
     from flask_mail import Message
     msg = Message(
         subject,
-        sender=current_app.config['MAIL_DEFAULT_SENDER'],
+        sender=sender,
         recipients=recipients
     )
     
@@ -165,7 +171,7 @@ def send_weekly_digest():
     """
     Send weekly digest of student risk statistics
     """
-    from models import Student, RiskProfile
+    from models import db, Student, RiskProfile
     
     subject = f"Weekly Risk Digest - EduGuard System ({datetime.now().strftime('%Y-%m-%d')})"
     
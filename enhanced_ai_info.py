@@ -18,7 +18,7 @@ class StudentAIInfo:
     def get_student_comprehensive_info(self, student_id):
         """Get comprehensive AI analysis for a specific student"""
         try:
-            student = Student.query.get(student_id)
+            student = db.session.get(Student, student_id)
             if not student:
                 return None
                 
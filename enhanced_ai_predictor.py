@@ -5,10 +5,6 @@ Combines rule-based and machine learning approaches for accurate dropout risk pr
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 import joblib
 import json
 from datetime import datetime, timedelta
@@ -22,9 +18,10 @@ class EnhancedRiskPredictor:
     """Enhanced AI system for student dropout risk prediction"""
     
     def __init__(self):
-        self.rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
-        self.gb_model = GradientBoostingClassifier(n_estimators=100, random_state=42)
-        self.scaler = StandardScaler()
+        # Built by train_models or load_model; untrained predictions are rule-based
+        self.rf_model = None
+        self.gb_model = None
+        self.scaler = None
         self.feature_columns = []
         self.is_trained = False
         
@@ -145,6 +142,14 @@ class EnhancedRiskPredictor:
             logger.warning("Insufficient training data. Using rule-based approach.")
             return False
         
+        # scikit-learn is only imported once there is something to train
+        from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+        from sklearn.model_selection import train_test_split, cross_val_score
+        from sklearn.preprocessing import StandardScaler
+        self.rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
+        self.gb_model = GradientBoostingClassifier(n_estimators=100, random_state=42)
+        self.scaler = StandardScaler()
+        
         # Prepare features and target
         feature_cols = [col for col in training_data.columns if col != 'risk_level']
         self.feature_columns = feature_cols
@@ -168,15 +173,15 @@ class EnhancedRiskPredictor:
         rf_score = self.rf_model.score(X_test, y_test)
         gb_score = self.gb_model.score(X_test, y_test)
         
-        logger.info(f"Random Forest Accuracy: {rf_score:.3f}")
-        logger.info(f"Gradient Boosting Accuracy: {gb_score:.3f}")
+        logger.info("Random Forest Accuracy: %.3f", rf_score)
+        logger.info("Gradient Boosting Accuracy: %.3f", gb_score)
         
         # Cross-validation
         rf_cv = cross_val_score(self.rf_model, X_scaled, y, cv=5).mean()
         gb_cv = cross_val_score(self.gb_model, X_scaled, y, cv=5).mean()
         
-        logger.info(f"Random Forest CV Score: {rf_cv:.3f}")
-        logger.info(f"Gradient Boosting CV Score: {gb_cv:.3f}")
+        logger.info("Random Forest CV Score: %.3f", rf_cv)
+        logger.info("Gradient Boosting CV Score: %.3f", gb_cv)
         
         self.is_trained = True
         return True
@@ -328,7 +333,7 @@ class EnhancedRiskPredictor:
                 'is_trained': self.is_trained
             }
             joblib.dump(model_data, filepath)
-            logger.info(f"Model saved to {filepath}")
+            logger.info("Model saved to %s", filepath)
     
     def load_model(self, filepath):
         """Load trained models and scaler"""
@@ -339,10 +344,10 @@ class EnhancedRiskPredictor:
             self.scaler = model_data['scaler']
             self.feature_columns = model_data['feature_columns']
             self.is_trained = model_data['is_trained']
-            logger.info(f"Model loaded from {filepath}")
+            logger.info("Model loaded from %s", filepath)
             return True
         except FileNotFoundError:
-            logger.warning(f"Model file not found: {filepath}")
+            logger.warning("Model file not found: %s", filepath)
             return False
 
 # Global predictor instance
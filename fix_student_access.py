@@ -37,7 +37,7 @@ def fix_student_access():
         # Check each student has proper user account
         isolated_students = 0
         for student in students:
-            user = User.query.get(student.user_id) if student.user_id else None
+            user = db.session.get(User, student.user_id) if student.user_id else None
             if user and user.role == 'student':
                 isolated_students += 1
                 print(f"✅ {student.first_name} {student.last_name} -> {user.email} (Isolated)")
@@ -52,7 +52,7 @@ def fix_student_access():
         # Create a test to verify student isolation
         test_student = students[0] if students else None
         if test_student:
-            student_user = User.query.get(test_student.user_id)
+            student_user = db.session.get(User, test_student.user_id)
             if student_user:
                 print(f"Test student: {test_student.first_name} ({student_user.email})")
                 print(f"User ID: {student_user.id}")
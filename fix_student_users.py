@@ -28,7 +28,7 @@ def fix_student_mappings():
                     email=student.email,
                     role='student'
                 )
-                user.set_password('student123')
+                user.set_seed_password('student123')
                 db.session.add(user)
                 db.session.flush()
                 
@@ -52,7 +52,7 @@ def fix_student_mappings():
         print("\nTesting student access...")
         test_students = Student.query.limit(3).all()
         for student in test_students:
-            user = User.query.get(student.user_id)
+            user = db.session.get(User, student.user_id)
             if user:
                 print(f"✓ {student.first_name} -> User: {user.email} (Role: {user.role})")
             else:
@@ -2,7 +2,8 @@ from app import create_app
 from models import db
 from models_enhanced import Scholarship, ScholarshipApplication
 
-app = create_app()
+# The schema is created below, in this script's own app context
+app = create_app(auto_create_tables=False)
 
 with app.app_context():
     print("Creating database tables...")
@@ -0,0 +1,27 @@
+"""
+EduGuard JSON Provider
+orjson-backed serialization for jsonify() responses
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        # datetime/date are encoded natively as ISO 8601 strings, numpy arrays and scalars as JSON
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        # orjson has no object_hook; the session's tagged serializer needs one
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -0,0 +1,89 @@
+"""
+Keyword Matcher - Aho-Corasick automaton for chatbot keyword dispatch
+Builds once at import time and scans a message in a single pass
+"""
+
+from collections import deque
+
+
+class KeywordMatcher:
+    """Multi-keyword substring matcher with priority-ordered payloads"""
+
+    def __init__(self, keyword_groups):
+        """
+        Build the automaton from an ordered iterable of (payload, keywords).
+        Groups listed first win when several groups match the same message.
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [None]  # (priority, payload) of best keyword ending here
+        self.min_length = None  # shortest keyword; shorter text can't match anything
+
+        for priority, (payload, keywords) in enumerate(keyword_groups):
+            for keyword in keywords:
+                self._add(keyword.lower(), (priority, payload))
+                if self.min_length is None or len(keyword) < self.min_length:
+                    self.min_length = len(keyword)
+
+        self._build_failure_links()
+
+    def _add(self, keyword, hit):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._goto[state][char] = next_state
+            state = next_state
+
+        current = self._output[state]
+        if current is None or hit[0] < current[0]:
+            self._output[state] = hit
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+
+                # Keywords that are suffixes of this path also end here
+                inherited = self._output[self._fail[next_state]]
+                current = self._output[next_state]
+                if inherited is not None and (current is None or inherited[0] < current[0]):
+                    self._output[next_state] = inherited
+
+    def search(self, text, default=None):
+        """
+        Return the payload of the highest-priority keyword found in text
+        (already lowercased), or default if nothing matches.
+        """
+        if self.min_length is None or len(text) < self.min_length:
+            return default
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            hit = output[state]
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
+                if best[0] == 0:
+                    break
+
+        return best[1] if best is not None else default
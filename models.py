@@ -3,14 +3,65 @@ EduGuard Models
 Clean, consolidated database models
 """
 
+from flask import current_app, has_app_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from datetime import datetime, date
+from functools import lru_cache
 from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import func, or_, event, DDL, literal_column, text, column
+from sqlalchemy.engine import Engine
+import sqlite3
 import hashlib
+import time
+import re
+import weakref
+import numpy as np
+
+# Numba is optional; without it the batch rule-based scoring runs as NumPy array ops
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 db = SQLAlchemy()
 
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Per-connection SQLite tuning: WAL lets dashboard reads run alongside a
+    writer instead of waiting on its lock, and synchronous=NORMAL syncs at
+    WAL checkpoints rather than on every commit. The database can't be
+    corrupted that way, but the last few commits can roll back after a
+    power loss or OS crash.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')  # persistent; in-memory databases stay 'memory'
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    # Per connection: 16 MB x the 10-connection SQLite pool caps it at 160 MB per process
+    cursor.execute('PRAGMA cache_size=-16000')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    # Read pages straight from the OS page cache instead of copying them through read()
+    cursor.execute('PRAGMA mmap_size=268435456')  # 256 MB
+    cursor.close()
+
+DEFAULT_PASSWORD_HASH_METHOD = 'pbkdf2:sha256'
+
+def _password_hash_method():
+    """PASSWORD_HASH_METHOD from the app config, or Werkzeug's default outside an app"""
+    if has_app_context():
+        return current_app.config.get('PASSWORD_HASH_METHOD', DEFAULT_PASSWORD_HASH_METHOD)
+    return DEFAULT_PASSWORD_HASH_METHOD
+
+@lru_cache(maxsize=None)
+def _seed_password_hash(password, method):
+    # Seeders give many accounts the same well-known default password;
+    # hash each distinct one once per process instead of once per account
+    return generate_password_hash(password, method=method)
+
 class User(UserMixin, db.Model):
     """User model for authentication"""
     __tablename__ = 'users'
@@ -26,7 +77,11 @@ class User(UserMixin, db.Model):
     student_profile = db.relationship('Student', backref='user', uselist=False, lazy=True)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=_password_hash_method())
+
+    def set_seed_password(self, password):
+        """set_password for seed/demo accounts; reuses one hash per distinct password"""
+        self.password_hash = _seed_password_hash(password, _password_hash_method())
 
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
@@ -39,11 +94,12 @@ class Student(db.Model):
     __tablename__ = 'students'
     
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'))
+    # Resolves the logged-in student's profile on every student-role request
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), index=True)
     student_id = db.Column(db.String(20), unique=True, nullable=False)
     first_name = db.Column(db.String(50), nullable=False)
     last_name = db.Column(db.String(50), nullable=False)
-    email = db.Column(db.String(120), nullable=False)
+    email = db.Column(db.String(120), nullable=False, index=True)  # duplicate checks on add/register
     department = db.Column(db.String(50))
     year = db.Column(db.Integer)
     semester = db.Column(db.Integer)
@@ -66,6 +122,112 @@ class Student(db.Model):
     def __repr__(self):
         return f'<Student {self.student_id}>'
 
+# Text the student searches match against. On PostgreSQL a pg_trgm GIN index over
+# the same expression serves LIKE/ILIKE '%term%' instead of a sequential scan.
+_SEARCH_SEPARATOR = literal_column("' '")
+STUDENT_SEARCH_TEXT = (Student.first_name + _SEARCH_SEPARATOR + Student.last_name + _SEARCH_SEPARATOR
+                       + Student.student_id + _SEARCH_SEPARATOR + Student.email)
+
+event.listen(Student.__table__, 'after_create',
+             DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'))
+event.listen(Student.__table__, 'after_create', DDL(
+    "CREATE INDEX IF NOT EXISTS ix_student_search_trgm ON students USING gin "
+    "((first_name || ' ' || last_name || ' ' || student_id || ' ' || email) gin_trgm_ops)"
+).execute_if(dialect='postgresql'))
+
+# SQLite equivalent: an FTS5 trigram table holding the same text per student (rowid = students.id),
+# kept in sync by triggers. Trigram phrase MATCH is a case-insensitive substring match, like ILIKE.
+def _student_fts_text(row):
+    return f"{row}.first_name || ' ' || {row}.last_name || ' ' || {row}.student_id || ' ' || {row}.email"
+
+STUDENT_FTS_STATEMENTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5(search_text, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS students_fts_insert AFTER INSERT ON students BEGIN "
+    f"INSERT INTO students_fts(rowid, search_text) VALUES (new.id, {_student_fts_text('new')}); END",
+    "CREATE TRIGGER IF NOT EXISTS students_fts_update AFTER UPDATE ON students BEGIN "
+    f"UPDATE students_fts SET search_text = {_student_fts_text('new')} WHERE rowid = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS students_fts_delete AFTER DELETE ON students BEGIN "
+    "DELETE FROM students_fts WHERE rowid = old.id; END",
+)
+
+def create_student_fts(target=None, connection=None, **kw):
+    """Create the SQLite search table and triggers, rebuilding its rows if they're out of sync"""
+    # The trigram tokenizer arrived in SQLite 3.34
+    if connection.dialect.name != 'sqlite' or sqlite3.sqlite_version_info < (3, 34):
+        return
+    for statement in STUDENT_FTS_STATEMENTS:
+        connection.exec_driver_sql(statement)
+    # New table, or rows left over from a students table dropped before drop_student_fts existed
+    in_sync = connection.exec_driver_sql(
+        "SELECT (SELECT count(*) FROM students_fts) = (SELECT count(*) FROM students) "
+        "AND NOT EXISTS (SELECT 1 FROM students_fts f LEFT JOIN students s ON s.id = f.rowid WHERE s.id IS NULL)"
+    ).scalar()
+    if not in_sync:
+        connection.exec_driver_sql("DELETE FROM students_fts")
+        connection.exec_driver_sql(
+            f"INSERT INTO students_fts(rowid, search_text) SELECT id, {_student_fts_text('students')} FROM students")
+
+event.listen(Student.__table__, 'after_create', create_student_fts)
+
+# Engine -> whether its database has students_fts, checked once per engine
+_STUDENT_FTS_READY = weakref.WeakKeyDictionary()
+
+@event.listens_for(Student.__table__, 'before_drop')
+def drop_student_fts(target, connection, **kw):
+    """Drop students_fts along with students; it isn't in the metadata, so drop_all would leave it"""
+    if connection.dialect.name != 'sqlite':
+        return
+    # The triggers go with the students table; the virtual table and its rows don't
+    connection.exec_driver_sql("DROP TABLE IF EXISTS students_fts")
+    _STUDENT_FTS_READY.pop(connection.engine, None)
+
+def _student_fts_ready():
+    engine = db.engine
+    ready = _STUDENT_FTS_READY.get(engine)
+    if ready is None:
+        ready = engine.dialect.name == 'sqlite' and db.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'students_fts'")).first() is not None
+        _STUDENT_FTS_READY[engine] = ready
+    return ready
+
+# Trigrams need three characters, so shorter terms can't use the trigram indexes;
+# they still match names with ILIKE, plus a student_id prefix the unique B-tree index can serve
+STUDENT_SEARCH_MIN_TRIGRAM = 3
+
+# Terms shaped like a roll number (ST1001, CO2021001) are tried as an exact student_id first
+STUDENT_ID_SHAPE = re.compile(r'[A-Za-z]{2,}\d+')
+
+def student_search_filter(term):
+    """
+    WHERE clause for the student search box. The term goes in as one bound
+    parameter with %, _ and the escape character escaped, so user input
+    never acts as a wildcard. A term that is exactly some student's ID
+    narrows to that student with an equality match on the unique index.
+    """
+    if STUDENT_ID_SHAPE.fullmatch(term):
+        student_id = term.upper()
+        if db.session.query(Student.id).filter(Student.student_id == student_id).first() is not None:
+            return Student.student_id == student_id
+    
+    # '/' rather than backslash as the escape, which reads the same under every string-literal mode
+    escaped = term.replace('/', '//').replace('%', '/%').replace('_', '/_')
+    if len(term) < STUDENT_SEARCH_MIN_TRIGRAM:
+        return or_(
+            Student.student_id.like(f'{escaped}%', escape='/'),
+            STUDENT_SEARCH_TEXT.ilike(f'%{escaped}%', escape='/')
+        )
+    if _student_fts_ready():
+        # Quoted as one FTS5 phrase, so the term's characters are all literal
+        phrase = '"' + term.replace('"', '""') + '"'
+        return Student.id.in_(
+            text('SELECT rowid FROM students_fts WHERE search_text MATCH :phrase')
+            .bindparams(phrase=phrase).columns(column('rowid'))
+        )
+    # A whole pattern in one bind (not '%' || :term || '%') lets the planner match the trigram index
+    return STUDENT_SEARCH_TEXT.ilike(f'%{escaped}%', escape='/')
+
+ATTENDANCE_STATUSES = ('Present', 'Absent', 'Late', 'Excused')
+
 class Attendance(db.Model):
     """Attendance model"""
     __tablename__ = 'attendance'
@@ -76,15 +238,137 @@ class Attendance(db.Model):
     status = db.Column(db.String(20), nullable=False)  # Present, Absent, Late, Excused
     course = db.Column(db.String(50))
     
+    # Covers date-window attendance aggregates without touching the table
+    __table_args__ = (
+        db.Index('ix_attendance_date_status', 'date', 'status'),
+        # Serves one student's most recent records without a sort
+        db.Index('ix_attendance_student_date', 'student_id', 'date'),
+    )
+    
+    @classmethod
+    def rate_since(cls, since, default=0.0, student_id=None):
+        """Percentage of attendance marked Present on or after `since`, computed in SQL"""
+        query = db.session.query(
+            func.count(cls.id),
+            func.sum(db.case((cls.status == 'Present', 1), else_=0))
+        ).filter(cls.date >= since)
+        if student_id is not None:
+            query = query.filter(cls.student_id == student_id)
+        total, present = query.one()
+        
+        if not total:
+            return default
+        return (present / total) * 100
+    
+    @classmethod
+    def cached_rate_since(cls, since, default=0.0):
+        """
+        rate_since over all students, memoized until the next attendance write
+        in this process; writes from other workers show up within ATTENDANCE_RATE_TTL
+        """
+        ttl_bucket = int(time.monotonic() // ATTENDANCE_RATE_TTL)
+        return _memoized_attendance_rate(db.engine, _attendance_version, ttl_bucket, since, default)
+    
     def __repr__(self):
         return f'<Attendance {self.student_id} - {self.date}>'
 
+# Incremented on every attendance write so memoized rates are never reused after one
+_attendance_version = 0
+ATTENDANCE_RATE_TTL = 60  # seconds
+
+@lru_cache(maxsize=16)
+def _memoized_attendance_rate(engine, version, ttl_bucket, since, default):
+    return Attendance.rate_since(since, default=default)
+
+@event.listens_for(Attendance, 'after_insert')
+@event.listens_for(Attendance, 'after_update')
+@event.listens_for(Attendance, 'after_delete')
+def bump_attendance_version(*args):
+    """Invalidate memoized attendance rates; bulk writes that skip mapper events call this directly"""
+    global _attendance_version
+    _attendance_version += 1
+
+# Rule-based risk reasons; bit i of a factor mask maps to RISK_REASONS[i],
+# bit 6 (social isolation) feeds the level but has no reason text
+RISK_REASONS = ('Low attendance (<75%)', 'Poor marks (<40)', 'Financial condition: Low',
+                'Family pressure: High', 'Health issue present', 'High mental stress')
+PERSONAL_FACTOR_MASK = 0b1111100  # financial, family, health, mental stress, social isolation
+# Rule-based levels, indexed by the level codes rule_based_risk_batch returns
+RISK_LEVELS = ('Low', 'Medium', 'High', 'Critical')
+
+def _risk_reasons_text(factors):
+    reasons = [reason for bit, reason in enumerate(RISK_REASONS) if factors >> bit & 1]
+    return ', '.join(reasons) if reasons else 'No significant risk factors detected'
+
+def _rule_based_risk_numpy(attendance, academic, wellbeing, financial, family, health, social):
+    """Return (risk_scores, level_codes, factor_masks) for column arrays"""
+    personal_risk = np.minimum(40, 15 * financial + 15 * family + 15 * health + 10 * social
+                               + np.maximum(0, 10 - wellbeing) * 2)
+    risk_scores = np.maximum(0, 100 - academic) * 0.3 + np.maximum(0, 100 - attendance) * 0.3 + personal_risk
+    
+    attendance_flags = attendance < 75
+    academic_flags = academic < 40
+    stress_flags = wellbeing <= 4
+    factor_masks = (attendance_flags | academic_flags.astype(np.int32) << 1 | financial.astype(np.int32) << 2
+                    | family.astype(np.int32) << 3 | health.astype(np.int32) << 4
+                    | stress_flags.astype(np.int32) << 5 | social.astype(np.int32) << 6).astype(np.int32)
+    
+    personal_flags = (financial.astype(np.int32) + family + health + stress_flags + social)
+    academic_flags = academic_flags.astype(np.int32)
+    attendance_flags = attendance_flags.astype(np.int32)
+    level_codes = np.select(
+        [(attendance < 60) | (academic < 30),
+         (academic_flags + attendance_flags >= 2) | (academic_flags + personal_flags >= 2),
+         academic_flags + attendance_flags + personal_flags >= 1],
+        [np.where(personal_flags >= 2, 3, 2), 2, 1],
+        0
+    ).astype(np.int8)
+    return risk_scores, level_codes, factor_masks
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _rule_based_risk_jit(attendance, academic, wellbeing, financial, family, health, social):
+        n = attendance.shape[0]
+        risk_scores = np.empty(n, np.float64)
+        level_codes = np.empty(n, np.int8)
+        factor_masks = np.empty(n, np.int32)
+        for i in range(n):
+            personal_risk = 0
+            if financial[i]: personal_risk += 15
+            if family[i]: personal_risk += 15
+            if health[i]: personal_risk += 15
+            if social[i]: personal_risk += 10
+            risk_scores[i] = (max(0.0, 100 - academic[i]) * 0.3 + max(0.0, 100 - attendance[i]) * 0.3
+                              + min(40.0, personal_risk + max(0.0, 10 - wellbeing[i]) * 2))
+            
+            attendance_flag = 1 if attendance[i] < 75 else 0
+            academic_flag = 1 if academic[i] < 40 else 0
+            stress_flag = 1 if wellbeing[i] <= 4 else 0
+            personal_flags = financial[i] + family[i] + health[i] + stress_flag + social[i]
+            factor_masks[i] = (attendance_flag | academic_flag << 1 | financial[i] << 2 | family[i] << 3
+                               | health[i] << 4 | stress_flag << 5 | social[i] << 6)
+            
+            if attendance[i] < 60 or academic[i] < 30:
+                level_codes[i] = 3 if personal_flags >= 2 else 2
+            elif academic_flag + attendance_flag >= 2 or academic_flag + personal_flags >= 2:
+                level_codes[i] = 2
+            elif academic_flag + attendance_flag + personal_flags >= 1:
+                level_codes[i] = 1
+            else:
+                level_codes[i] = 0
+        return risk_scores, level_codes, factor_masks
+    
+    rule_based_risk_batch = _rule_based_risk_jit
+else:
+    rule_based_risk_batch = _rule_based_risk_numpy
+
 class RiskProfile(db.Model):
     """Risk profile model"""
     __tablename__ = 'risk_profiles'
     
     id = db.Column(db.Integer, primary_key=True)
-    student_id = db.Column(db.Integer, db.ForeignKey('students.id'), nullable=False)
+    # Student -> profile joins and lookups; the (risk_level, student_id) index can't serve these
+    student_id = db.Column(db.Integer, db.ForeignKey('students.id'), nullable=False, index=True)
     risk_score = db.Column(db.Float, default=0.0)
     risk_level = db.Column(db.String(20), default='Low')  # Low, Medium, High, Critical
     attendance_rate = db.Column(db.Float, default=0.0)
@@ -105,6 +389,11 @@ class RiskProfile(db.Model):
     ml_confidence = db.Column(db.Float)
     ml_features = db.Column(db.Text)
     
+    # Risk-level filters join back to students on student_id
+    __table_args__ = (
+        db.Index('ix_risk_profile_level_student', 'risk_level', 'student_id'),
+    )
+    
     def update_risk_score(self, use_ml=True):
         """
         Enhanced risk calculation with ML integration
@@ -148,48 +437,91 @@ class RiskProfile(db.Model):
         
         self.last_updated = datetime.utcnow()
     
+    @classmethod
+    def update_risk_scores(cls, profiles, use_ml=True):
+        """
+        update_risk_score for many profiles. When the ML predictor isn't in use
+        the rule-based calculation runs once over all of them as arrays.
+        """
+        try:
+            from enhanced_ai_predictor import risk_predictor
+            ml_ready = use_ml and risk_predictor.is_trained
+        except Exception:
+            ml_ready = False
+        
+        if ml_ready:
+            for profile in profiles:
+                profile.update_risk_score(use_ml=True)
+        else:
+            cls._rule_based_batch(profiles)
+    
+    @staticmethod
+    def _rule_based_batch(profiles):
+        """_rule_based_calculation vectorized over a list of profiles"""
+        if not profiles:
+            return
+        
+        numeric = np.array([
+            (p.attendance_rate or 0, p.academic_performance or 0, p.mental_wellbeing_score or 10)
+            for p in profiles
+        ], dtype=np.float64)
+        flags = np.array([
+            (bool(p.financial_issues), bool(p.family_problems), bool(p.health_issues), bool(p.social_isolation))
+            for p in profiles
+        ], dtype=np.int32)
+        
+        risk_scores, level_codes, factor_masks = rule_based_risk_batch(
+            numeric[:, 0].copy(), numeric[:, 1].copy(), numeric[:, 2].copy(),
+            flags[:, 0].copy(), flags[:, 1].copy(), flags[:, 2].copy(), flags[:, 3].copy()
+        )
+        
+        now = datetime.utcnow()
+        for profile, risk_score, level_code, factors in zip(
+            profiles, risk_scores.tolist(), level_codes.tolist(), factor_masks.tolist()
+        ):
+            profile.risk_score = risk_score
+            profile.risk_level = RISK_LEVELS[level_code]
+            profile.risk_reasons = _risk_reasons_text(factors)
+            profile.last_updated = now
+    
     def _rule_based_calculation(self):
         """Traditional rule-based risk calculation"""
+        attendance_rate = self.attendance_rate or 0
+        academic_performance = self.academic_performance or 0
+        mental_wellbeing_score = self.mental_wellbeing_score or 10
+        
         # Weighted score components (inverse risks)
-        academic_risk = max(0, 100 - (self.academic_performance or 0)) * 0.3
-        attendance_risk = max(0, 100 - (self.attendance_rate or 0)) * 0.3
+        academic_risk = max(0, 100 - academic_performance) * 0.3
+        attendance_risk = max(0, 100 - attendance_rate) * 0.3
         personal_risk = 0
         if self.financial_issues: personal_risk += 15
         if self.family_problems: personal_risk += 15
         if self.health_issues: personal_risk += 15
         if self.social_isolation: personal_risk += 10
-        personal_risk += max(0, (10 - (self.mental_wellbeing_score or 10))) * 2
+        personal_risk += max(0, (10 - mental_wellbeing_score)) * 2
         personal_risk = min(40, personal_risk)
         self.risk_score = academic_risk + attendance_risk + personal_risk
         
+        # Contributing factors as a bitmask
+        factors = (
+            (attendance_rate < 75)
+            | (academic_performance < 40) << 1
+            | bool(self.financial_issues) << 2
+            | bool(self.family_problems) << 3
+            | bool(self.health_issues) << 4
+            | (mental_wellbeing_score <= 4) << 5
+            | bool(self.social_isolation) << 6
+        )
+        
         # Rule-based reasons
-        reasons = []
-        if (self.attendance_rate or 0) < 75:
-            reasons.append('Low attendance (<75%)')
-        if (self.academic_performance or 0) < 40:
-            reasons.append('Poor marks (<40)')
-        if self.financial_issues:
-            reasons.append('Financial condition: Low')
-        if self.family_problems:
-            reasons.append('Family pressure: High')
-        if self.health_issues:
-            reasons.append('Health issue present')
-        if (self.mental_wellbeing_score or 10) <= 4:
-            reasons.append('High mental stress')
-        self.risk_reasons = ', '.join(reasons) if reasons else 'No significant risk factors detected'
+        self.risk_reasons = _risk_reasons_text(factors)
         
         # Rule-based level
-        personal_flags = sum([
-            1 if self.financial_issues else 0,
-            1 if self.family_problems else 0,
-            1 if self.health_issues else 0,
-            1 if self.social_isolation else 0,
-            1 if (self.mental_wellbeing_score or 10) <= 4 else 0
-        ])
-        academic_flags = int((self.academic_performance or 0) < 40)
-        attendance_flags = int((self.attendance_rate or 0) < 75)
+        personal_flags = bin(factors & PERSONAL_FACTOR_MASK).count('1')
+        academic_flags = factors >> 1 & 1
+        attendance_flags = factors & 1
         
-        if ((self.attendance_rate or 0) < 60) or ((self.academic_performance or 0) < 30):
+        if (attendance_rate < 60) or (academic_performance < 30):
             if personal_flags >= 2:
                 self.risk_level = 'Critical'
             else:
@@ -209,8 +541,8 @@ class Counselling(db.Model):
     __tablename__ = 'counselling'
     
     id = db.Column(db.Integer, primary_key=True)
-    student_id = db.Column(db.Integer, db.ForeignKey('students.id'), nullable=False)
-    counsellor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    student_id = db.Column(db.Integer, db.ForeignKey('students.id'), nullable=False, index=True)
+    counsellor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     session_date = db.Column(db.DateTime, nullable=False)
     session_type = db.Column(db.String(50))  # Individual, Group, Crisis
     status = db.Column(db.String(20), default='Scheduled')  # Scheduled, Completed, Cancelled
@@ -219,6 +551,11 @@ class Counselling(db.Model):
     
     # Relationships
     counsellor = db.relationship('User', backref='counselling_sessions')
+    
+    # Upcoming sessions filter by status and order by session date
+    __table_args__ = (
+        db.Index('ix_counselling_status_session', 'status', 'session_date'),
+    )
 
     def __repr__(self):
         return f'<Counselling {self.id} - {self.session_date}>'
@@ -228,8 +565,8 @@ class MentorAssignment(db.Model):
     __tablename__ = 'mentor_assignments'
     
     id = db.Column(db.Integer, primary_key=True)
-    student_id = db.Column(db.Integer, db.ForeignKey('students.id'), nullable=False)
-    mentor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    student_id = db.Column(db.Integer, db.ForeignKey('students.id'), nullable=False, index=True)
+    mentor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     assignment_date = db.Column(db.DateTime, default=datetime.utcnow)
     status = db.Column(db.String(20), default='Active')  # Active, Inactive, Completed
     notes = db.Column(db.Text)
@@ -257,6 +594,12 @@ class Alert(db.Model):
     
     # Relationships
     resolver = db.relationship('User', foreign_keys=[resolved_by], backref='resolved_alerts')
+    
+    # Alert feeds filter by status or student and list newest first
+    __table_args__ = (
+        db.Index('ix_alert_status_created', 'status', 'created_at'),
+        db.Index('ix_alert_student_created', 'student_id', 'created_at'),
+    )
 
     def __repr__(self):
         return f'<Alert {self.id} - {self.alert_type}>'
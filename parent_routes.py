@@ -194,7 +194,7 @@ def send_message():
         return jsonify({
             'success': True,
             'message': 'Message sent successfully',
-            'timestamp': message.sent_at.isoformat()
+            'timestamp': message.sent_at
         })
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,73 @@
+"""
+Rate Limiting - in-process token buckets
+Per-client request budgets checked in memory, with no storage round trip per request
+"""
+
+import os
+import orjson
+import threading
+import time
+from functools import wraps
+from flask import request, session, Response
+
+# 429 body is the same for every rejection, so serialize it once
+TOO_MANY_REQUESTS_BODY = orjson.dumps({'error': 'Too many requests, please slow down'})
+
+# Limits are per worker process; divide by the worker count so the total stays put
+WORKER_COUNT = max(int(os.environ.get('WEB_CONCURRENCY', 1)), 1)
+
+
+class TokenBucket:
+    """Token bucket per client key: refills at `rate` tokens/second up to `capacity`"""
+
+    def __init__(self, rate, capacity, max_keys=10000):
+        self.rate = rate / WORKER_COUNT
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._buckets = {}  # key -> (tokens, last refill time)
+        self._lock = threading.Lock()
+
+    def allow(self, key, tokens_required=1):
+        """Take tokens_required tokens from key's bucket; False if it doesn't have them"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, last_refill = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last_refill) * self.rate)
+
+            allowed = tokens >= tokens_required
+            if allowed:
+                tokens -= tokens_required
+
+            if key not in self._buckets and len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            self._buckets[key] = (tokens, now)
+        return allowed
+
+    def _prune(self, now):
+        # A bucket that has refilled to capacity behaves exactly like a new one
+        full = [key for key, (tokens, last_refill) in self._buckets.items()
+                if tokens + (now - last_refill) * self.rate >= self.capacity]
+        for key in full:
+            del self._buckets[key]
+
+
+def _client_key():
+    """Logged-in user id from the session, else the remote address"""
+    user_id = session.get('_user_id')
+    return f'user:{user_id}' if user_id is not None else f'ip:{request.remote_addr}'
+
+
+def rate_limited(bucket):
+    """Reject requests with 429 once the client's bucket is empty"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not bucket.allow(_client_key()):
+                return Response(TOO_MANY_REQUESTS_BODY, status=429, mimetype='application/json')
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
+# Chat endpoints: bursts of 10 messages, 30 a minute sustained
+chat_bucket = TokenBucket(rate=0.5, capacity=10)
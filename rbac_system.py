@@ -4,8 +4,9 @@ Complete Role-Based Access Control (RBAC) System for EduGuard
 Production-ready Flask implementation with security best practices
 """
 
-from functools import wraps
-from flask import session, redirect, url_for, flash, request, jsonify
+import time
+from functools import wraps, lru_cache
+from flask import session, redirect, url_for, flash, request, jsonify, current_app
 from flask_login import current_user, login_required as flask_login_required
 
 # ================================
@@ -85,6 +86,13 @@ def student_data_access(f):
 # SESSION MANAGEMENT HELPERS
 # ================================
 
+@lru_cache(maxsize=None)
+def _model_has_attribute(model_class, name):
+    """
+    Resolve attribute presence once per model class (the schema is fixed)
+    """
+    return hasattr(model_class, name)
+
 def set_user_session(user):
     """
     Set user session data after successful login
@@ -92,7 +100,7 @@ def set_user_session(user):
     session['user_id'] = user.id
     session['user_email'] = user.email
     session['user_role'] = user.role
-    session['user_name'] = f"{user.first_name if hasattr(user, 'first_name') else user.email}"
+    session['user_name'] = f"{user.first_name if _model_has_attribute(type(user), 'first_name') else user.email}"
     session.permanent = True  # Make session persistent
 
 def clear_user_session():
@@ -104,6 +112,40 @@ def clear_user_session():
         if key in session:
             session.pop(key, None)
 
+# How long a role read from the user row is trusted from the session cookie
+ROLE_RECHECK_SECONDS = 60
+
+def session_role():
+    """
+    Role of the logged-in user without a user lookup on most requests.
+    The role is kept in the signed session next to Flask-Login's user id and
+    re-read from the user row at most once a minute, so role changes and
+    deleted accounts still take effect. Returns None when not logged in.
+    """
+    user_id = session.get('_user_id')
+    cached = session.get('_role')
+    now = time.time()
+    if user_id is not None and cached and cached[0] == user_id and now - cached[2] < ROLE_RECHECK_SECONDS:
+        return cached[1]
+    
+    if not current_user.is_authenticated:
+        session.pop('_role', None)
+        return None
+    session['_role'] = [session.get('_user_id'), current_user.role, now]
+    return current_user.role
+
+def session_login_required(f):
+    """
+    login_required for hot endpoints that never touch current_user: checks
+    the session role instead of loading the user row on every request
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if session_role() is None:
+            return current_app.login_manager.unauthorized()
+        return f(*args, **kwargs)
+    return decorated_function
+
 def get_current_user_role():
     """
     Get current user role from session or user object
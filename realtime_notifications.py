@@ -4,6 +4,7 @@ Provides WebSocket-based real-time alerts and updates
 """
 
 from flask_socketio import SocketIO, emit, join_room, leave_room
+from flask import request
 from flask_login import current_user
 import json
 from datetime import datetime
@@ -28,13 +29,13 @@ class NotificationManager:
             'last_seen': datetime.utcnow(),
             'role': getattr(current_user, 'role', 'unknown') if current_user else 'unknown'
         }
-        logger.info(f"User {user_id} registered for notifications")
+        logger.info("User %s registered for notifications", user_id)
     
     def unregister_user(self, user_id):
         """Unregister a user from notifications"""
         if user_id in self.active_users:
             del self.active_users[user_id]
-            logger.info(f"User {user_id} unregistered from notifications")
+            logger.info("User %s unregistered from notifications", user_id)
     
     def send_alert(self, alert_data, target_role=None, target_user=None):
         """Send real-time alert to users"""
@@ -58,7 +59,7 @@ class NotificationManager:
             socketio.emit('notification', notification, broadcast=True)
         
         self.notification_queue.append(notification)
-        logger.info(f"Alert sent: {alert_data.get('title', 'Unknown')}")
+        logger.info("Alert sent: %s", alert_data.get('title', 'Unknown'))
     
     def send_dashboard_update(self, update_data):
         """Send dashboard update to all active users"""
@@ -150,7 +151,7 @@ def handle_connect():
             'role': getattr(current_user, 'role', 'unknown')
         })
         
-        logger.info(f"Client connected: {user_id}")
+        logger.info("Client connected: %s", user_id)
     else:
         emit('error', {'message': 'Authentication required'})
         return False
@@ -169,7 +170,7 @@ def handle_disconnect():
         # Unregister user
         notification_manager.unregister_user(user_id)
         
-        logger.info(f"Client disconnected: {user_id}")
+        logger.info("Client disconnected: %s", user_id)
 
 @socketio.on('join_dashboard')
 def handle_join_dashboard():
@@ -190,7 +191,7 @@ def handle_request_alerts():
     """Handle request for recent alerts"""
     if current_user.is_authenticated:
         try:
-            from models import Alert, db
+            from models import Alert, Student, db
             
             # Get recent alerts based on user role
             if current_user.role in ['admin', 'faculty']:
@@ -216,7 +217,7 @@ def handle_request_alerts():
             emit('alerts_response', {'alerts': alerts_data})
             
         except Exception as e:
-            logger.error(f"Error fetching alerts: {e}")
+            logger.error("Error fetching alerts: %s", e)
             emit('error', {'message': 'Failed to fetch alerts'})
 
 def init_realtime_notifications(app):
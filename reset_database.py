@@ -4,7 +4,8 @@ from models import db
 from sqlalchemy import text
 
 def reset_db():
-    app = create_app()
+    # The schema is created below, in this script's own app context
+    app = create_app(auto_create_tables=False)
     with app.app_context():
         print("Attempting to reset database tables...")
         try:
@@ -0,0 +1,37 @@
+"""
+EduGuard Response Cache
+Short-lived caching of JSON API bodies in the shared app cache
+"""
+
+from functools import wraps
+from flask import Response, current_app
+from app import cache
+
+
+def cached_json_response(key, timeout):
+    """
+    Serve a JSON view's body from the app cache for `timeout` seconds.
+    `key` is a string or a zero-argument callable evaluated per request.
+    Only 200 responses are stored, so errors are never replayed.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            cache_key = key() if callable(key) else key
+
+            body = cache.get(cache_key)
+            if body is not None:
+                return Response(body, mimetype='application/json')
+
+            response = current_app.make_response(f(*args, **kwargs))
+            if response.status_code == 200:
+                cache.set(cache_key, response.get_data(), timeout=timeout)
+            return response
+        return decorated_function
+    return decorator
+
+
+def invalidate_cached_responses(*keys):
+    """Drop cached bodies so the next request recomputes them"""
+    for key in keys:
+        cache.delete(key)
@@ -3,23 +3,54 @@ EduGuard Routes
 Clean, consolidated routing
 """
 
-from app import create_app
-from models import User, Student, Attendance, db, RiskProfile, Counselling, MentorAssignment, Alert
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session
+from app import create_app, cache
+from models import User, Student, Attendance, db, RiskProfile, Counselling, MentorAssignment, Alert, student_search_filter, ATTENDANCE_STATUSES
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session, current_app, Response, stream_with_context
 from flask_login import login_user, logout_user, login_required, current_user
+from functools import wraps
+from dataclasses import dataclass
+from operator import attrgetter
 from datetime import datetime, date, timedelta
-from rbac_system import role_required, get_student_for_current_user, secure_redirect, admin_required
-from sqlalchemy import text, func
+from rbac_system import role_required, get_student_for_current_user, secure_redirect, admin_required, session_login_required
+from sqlalchemy import text, func, tuple_, select
+from sqlalchemy.orm import joinedload, selectinload, contains_eager
 import random
-from services.ml_service import ml_service
+import orjson
+from services.ml_service import ml_service, ml_batcher
+from services.risk_tasks import schedule_risk_refresh
+from keyword_matcher import KeywordMatcher
+from rate_limit import rate_limited, chat_bucket
+from response_cache import cached_json_response, invalidate_cached_responses
+from update_routes import ATTENDANCE_STATS_CACHE_KEY
 
 # Create blueprint
 main_bp = Blueprint('main', __name__)
 
+# Simple AI responses for /ai/chat_response, in priority order (first match wins)
+CHAT_RESPONSES = (
+    ('hello', 'Hello! How can I help you with your studies today?'),
+    ('help', 'I can help you with study strategies, time management, career guidance, and motivation. What specific area would you like assistance with?'),
+    ('study', 'Here are some effective study strategies:\n1. Use the Pomodoro Technique (25 min study, 5 min break)\n2. Create a study schedule and stick to it\n3. Use active recall instead of passive reading\n4. Practice with past papers\n5. Study in a distraction-free environment'),
+    ('stress', 'Stress management tips:\n1. Practice deep breathing exercises\n2. Take regular breaks\n3. Exercise regularly\n4. Get enough sleep\n5. Talk to friends, family, or counselors\n6. Break large tasks into smaller ones'),
+    ('career', 'Career planning advice:\n1. Identify your interests and strengths\n2. Research different career options\n3. Talk to professionals in fields you\'re interested in\n4. Gain relevant skills through courses and internships\n5. Build a professional network'),
+    ('motivation', 'Stay motivated by:\n1. Setting clear, achievable goals\n2. Celebrating small wins\n3. Finding study partners\n4. Reminding yourself why you started\n5. Taking care of your physical and mental health'),
+    ('time', 'Time management tips:\n1. Use a planner or calendar\n2. Prioritize important tasks\n3. Break large tasks into smaller chunks\n4. Avoid procrastination\n5. Set specific study times'),
+)
+
+CHAT_DEFAULT_RESPONSE = "I'm here to help! You can ask me about study strategies, stress management, career guidance, motivation, or time management."
+
+# Static /ai/chat_response bodies, serialized once at import
+CHAT_EMPTY_MESSAGE_BODY = orjson.dumps({'error': 'No message provided'})
+CHAT_ERROR_BODY = orjson.dumps({
+    'response': "I'm having trouble responding right now. Please try again in a moment.",
+    'error': True
+})
+
+_chat_response_matcher = KeywordMatcher((reply, [keyword]) for keyword, reply in CHAT_RESPONSES)
+
 # Helper functions
 def admin_required(f):
     """Decorator for admin-only access"""
-    from functools import wraps
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if not current_user.is_authenticated or current_user.role != 'admin':
@@ -30,7 +61,6 @@ def admin_required(f):
 
 def faculty_required(f):
     """Decorator for faculty/admin access"""
-    from functools import wraps
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if not current_user.is_authenticated or current_user.role not in ['admin', 'faculty']:
@@ -39,6 +69,21 @@ def faculty_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def get_risk_level_counts():
+    """Students per risk level, from one GROUP BY over their risk profiles"""
+    counts = dict(
+        db.session.query(RiskProfile.risk_level, func.count(Student.id))
+        .join(Student, Student.id == RiskProfile.student_id)
+        .group_by(RiskProfile.risk_level)
+        .all()
+    )
+    return {
+        'low': counts.get('Low', 0),
+        'medium': counts.get('Medium', 0),
+        'high': counts.get('High', 0),
+        'critical': counts.get('Critical', 0)
+    }
+
 # Authentication routes
 @main_bp.route('/')
 def index():
@@ -91,7 +136,6 @@ def logout():
 @login_required
 def dashboard():
     """Role-based dashboard redirect"""
-    from rbac_system import secure_redirect
     return secure_redirect('dashboard')
 
 # Admin dashboard
@@ -99,31 +143,22 @@ def dashboard():
 @login_required
 def admin_dashboard():
     """Admin dashboard with system overview"""
-    from rbac_system import admin_required
     # Apply admin check
     if not current_user.is_authenticated or current_user.role != 'admin':
         flash('Admin access required', 'danger')
         return redirect(url_for('auth.login'))
     
     try:
-        from datetime import date, timedelta
-        from sqlalchemy import func
-        
         # Get statistics
         total_students = Student.query.count()
         
         # Calculate risk statistics
-        risk_stats = {
-            'low': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Low').count(),
-            'medium': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Medium').count(),
-            'high': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'High').count(),
-            'critical': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Critical').count()
-        }
+        risk_stats = get_risk_level_counts()
         
         high_risk_students = risk_stats['high'] + risk_stats['critical']
         
-        # Top risky students for cards
-        risky_students = Student.query.join(RiskProfile).order_by(
+        # Top risky students for cards, risk profile filled from the same join
+        risky_students = Student.query.join(RiskProfile).options(contains_eager(Student.risk_profile)).order_by(
             db.case(
                 (RiskProfile.risk_level == 'Critical', 0),
                 (RiskProfile.risk_level == 'High', 1),
@@ -134,14 +169,7 @@ def admin_dashboard():
         ).limit(8).all()
         
         # Calculate attendance rate
-        recent_attendance = Attendance.query.filter(
-            Attendance.date >= date.today() - timedelta(days=30)
-        ).all()
-        
-        if recent_attendance:
-            attendance_rate = (len([a for a in recent_attendance if a.status == 'Present']) / len(recent_attendance)) * 100
-        else:
-            attendance_rate = 75.0
+        attendance_rate = Attendance.cached_rate_since(date.today() - timedelta(days=30), default=75.0)
         
         # Calculate avg GPA
         avg_gpa = db.session.query(func.avg(Student.gpa)).scalar() or 7.5
@@ -256,8 +284,6 @@ def student_dashboard():
         return redirect(url_for('auth.login'))
     
     try:
-        from datetime import date, timedelta
-        
         # 🔥 Get or Create Student (MAIN FIX)
         student = Student.query.filter_by(user_id=current_user.id).first()
         
@@ -290,6 +316,7 @@ def student_dashboard():
             risk_profile.update_risk_score(use_ml=False)
             db.session.add(risk_profile)
             db.session.commit()
+            invalidate_dashboard_caches()
         
         # 🔹 Attendance
         attendance_records = Attendance.query.filter(
@@ -439,29 +466,20 @@ def student_dashboard():
 @login_required
 def faculty_dashboard():
     """Faculty dashboard with department overview"""
-    from rbac_system import role_required
     # Apply faculty/admin check
     if not current_user.is_authenticated or current_user.role not in ['faculty', 'admin']:
         flash('Faculty access required', 'danger')
         return redirect(url_for('auth.login'))
     
     try:
-        from datetime import date, timedelta
-        from sqlalchemy import func
-        
         # Get statistics for faculty view
         total_students = Student.query.count()
         
         # Risk statistics
-        risk_stats = {
-            'low': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Low').count(),
-            'medium': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Medium').count(),
-            'high': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'High').count(),
-            'critical': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Critical').count()
-        }
+        risk_stats = get_risk_level_counts()
         
         # Get students needing attention (High + Critical risk)
-        at_risk_students = Student.query.join(RiskProfile).filter(
+        at_risk_students = Student.query.join(RiskProfile).options(contains_eager(Student.risk_profile)).filter(
             RiskProfile.risk_level.in_(['High', 'Critical'])
         ).limit(20).all()
         
@@ -474,43 +492,56 @@ def faculty_dashboard():
         flash(f'Error loading faculty dashboard: {str(e)}', 'danger')
         return render_template('faculty_dashboard.html', total_students=0)
 
+DASHBOARD_STATS_CACHE_KEY = 'dashboard_stats'
+ALERTS_PER_PAGE = 10
+ALERTS_MAX_PER_PAGE = 100
+
+# Slotted rows for the list APIs; orjson encodes dataclasses straight from their slots
+@dataclass(slots=True)
+class RiskyStudentOut:
+    student_id: str
+    first_name: str
+    last_name: str
+    risk_level: str
+    risk_score: float
+
+@dataclass(slots=True)
+class AlertOut:
+    id: int
+    title: str
+    description: str
+    severity: str
+    created_at: datetime
+    student_name: str
+
 @main_bp.route('/api/dashboard_stats')
-@login_required
+@session_login_required
+@cached_json_response(DASHBOARD_STATS_CACHE_KEY, timeout=30)
 def api_dashboard_stats():
     """API endpoint for dashboard statistics"""
     try:
-        from datetime import date, timedelta
-        from sqlalchemy import func
-        
         # Get statistics
         total_students = Student.query.count()
         
         # Calculate risk statistics
-        risk_stats = {
-            'low': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Low').count(),
-            'medium': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Medium').count(),
-            'high': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'High').count(),
-            'critical': Student.query.join(RiskProfile).filter(RiskProfile.risk_level == 'Critical').count()
-        }
+        risk_stats = get_risk_level_counts()
         
         high_risk_students = risk_stats['high'] + risk_stats['critical']
         
         # Calculate attendance rate
-        recent_attendance = Attendance.query.filter(
-            Attendance.date >= date.today() - timedelta(days=30)
-        ).all()
-        
-        if recent_attendance:
-            attendance_rate = (len([a for a in recent_attendance if a.status == 'Present']) / len(recent_attendance)) * 100
-        else:
-            attendance_rate = 75.0
+        attendance_rate = Attendance.cached_rate_since(date.today() - timedelta(days=30), default=75.0)
         
         # Calculate avg GPA
         avg_gpa = db.session.query(func.avg(Student.gpa)).scalar() or 7.5
         
-        # Get top risky students
-        risky_students = []
-        students = Student.query.join(RiskProfile).order_by(
+        # Get top risky students; only the rendered columns, no ORM objects
+        rows = db.session.query(
+            Student.student_id,
+            Student.first_name,
+            Student.last_name,
+            RiskProfile.risk_level,
+            RiskProfile.risk_score
+        ).join(RiskProfile, RiskProfile.student_id == Student.id).order_by(
             db.case(
                 (RiskProfile.risk_level == 'Critical', 0),
                 (RiskProfile.risk_level == 'High', 1),
@@ -520,14 +551,10 @@ def api_dashboard_stats():
             RiskProfile.risk_score.desc()
         ).limit(8).all()
         
-        for student in students:
-            risky_students.append({
-                'student_id': student.student_id,
-                'first_name': student.first_name,
-                'last_name': student.last_name,
-                'risk_level': student.risk_profile.risk_level,
-                'risk_score': round(student.risk_profile.risk_score, 1)
-            })
+        risky_students = [
+            RiskyStudentOut(student_id, first_name, last_name, risk_level, round(risk_score, 1))
+            for student_id, first_name, last_name, risk_level, risk_score in rows
+        ]
         
         return jsonify({
             'total_students': total_students,
@@ -544,22 +571,51 @@ def api_dashboard_stats():
 @main_bp.route('/api/alerts')
 @login_required
 def api_alerts():
-    """API endpoint for real-time alerts"""
+    """
+    API endpoint for real-time alerts, newest first.
+    Pages by keyset: pass the previous response's X-Next-Cursor header back
+    as ?cursor= to continue after its last alert.
+    """
     try:
-        alerts = Alert.query.filter_by(status='Active').order_by(Alert.created_at.desc()).limit(10).all()
-        
-        alerts_data = []
-        for alert in alerts:
-            alerts_data.append({
-                'id': alert.id,
-                'title': alert.title,
-                'description': alert.description,
-                'severity': alert.severity,
-                'created_at': alert.created_at.isoformat() if alert.created_at else None,
-                'student_name': alert.student.first_name + ' ' + alert.student.last_name if alert.student else 'Unknown'
-            })
+        per_page = max(1, min(request.args.get('per_page', ALERTS_PER_PAGE, type=int), ALERTS_MAX_PER_PAGE))
+        query = db.session.query(Alert, Student.first_name, Student.last_name).outerjoin(
+            Student, Student.id == Alert.student_id
+        ).filter(Alert.status == 'Active')
+        
+        cursor = request.args.get('cursor')
+        if cursor:
+            # Cursor is "<created_at iso>|<id>"; id breaks ties between equal timestamps
+            cursor_created_at, _, cursor_id = cursor.rpartition('|')
+            try:
+                cursor_key = (datetime.fromisoformat(cursor_created_at), int(cursor_id))
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+            query = query.filter(tuple_(Alert.created_at, Alert.id) < cursor_key)
+        
+        # One extra row tells us whether another page exists, without a COUNT
+        rows = query.order_by(
+            Alert.created_at.desc(), Alert.id.desc()
+        ).limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        
+        alerts_data = [
+            AlertOut(
+                alert.id,
+                alert.title,
+                alert.description,
+                alert.severity,
+                alert.created_at,
+                first_name + ' ' + last_name if first_name is not None else 'Unknown'
+            )
+            for alert, first_name, last_name in rows
+        ]
         
-        return jsonify(alerts_data)
+        response = Response(orjson.dumps(alerts_data), mimetype='application/json')
+        if has_next:
+            last = rows[-1][0]
+            response.headers['X-Next-Cursor'] = f'{last.created_at.isoformat()}|{last.id}'
+        return response
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -572,55 +628,41 @@ def ai_chat():
 
 @main_bp.route('/ai/chat_response', methods=['POST'])
 @login_required
+@rate_limited(chat_bucket)
 def ai_chat_response():
     """AI Chat Response API"""
     try:
         message = request.form.get('message', '')
         if not message:
-            return jsonify({'error': 'No message provided'}), 400
-        
-        # Simple AI responses for demo
-        responses = {
-            'hello': 'Hello! How can I help you with your studies today?',
-            'help': 'I can help you with study strategies, time management, career guidance, and motivation. What specific area would you like assistance with?',
-            'study': 'Here are some effective study strategies:\n1. Use the Pomodoro Technique (25 min study, 5 min break)\n2. Create a study schedule and stick to it\n3. Use active recall instead of passive reading\n4. Practice with past papers\n5. Study in a distraction-free environment',
-            'stress': 'Stress management tips:\n1. Practice deep breathing exercises\n2. Take regular breaks\n3. Exercise regularly\n4. Get enough sleep\n5. Talk to friends, family, or counselors\n6. Break large tasks into smaller ones',
-            'career': 'Career planning advice:\n1. Identify your interests and strengths\n2. Research different career options\n3. Talk to professionals in fields you\'re interested in\n4. Gain relevant skills through courses and internships\n5. Build a professional network',
-            'motivation': 'Stay motivated by:\n1. Setting clear, achievable goals\n2. Celebrating small wins\n3. Finding study partners\n4. Reminding yourself why you started\n5. Taking care of your physical and mental health',
-            'time': 'Time management tips:\n1. Use a planner or calendar\n2. Prioritize important tasks\n3. Break large tasks into smaller chunks\n4. Avoid procrastination\n5. Set specific study times'
-        }
+            return Response(CHAT_EMPTY_MESSAGE_BODY, status=400, mimetype='application/json')
         
         # Simple keyword matching
-        message_lower = message.lower()
-        response = "I'm here to help! You can ask me about study strategies, stress management, career guidance, motivation, or time management."
+        response = _chat_response_matcher.search(message.lower(), default=CHAT_DEFAULT_RESPONSE)
         
-        for keyword, reply in responses.items():
-            if keyword in message_lower:
-                response = reply
-                break
+        # Hot endpoint: serialize directly instead of going through jsonify
+        body = orjson.dumps({'response': response, 'timestamp': datetime.now()})
+        return Response(body, mimetype='application/json')
         
-        return jsonify({
-            'response': response,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    except Exception:
+        current_app.logger.exception('AI chat response failed')
+        return Response(CHAT_ERROR_BODY, status=500, mimetype='application/json')
 
-@main_bp.route('/ai/dashboard')
-@login_required
-def ai_dashboard():
-    """AI Dashboard"""
-    from models import Student, RiskProfile
-    
-    # Calculate insights
-    total_students = Student.query.count()
-    at_risk_count = RiskProfile.query.filter(RiskProfile.risk_level.in_(['High', 'Critical'])).count()
-    low_risk_count = RiskProfile.query.filter_by(risk_level='Low').count()
-    medium_risk_count = RiskProfile.query.filter_by(risk_level='Medium').count()
+AI_DASHBOARD_CACHE_KEY = 'ai_dashboard_insights'
+
+def compute_ai_dashboard_insights():
+    """Aggregate counts and top risk predictions for the AI dashboard"""
+    # Calculate insights in one pass per table
+    total_students, high_performers = db.session.query(
+        func.count(Student.id),
+        func.sum(db.case((Student.gpa >= 8.0, 1), else_=0))  # GPA >= 8.0
+    ).one()
     
-    # Calculate high performers (students with GPA >= 8.0)
-    high_performers = Student.query.filter(Student.gpa >= 8.0).count()
+    low_risk_count, medium_risk_count, high_risk_count, critical_risk_count = db.session.query(
+        func.sum(db.case((RiskProfile.risk_level == 'Low', 1), else_=0)),
+        func.sum(db.case((RiskProfile.risk_level == 'Medium', 1), else_=0)),
+        func.sum(db.case((RiskProfile.risk_level == 'High', 1), else_=0)),
+        func.sum(db.case((RiskProfile.risk_level == 'Critical', 1), else_=0))
+    ).one()
     
     # Get top risk predictions
     risk_predictions = db.session.query(
@@ -641,16 +683,52 @@ def ai_dashboard():
             'risk_factors': risk_profile.risk_reasons.split(',') if risk_profile.risk_reasons else []
         })
     
-    insights = {
+    return {
         'total_students': total_students,
-        'at_risk_count': at_risk_count,
-        'low_risk_count': low_risk_count,
-        'medium_risk_count': medium_risk_count,
-        'high_risk_count': RiskProfile.query.filter_by(risk_level='High').count(),
-        'critical_risk_count': RiskProfile.query.filter_by(risk_level='Critical').count(),
-        'high_performers': high_performers,
+        'at_risk_count': (high_risk_count or 0) + (critical_risk_count or 0),
+        'low_risk_count': low_risk_count or 0,
+        'medium_risk_count': medium_risk_count or 0,
+        'high_risk_count': high_risk_count or 0,
+        'critical_risk_count': critical_risk_count or 0,
+        'high_performers': high_performers or 0,
         'predictions': predictions
     }
+
+def get_ai_dashboard_insights():
+    """AI dashboard insights, shared across requests for AI_DASHBOARD_CACHE_TIMEOUT seconds"""
+    insights = cache.get(AI_DASHBOARD_CACHE_KEY)
+    if insights is None:
+        insights = compute_ai_dashboard_insights()
+        cache.set(AI_DASHBOARD_CACHE_KEY, insights, timeout=current_app.config['AI_DASHBOARD_CACHE_TIMEOUT'])
+    return insights
+
+ADMIN_COUNTS_CACHE_KEY = 'admin_counts'
+
+def get_admin_counts():
+    """Admin panel counters, shared across requests for DASHBOARD_COUNTS_CACHE_TIMEOUT seconds"""
+    stats = cache.get(ADMIN_COUNTS_CACHE_KEY)
+    if stats is None:
+        # The four counters come back from one statement
+        stats = db.session.query(
+            db.session.query(func.count(User.id)).scalar_subquery().label('total_users'),
+            db.session.query(func.count(Student.id)).scalar_subquery().label('total_students'),
+            db.session.query(func.count(Alert.id)).filter(Alert.status == 'Active').scalar_subquery().label('active_alerts'),
+            db.session.query(func.count(Counselling.id)).filter(Counselling.status == 'Scheduled').scalar_subquery().label('pending_counselling')
+        ).one()._asdict()
+        cache.set(ADMIN_COUNTS_CACHE_KEY, stats, timeout=current_app.config['DASHBOARD_COUNTS_CACHE_TIMEOUT'])
+    return stats
+
+def invalidate_dashboard_caches():
+    """Drop cached dashboard insights and stats after student, risk or attendance data changes"""
+    cache.delete(AI_DASHBOARD_CACHE_KEY)
+    cache.delete(ADMIN_COUNTS_CACHE_KEY)
+    invalidate_cached_responses(DASHBOARD_STATS_CACHE_KEY, ATTENDANCE_STATS_CACHE_KEY)
+
+@main_bp.route('/ai/dashboard')
+@login_required
+def ai_dashboard():
+    """AI Dashboard"""
+    insights = get_ai_dashboard_insights()
     
     return render_template('ai_dashboard.html', insights=insights)
 
@@ -712,11 +790,12 @@ def add_student():
         social_isolation = request.form.get('social_isolation') == 'true'
         mental_wellbeing = float(request.form.get('mental_wellbeing', 8))
         
-        if Student.query.filter_by(student_id=student_id).first():
+        # Existence checks select only the id instead of loading whole rows
+        if db.session.scalar(select(Student.id).where(Student.student_id == student_id)) is not None:
             flash('Student ID already exists.', 'danger')
             return redirect(url_for('main.add_student'))
         
-        if Student.query.filter_by(email=email).first():
+        if db.session.scalar(select(Student.id).where(Student.email == email)) is not None:
             flash('Email already exists.', 'danger')
             return redirect(url_for('main.add_student'))
         
@@ -742,7 +821,7 @@ def add_student():
             year=year,
             semester=semester,
             gpa=gpa,
-            enrollment_date=datetime.strptime(enrollment_date, '%Y-%m-%d').date() if enrollment_date else date.today(),
+            enrollment_date=date.fromisoformat(enrollment_date) if enrollment_date else date.today(),
             parent_name=parent_name,
             parent_email=parent_email,
             parent_phone=parent_phone
@@ -765,33 +844,64 @@ def add_student():
         db.session.add(risk_profile)
         
         db.session.commit()
+        invalidate_dashboard_caches()
         flash('Student added successfully! Default password: student123', 'success')
         return redirect(url_for('main.students'))
     
     return render_template('add_student.html', today_date=date.today().strftime('%Y-%m-%d'))
 
+# Columns rendered by students.html
+STUDENT_LIST_COLUMNS = (
+    Student.id,
+    Student.student_id,
+    Student.first_name,
+    Student.last_name,
+    Student.email,
+    Student.department,
+    Student.gpa,
+    RiskProfile.attendance_rate
+)
+STUDENTS_PER_PAGE = 20
+STUDENTS_API_MAX_PER_PAGE = 1000
+STUDENTS_API_FETCH_SIZE = 200
+
+def students_list_query(search=''):
+    """Only the columns the list renders, with attendance joined in, in id order"""
+    query = db.session.query(*STUDENT_LIST_COLUMNS)\
+        .outerjoin(RiskProfile, RiskProfile.student_id == Student.id)\
+        .order_by(Student.id)
+    
+    if search:
+        query = query.filter(student_search_filter(search))
+    return query
+
+@dataclass(slots=True)
+class StudentPage:
+    items: list
+    next_cursor: int | None
+
 @main_bp.route('/students')
 @login_required
 @faculty_required
 def students():
     """Students list page"""
     try:
-        page = request.args.get('page', 1, type=int)
+        page = request.args.get('page', type=int)
+        after = request.args.get('after', 0, type=int)
         search = request.args.get('search', '')
         
-        query = Student.query
+        query = students_list_query(search)
         
-        if search:
-            query = query.filter(
-                Student.first_name.contains(search) |
-                Student.last_name.contains(search) |
-                Student.student_id.contains(search) |
-                Student.email.contains(search)
+        if page:
+            # Numbered pages need the total, so they pay for paginate()'s COUNT
+            students = query.paginate(
+                page=page, per_page=STUDENTS_PER_PAGE, error_out=False
             )
-        
-        students = query.paginate(
-            page=page, per_page=20, error_out=False
-        )
+        else:
+            # Keyset page: seek past the last id shown, one extra row says whether there's more
+            rows = query.filter(Student.id > after).limit(STUDENTS_PER_PAGE + 1).all()
+            next_cursor = rows[STUDENTS_PER_PAGE - 1].id if len(rows) > STUDENTS_PER_PAGE else None
+            students = StudentPage(items=rows[:STUDENTS_PER_PAGE], next_cursor=next_cursor)
         
         return render_template('students.html', students=students, search=search)
         
@@ -799,16 +909,56 @@ def students():
         flash(f'Students error: {str(e)}', 'danger')
         return render_template('students.html', students=None, search='')
 
+@main_bp.route('/api/students')
+@login_required
+@faculty_required
+def api_students():
+    """
+    Students list as JSON: {"students": [...], "next_cursor": id or null}.
+    Same keyset paging as the list page (?after=, ?search=, ?per_page=).
+    Rows are streamed from a server-side cursor and encoded one at a time,
+    so large pages never sit in memory as a whole.
+    """
+    per_page = max(1, min(request.args.get('per_page', STUDENTS_PER_PAGE, type=int), STUDENTS_API_MAX_PER_PAGE))
+    after = request.args.get('after', 0, type=int)
+    
+    rows = students_list_query(request.args.get('search', ''))\
+        .filter(Student.id > after)\
+        .limit(per_page + 1)\
+        .execution_options(stream_results=True)\
+        .yield_per(STUDENTS_API_FETCH_SIZE)
+    
+    def generate():
+        yield b'{"students":['
+        sent = 0
+        last_id = next_cursor = None
+        for row in rows:
+            if sent == per_page:
+                # The extra row only says another page exists
+                next_cursor = last_id
+                break
+            yield (b',' if sent else b'') + orjson.dumps(row._asdict())
+            last_id = row.id
+            sent += 1
+        yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b'}'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
 @main_bp.route('/student/<int:student_id>')
 @login_required
 @faculty_required
 def student_detail(student_id):
     """Student detail page"""
     try:
-        student = Student.query.get_or_404(student_id)
+        # Risk profile joined in; counselling batched with an IN query
+        student = Student.query.options(
+            joinedload(Student.risk_profile),
+            selectinload(Student.counselling_sessions)
+        ).get_or_404(student_id)
         
-        # Get attendance data
-        attendance_records = Attendance.query.filter_by(student_id=student_id).order_by(Attendance.date.desc()).limit(30).all()
+        # Get attendance data: only the newest 30 rows, read off ix_attendance_student_date
+        attendance_records = Attendance.query.filter_by(student_id=student_id)\
+            .order_by(Attendance.date.desc()).limit(30).all()
         
         # Calculate attendance rate
         if attendance_records:
@@ -817,10 +967,10 @@ def student_detail(student_id):
             attendance_rate = 0
         
         # Get risk profile
-        risk_profile = RiskProfile.query.filter_by(student_id=student_id).first()
+        risk_profile = student.risk_profile
         
         # Get counselling sessions
-        counselling_sessions = Counselling.query.filter_by(student_id=student_id).order_by(Counselling.session_date.desc()).limit(5).all()
+        counselling_sessions = sorted(student.counselling_sessions, key=attrgetter('session_date'), reverse=True)[:5]
         
         # Get alerts
         alerts = Alert.query.filter_by(student_id=student_id).order_by(Alert.created_at.desc()).limit(5).all()
@@ -837,6 +987,28 @@ def student_detail(student_id):
         flash(f'Student detail error: {str(e)}', 'danger')
         return redirect(url_for('main.students'))
 
+def parse_attendance_form(form):
+    """
+    Validate and convert an attendance submission in one pass.
+    Returns (student_id, status, course, date); raises ValueError on bad input.
+    """
+    try:
+        student_id = int(form['student_id'])
+    except (KeyError, ValueError):
+        raise ValueError('student_id must be a number')
+    
+    status = form.get('status')
+    if status not in ATTENDANCE_STATUSES:
+        raise ValueError(f'status must be one of {", ".join(ATTENDANCE_STATUSES)}')
+    
+    raw_date = form.get('date')
+    try:
+        att_date = date.fromisoformat(raw_date) if raw_date else date.today()
+    except ValueError:
+        raise ValueError('date must be YYYY-MM-DD')
+    
+    return student_id, status, form.get('course', 'General'), att_date
+
 @main_bp.route('/attendance', methods=['GET', 'POST'])
 @login_required
 @faculty_required
@@ -844,14 +1016,15 @@ def attendance():
     """Attendance management page"""
     try:
         if request.method == 'POST':
-            student_id = request.form.get('student_id')
-            status = request.form.get('status')
-            course = request.form.get('course', 'General')
-            att_date = request.form.get('date', date.today().strftime('%Y-%m-%d'))
+            try:
+                student_id, status, course, att_date = parse_attendance_form(request.form)
+            except ValueError as e:
+                flash(f'Invalid attendance entry: {e}', 'danger')
+                return redirect(url_for('main.attendance'))
             
             existing = Attendance.query.filter_by(
                 student_id=student_id,
-                date=date.fromisoformat(att_date)
+                date=att_date
             ).first()
             
             if existing:
@@ -859,12 +1032,14 @@ def attendance():
             else:
                 new_att = Attendance(
                     student_id=student_id,
-                    date=date.fromisoformat(att_date),
+                    date=att_date,
                     status=status,
                     course=course
                 )
                 db.session.add(new_att)
             db.session.commit()
+            invalidate_dashboard_caches()
+            schedule_risk_refresh(student_id)
             flash('Attendance marked successfully!', 'success')
             return redirect(url_for('main.attendance'))
         
@@ -889,13 +1064,14 @@ def attendance():
 def risk():
     """Risk management page"""
     try:
-        # Get all students with risk profiles
-        students_with_risk = Student.query.join(RiskProfile).all()
+        # Students with risk profiles; risk_profile is filled from the same join
+        query = Student.query.join(RiskProfile).options(contains_eager(Student.risk_profile))
         
         # Filter by risk level if specified
         risk_filter = request.args.get('risk_level', '')
         if risk_filter:
-            students_with_risk = [s for s in students_with_risk if s.risk_profile.risk_level == risk_filter]
+            query = query.filter(RiskProfile.risk_level == risk_filter)
+        students_with_risk = query.all()
         
         return render_template('risk.html', students=students_with_risk, risk_filter=risk_filter)
         
@@ -910,12 +1086,7 @@ def admin():
     """Admin panel"""
     try:
         # Get system statistics
-        stats = {
-            'total_users': User.query.count(),
-            'total_students': Student.query.count(),
-            'active_alerts': Alert.query.filter_by(status='Active').count(),
-            'pending_counselling': Counselling.query.filter_by(status='Scheduled').count()
-        }
+        stats = get_admin_counts()
         
         # Get recent users
         recent_users = User.query.order_by(User.created_at.desc()).limit(5).all()
@@ -952,10 +1123,12 @@ def update_risk(student_id):
                 'quiz_average': risk_profile.academic_performance or 75,
                 'lms_engagement_score': 60
             }
-            ml_result = ml_service.predict_risk(ml_input)
-            risk_profile.ml_prediction = ml_result['risk_score']
-            risk_profile.ml_confidence = ml_result['probability']
-            risk_profile.ml_features = str(ml_input)
+            scaled = ml_service.scale_features([ml_input])
+            if scaled is not None:
+                ml_result = ml_batcher.predict(scaled)
+                risk_profile.ml_prediction = ml_result['risk_score']
+                risk_profile.ml_confidence = ml_result['probability']
+                risk_profile.ml_features = str(ml_input)
         except Exception as ml_err:
             pass  # fallback to rule-based
         
@@ -980,6 +1153,7 @@ def update_risk(student_id):
                 db.session.add(new_alert)
         
         db.session.commit()
+        invalidate_dashboard_caches()
         
         return jsonify({
             'success': True,
@@ -996,14 +1170,19 @@ def update_risk(student_id):
 @faculty_required
 def auto_update_risk_all():
     try:
-        students = Student.query.all()
+        students = Student.query.options(selectinload(Student.risk_profile)).all()
         summary = {'updated': 0, 'low': 0, 'medium': 0, 'high': 0, 'critical': 0}
+        profiles = []
         for s in students:
-            rp = RiskProfile.query.filter_by(student_id=s.id).first()
+            rp = s.risk_profile
             if not rp:
                 rp = RiskProfile(student_id=s.id)
-                db.session.add(rp)
-            rp.update_risk_score()
+                s.risk_profile = rp
+            profiles.append(rp)
+        
+        # Scored in one batch pass rather than per student
+        RiskProfile.update_risk_scores(profiles)
+        for rp in profiles:
             summary['updated'] += 1
             if rp.risk_level == 'Low':
                 summary['low'] += 1
@@ -1014,6 +1193,7 @@ def auto_update_risk_all():
             elif rp.risk_level == 'Critical':
                 summary['critical'] += 1
         db.session.commit()
+        invalidate_dashboard_caches()
         return jsonify({'success': True, 'summary': summary})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
@@ -1025,8 +1205,8 @@ def auto_update_risk_all():
 def intervention():
     """Intervention planning page for at-risk students"""
     try:
-        # Get critical and high risk students
-        at_risk_students = Student.query.join(RiskProfile).filter(
+        # Get critical and high risk students; the template's risk_profile reads come from the join
+        at_risk_students = Student.query.join(RiskProfile).options(contains_eager(Student.risk_profile)).filter(
             RiskProfile.risk_level.in_(['High', 'Critical'])
         ).order_by(
             db.case(
@@ -1121,7 +1301,7 @@ def scholarships():
     """Scholarships and financial aid page"""
     try:
         # Get students with financial issues
-        financial_students = Student.query.join(RiskProfile).filter(
+        financial_students = Student.query.join(RiskProfile).options(contains_eager(Student.risk_profile)).filter(
             RiskProfile.financial_issues == True
         ).all()
         
@@ -1256,7 +1436,7 @@ def schedule_counselling():
             session = Counselling(
                 student_id=student_id,
                 counsellor_id=counsellor_id,
-                session_date=datetime.strptime(session_date, '%Y-%m-%dT%H:%M'),
+                session_date=datetime.fromisoformat(session_date),
                 session_type=session_type,
                 status='Scheduled',
                 notes=notes,
@@ -1281,15 +1461,17 @@ def schedule_counselling():
             return redirect(url_for('main.schedule_counselling'))
         
         # Get students who need counselling
-        at_risk_students = Student.query.join(RiskProfile).filter(
+        at_risk_students = Student.query.join(RiskProfile).options(contains_eager(Student.risk_profile)).filter(
             RiskProfile.risk_level.in_(['Medium', 'High', 'Critical'])
         ).all()
         
         # Get counsellors
         counsellors = User.query.filter_by(role='faculty').all()
         
-        # Get upcoming sessions
-        upcoming_sessions = Counselling.query.filter(
+        # Get upcoming sessions, with the student and counsellor each row shows
+        upcoming_sessions = Counselling.query.options(
+            joinedload(Counselling.student), joinedload(Counselling.counsellor)
+        ).filter(
             Counselling.session_date > datetime.now(),
             Counselling.status == 'Scheduled'
         ).order_by(Counselling.session_date.asc()).all()
@@ -45,9 +45,9 @@ def create_scholarship():
                 year_level=request.form.get('year_level'),
                 nationality_requirements=request.form.get('nationality_requirements'),
                 gender_requirements=request.form.get('gender_requirements'),
-                application_deadline=datetime.strptime(request.form.get('application_deadline'), '%Y-%m-%d'),
-                start_date=datetime.strptime(request.form.get('start_date'), '%Y-%m-%d') if request.form.get('start_date') else None,
-                end_date=datetime.strptime(request.form.get('end_date'), '%Y-%m-%d') if request.form.get('end_date') else None,
+                application_deadline=datetime.fromisoformat(request.form.get('application_deadline')),
+                start_date=datetime.fromisoformat(request.form.get('start_date')) if request.form.get('start_date') else None,
+                end_date=datetime.fromisoformat(request.form.get('end_date')) if request.form.get('end_date') else None,
                 required_documents=json.dumps(request.form.getlist('required_documents')),
                 application_process=request.form.get('application_process'),
                 status=ScholarshipStatus.ACTIVE,
@@ -88,9 +88,9 @@ def edit_scholarship(scholarship_id):
             scholarship.year_level = request.form.get('year_level')
             scholarship.nationality_requirements = request.form.get('nationality_requirements')
             scholarship.gender_requirements = request.form.get('gender_requirements')
-            scholarship.application_deadline = datetime.strptime(request.form.get('application_deadline'), '%Y-%m-%d')
-            scholarship.start_date = datetime.strptime(request.form.get('start_date'), '%Y-%m-%d') if request.form.get('start_date') else None
-            scholarship.end_date = datetime.strptime(request.form.get('end_date'), '%Y-%m-%d') if request.form.get('end_date') else None
+            scholarship.application_deadline = datetime.fromisoformat(request.form.get('application_deadline'))
+            scholarship.start_date = datetime.fromisoformat(request.form.get('start_date')) if request.form.get('start_date') else None
+            scholarship.end_date = datetime.fromisoformat(request.form.get('end_date')) if request.form.get('end_date') else None
             scholarship.required_documents = json.dumps(request.form.getlist('required_documents'))
             scholarship.application_process = request.form.get('application_process')
             scholarship.updated_at = datetime.utcnow()
@@ -306,7 +306,7 @@ def api_scholarships():
                 'provider': scholarship.provider or 'Unknown',
                 'amount': scholarship.amount,
                 'currency': scholarship.currency or 'USD',
-                'deadline': scholarship.application_deadline.isoformat() if scholarship.application_deadline else None,
+                'deadline': scholarship.application_deadline,
                 'description': scholarship.description[:200] + '...' if scholarship.description and len(scholarship.description) > 200 else (scholarship.description or 'No description available'),
                 'min_gpa': scholarship.min_gpa,
                 'status': scholarship.status
@@ -349,13 +349,13 @@ def api_my_applications():
         
         data = []
         for app in applications:
-            scholarship = Scholarship.query.get(app.scholarship_id)
+            scholarship = db.session.get(Scholarship, app.scholarship_id)
             app_data = {
                 'id': app.id,
                 'scholarship_id': app.scholarship_id,
                 'scholarship_title': scholarship.title if scholarship else 'Unknown',
                 'status': app.status,
-                'application_date': app.application_date.isoformat() if app.application_date else None,
+                'application_date': app.application_date,
                 'gpa_at_application': app.gpa_at_application,
                 'ai_eligibility_score': app.ai_eligibility_score,
                 'ai_success_probability': app.ai_success_probability
@@ -41,7 +41,7 @@ def create_professors():
                 email=email,
                 role='faculty'
             )
-            professor.set_password('prof123')
+            professor.set_seed_password('prof123')
             db.session.add(professor)
             print(f"✅ Created professor: {email}")
     
@@ -403,7 +403,8 @@ def create_alerts(students):
 
 def main():
     """Main function to seed the college database"""
-    app = create_app()
+    # The schema is created below, in this script's own app context
+    app = create_app(auto_create_tables=False)
     
     with app.app_context():
         print("🎓 Starting college database seeding...")
@@ -40,7 +40,7 @@ def create_teachers():
                 email=email,
                 role='faculty'
             )
-            teacher.set_password('teacher123')
+            teacher.set_seed_password('teacher123')
             db.session.add(teacher)
             print(f"✅ Created teacher: {email}")
     
@@ -342,7 +342,8 @@ def create_alerts(students):
 
 def main():
     """Main function to seed the database"""
-    app = create_app()
+    # The schema is created below, in this script's own app context
+    app = create_app(auto_create_tables=False)
     
     with app.app_context():
         print("🌱 Starting database seeding...")
@@ -43,7 +43,7 @@ def create_faculty_users():
                     email=email,
                     role='faculty'
                 )
-                faculty.set_password('prof123')
+                faculty.set_seed_password('prof123')
                 db.session.add(faculty)
                 print(f"✅ Created faculty: {email}")
         
@@ -60,6 +60,7 @@ def create_student_users():
             ('student005', 'alex.jones@university.edu', 'Alex Jones', 'CS105')
         ]
         
+        new_rows = []
         for username, email, name, student_id in student_data:
             # Create user
             user = User.query.filter_by(email=email).first()
@@ -69,13 +70,11 @@ def create_student_users():
                     email=email,
                     role='student'
                 )
-                user.set_password('student123')
-                db.session.add(user)
-                db.session.commit()
+                user.set_seed_password('student123')
                 
-                # Create student profile
+                # Create student profile; the relationship fills in user_id at flush
                 student = Student(
-                    user_id=user.id,
+                    user=user,
                     student_id=student_id,
                     first_name=name.split()[0],
                     last_name=name.split()[1],
@@ -87,9 +86,11 @@ def create_student_users():
                     enrollment_date=date(2020, 9, 1),
                     credits_completed=random.randint(30, 120)
                 )
-                db.session.add(student)
+                new_rows.extend((user, student))
                 print(f"✅ Created student: {email}")
         
+        # One transaction for all users and profiles instead of a commit per student
+        db.session.add_all(new_rows)
         db.session.commit()
 
 if __name__ == '__main__':
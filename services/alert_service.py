@@ -5,8 +5,10 @@ Handles automated email and SMS alerts based on risk levels
 
 from flask import current_app
 from datetime import datetime, timedelta
-from models import db, User, Student, RiskProfile
+from models import db, User, Student
+from sqlalchemy.orm import selectinload
 from email_service import send_email
+from services.alert_tasks import send_alert_notifications
 import requests
 import json
 
@@ -35,10 +37,10 @@ class AlertService:
             # Log the alert
             AlertService._log_alert(student, new_risk_score, risk_level)
             
-            current_app.logger.info(f"Alert processed for {student.full_name()}: Risk {new_risk_score}% ({risk_level})")
+            current_app.logger.info("Alert processed for %s: Risk %s%% (%s)", student.full_name(), new_risk_score, risk_level)
             
         except Exception as e:
-            current_app.logger.error(f"Error in alert service: {str(e)}")
+            current_app.logger.error("Error in alert service: %s", e)
     
     @staticmethod
     def _calculate_risk_level(risk_score):
@@ -246,7 +248,7 @@ class AlertService:
             # For now, we'll log it
             sms_message = f"CRITICAL: {student.full_name()} ({student.student_id}) - Risk: {risk_score}% ({risk_level}). Immediate action required. EduGuard System."
             
-            current_app.logger.info(f"SMS Alert would be sent: {sms_message}")
+            current_app.logger.info("SMS Alert would be sent: %s", sms_message)
             
             # Example SMS integration (commented out):
             # from twilio.rest import Client
@@ -258,7 +260,7 @@ class AlertService:
             # )
             
         except Exception as e:
-            current_app.logger.error(f"Error sending SMS: {str(e)}")
+            current_app.logger.error("Error sending SMS: %s", e)
     
     @staticmethod
     def _get_faculty_recipients():
@@ -284,25 +286,23 @@ class AlertService:
             db.session.commit()
             
         except Exception as e:
-            current_app.logger.error(f"Error logging alert: {str(e)}")
+            current_app.logger.error("Error logging alert: %s", e)
     
     @staticmethod
     def check_all_students_risk():
         """Check risk levels for all students and send alerts"""
         try:
-            students = Student.query.all()
+            students = Student.query.options(selectinload(Student.risk_profile)).all()
             
             for student in students:
                 # Get current risk profile
-                risk_profile = RiskProfile.query.filter_by(student_id=student.id).first()
+                risk_profile = student.risk_profile
                 
                 if risk_profile and risk_profile.risk_score:
-                    AlertService.check_and_send_alerts(
-                        student, 
-                        risk_profile.risk_score
-                    )
+                    # Delivered by the Celery worker when one is configured
+                    send_alert_notifications(student.id, risk_profile.risk_score)
             
             current_app.logger.info("Risk alert check completed for all students")
             
         except Exception as e:
-            current_app.logger.error(f"Error in risk check: {str(e)}")
+            current_app.logger.error("Error in risk check: %s", e)
@@ -0,0 +1,84 @@
+"""
+EduGuard Alert Tasks
+Celery tasks that deliver risk alert notifications off the request path
+"""
+
+import os
+from flask import current_app
+from models import db, Student
+
+# Celery is optional; without it (or without a broker) notifications are sent inline
+try:
+    from celery import Celery
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL')
+
+# Notifications get their own queue so long batch jobs on the default queue can't starve them
+ALERTS_QUEUE = 'alerts'
+# SMTP stalls stay on their own queue and worker, away from the alerts queue
+EMAIL_QUEUE = 'email'
+# Bulk data refreshes, long-running; kept off the web workers and the latency-sensitive queues
+UPDATES_QUEUE = 'updates'
+
+celery = Celery('eduguard', broker=CELERY_BROKER_URL) if CELERY_AVAILABLE and CELERY_BROKER_URL else None
+if celery is not None:
+    celery.conf.task_routes = {
+        'alerts.*': {'queue': ALERTS_QUEUE},
+        'email.*': {'queue': EMAIL_QUEUE},
+        'updates.*': {'queue': UPDATES_QUEUE},
+    }
+    # Task modules that share this app, so the worker registers their tasks too
+    celery.conf.include = ['services.email_tasks', 'services.risk_tasks', 'services.update_tasks']
+
+_worker_app = None
+
+
+def _get_worker_app():
+    """Flask app the worker process runs tasks under, created on first task"""
+    global _worker_app
+    if _worker_app is None:
+        from app import create_app
+        _worker_app = create_app(os.getenv('FLASK_CONFIG') or 'default', worker_mode=True)
+    return _worker_app
+
+
+def deliver_alert_notifications(student_id, risk_score):
+    """Email/SMS a student's risk alert; needs an app context"""
+    from services.alert_service import AlertService
+
+    student = db.session.get(Student, student_id)
+    if student is None:
+        current_app.logger.warning("Alert notification skipped, student %s no longer exists", student_id)
+        return
+    AlertService.check_and_send_alerts(student, risk_score)
+
+
+if celery is not None:
+    # Not retried as a whole: a rerun would resend notifications that already went out
+    # and log the Alert row twice. Each email is its own email.send_email task, which
+    # retries only that delivery and only on SMTP/network errors.
+    @celery.task(name='alerts.send_alert_notifications')
+    def send_alert_notifications_task(student_id, risk_score):
+        with _get_worker_app().app_context():
+            deliver_alert_notifications(student_id, risk_score)
+
+
+def send_alert_notifications(student_id, risk_score):
+    """
+    Queue a student's alert notifications on the Celery worker and return
+    immediately. Falls back to sending inline when no broker is configured
+    or the broker can't be reached.
+    Run the worker with: celery -A services.alert_tasks.celery worker -Q alerts -c 8
+    """
+    if celery is not None:
+        try:
+            send_alert_notifications_task.apply_async(args=[student_id, risk_score], queue=ALERTS_QUEUE)
+            return
+        except Exception as e:
+            current_app.logger.warning(
+                "Could not queue alert notifications for student %s, sending them directly: %s",
+                student_id, e)
+    deliver_alert_notifications(student_id, risk_score)
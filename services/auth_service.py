@@ -39,24 +39,24 @@ class AuthenticationService:
             user = User.query.filter_by(email=email).first()
             
             if not user:
-                logger.warning(f"Login attempt with non-existent email: {email}")
+                logger.warning("Login attempt with non-existent email: %s", email)
                 return False, None, "Invalid email or password"
             
             # Check if account is locked
             if user.is_locked():
-                logger.warning(f"Login attempt on locked account: {email}")
+                logger.warning("Login attempt on locked account: %s", email)
                 return False, None, "Account is locked. Please try again later."
             
             # Check if account is active
             if not user.is_active:
-                logger.warning(f"Login attempt on inactive account: {email}")
+                logger.warning("Login attempt on inactive account: %s", email)
                 return False, None, "Account is deactivated. Please contact administrator."
             
             # Verify password
             if not user.check_password(password):
                 user.increment_failed_login()
                 db.session.commit()
-                logger.warning(f"Failed login attempt for email: {email}")
+                logger.warning("Failed login attempt for email: %s", email)
                 return False, None, "Invalid email or password"
             
             # Successful login
@@ -70,11 +70,11 @@ class AuthenticationService:
             session['user_role'] = user.role.value
             session['login_time'] = datetime.utcnow().isoformat()
             
-            logger.info(f"User logged in successfully: {email} (Role: {user.role.value})")
+            logger.info("User logged in successfully: %s (Role: %s)", email, user.role.value)
             return True, user, "Login successful"
             
         except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
+            logger.error("Authentication error: %s", e)
             return False, None, "An error occurred during authentication"
     
     @staticmethod
@@ -95,11 +95,11 @@ class AuthenticationService:
             # Clear session data
             session.clear()
             
-            logger.info(f"User logged out: {user_email}")
+            logger.info("User logged out: %s", user_email)
             return True
             
         except Exception as e:
-            logger.error(f"Logout error: {str(e)}")
+            logger.error("Logout error: %s", e)
             return False
     
     @staticmethod
@@ -154,12 +154,12 @@ class AuthenticationService:
             db.session.add(user)
             db.session.commit()
             
-            logger.info(f"New user created: {email} (Role: {role.value})")
+            logger.info("New user created: %s (Role: %s)", email, role.value)
             return True, user, "User created successfully"
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"User creation error: {str(e)}")
+            logger.error("User creation error: %s", e)
             return False, None, "An error occurred while creating user"
     
     @staticmethod
@@ -176,7 +176,7 @@ class AuthenticationService:
             tuple: (success: bool, message: str)
         """
         try:
-            user = User.query.get(user_id)
+            user = db.session.get(User, user_id)
             if not user:
                 return False, "User not found"
             
@@ -201,12 +201,12 @@ class AuthenticationService:
             user.set_password(new_password)
             db.session.commit()
             
-            logger.info(f"Password changed for user: {user.email}")
+            logger.info("Password changed for user: %s", user.email)
             return True, "Password changed successfully"
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Password change error: {str(e)}")
+            logger.error("Password change error: %s", e)
             return False, "An error occurred while changing password"
 
 # Decorators for route protection
@@ -221,11 +221,11 @@ def role_required(*allowed_roles):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             if not current_user.is_authenticated:
-                logger.warning(f"Unauthenticated access attempt to protected route")
+                logger.warning("Unauthenticated access attempt to protected route")
                 raise AuthorizationError("Authentication required")
             
             if not any(current_user.has_role(role) for role in allowed_roles):
-                logger.warning(f"Unauthorized access attempt by user {current_user.email} (Role: {current_user.role.value})")
+                logger.warning("Unauthorized access attempt by user %s (Role: %s)", current_user.email, current_user.role.value)
                 raise AuthorizationError("Insufficient permissions")
             
             return f(*args, **kwargs)
@@ -0,0 +1,38 @@
+"""
+EduGuard Email Tasks
+Celery delivery of notification emails on a dedicated queue
+"""
+
+import smtplib
+from flask import current_app
+from flask_mail import Message
+from services.alert_tasks import celery, _get_worker_app, EMAIL_QUEUE
+
+EMAIL_TASK_MAX_RETRIES = 5
+
+
+if celery is not None:
+    @celery.task(name='email.send_email', autoretry_for=(smtplib.SMTPException, OSError),
+                 retry_backoff=True, max_retries=EMAIL_TASK_MAX_RETRIES)
+    def send_email_task(subject, sender, recipients, html_body, text_body=None):
+        with _get_worker_app().app_context():
+            from app import mail
+            mail.send(Message(subject, sender=sender, recipients=recipients,
+                              html=html_body, body=text_body))
+
+
+def queue_email(subject, sender, recipients, html_body, text_body=None):
+    """
+    Hand an email to the Celery email queue. Returns False when no broker is
+    configured, or it can't be reached, so the caller can send it another way.
+    Run the worker with: celery -A services.alert_tasks.celery worker -Q email -c 4
+    """
+    if celery is None:
+        return False
+    try:
+        send_email_task.apply_async(args=[subject, sender, recipients, html_body, text_body],
+                                    queue=EMAIL_QUEUE)
+    except Exception as e:
+        current_app.logger.warning("Could not queue email %r, sending it directly: %s", subject, e)
+        return False
+    return True
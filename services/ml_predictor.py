@@ -128,7 +128,7 @@ class DropoutPredictor:
             from models import Student, Attendance, AcademicRecord, db
             
             # Get student data
-            student = Student.query.get(student_id)
+            student = db.session.get(Student, student_id)
             if not student:
                 return {'error': 'Student not found'}
             
@@ -1,22 +1,28 @@
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import accuracy_score, classification_report
 import joblib
 import os
+import importlib.util
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Hummingbird is optional; without it predictions use the scikit-learn forest directly.
+# It pulls in torch, so only check that it's installed here and import it when a model is compiled.
+HUMMINGBIRD_AVAILABLE = importlib.util.find_spec('hummingbird') is not None
+
 class RiskPredictionModel:
     def __init__(self, model_path='model/risk_model.pkl'):
         self.model_path = model_path
         self.model = None
         self.scaler = None
+        self.proba_model = None  # compiled forest when available, else self.model
         self.feature_names = [
             'attendance_rate', 
             'average_score', 
@@ -38,17 +44,37 @@ class RiskPredictionModel:
                 data = joblib.load(self.model_path)
                 self.model = data['model']
                 self.scaler = data['scaler']
-                logger.info(f"Model loaded from {self.model_path}")
+                self._compile_model()
+                logger.info("Model loaded from %s", self.model_path)
             else:
                 logger.warning("No trained model found. Please train the model first.")
         except Exception as e:
-            logger.error(f"Error loading model: {str(e)}")
+            logger.error("Error loading model: %s", e)
+
+    def _compile_model(self):
+        """Compile the forest to tensor operations when Hummingbird is installed"""
+        self.proba_model = self.model
+        if not HUMMINGBIRD_AVAILABLE or self.model is None:
+            return
+        
+        try:
+            from hummingbird.ml import convert as hummingbird_convert
+            self.proba_model = hummingbird_convert(self.model, 'pytorch')
+            logger.info("Risk model compiled with Hummingbird")
+        except Exception as e:
+            logger.warning("Hummingbird conversion failed, using scikit-learn model: %s", e)
 
     def train_model(self, synthetic_data_size=1000):
         """
         Train the model using synthetic data (since we don't have historical data yet).
         In a real scenario, this would query the database.
         """
+        # Training-only scikit-learn pieces; loading a saved model doesn't need them imported up front
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.metrics import accuracy_score, classification_report
+        
         logger.info("Generating synthetic training data...")
         
         # Generate synthetic data
@@ -121,18 +147,19 @@ class RiskPredictionModel:
         logger.info("Training Random Forest Classifier...")
         self.model = RandomForestClassifier(n_estimators=100, random_state=42)
         self.model.fit(X_train_scaled, y_train)
+        self._compile_model()
         
         # Evaluate
         y_pred = self.model.predict(X_test_scaled)
         accuracy = accuracy_score(y_test, y_pred)
         report = classification_report(y_test, y_pred)
         
-        logger.info(f"Model Training Completed. Accuracy: {accuracy:.2f}")
-        logger.info(f"Classification Report:\n{report}")
+        logger.info("Model Training Completed. Accuracy: %.2f", accuracy)
+        logger.info("Classification Report:\n%s", report)
         
         # Save model
         joblib.dump({'model': self.model, 'scaler': self.scaler}, self.model_path)
-        logger.info(f"Model saved to {self.model_path}")
+        logger.info("Model saved to %s", self.model_path)
         
         return {
             'success': True,
@@ -159,45 +186,130 @@ class RiskPredictionModel:
                 'risk_score': float (0-100 derived scale)
             }
         """
+        return self.predict_risk_batch([student_data])[0]
+
+    def predict_risk_batch(self, students_data):
+        """
+        Predict risk for several students with one scaler and forest pass.
+        Returns one result dict (see predict_risk) per input, in order.
+        """
+        if not students_data:
+            return []
+        
+        try:
+            features_scaled = self.scale_features(students_data)
+        except Exception as e:
+            logger.error("Prediction error: %s", e)
+            return [{'risk_level': 'Error', 'probability': 0.0, 'risk_score': 0.0} for _ in students_data]
+        if features_scaled is None:
+            return [{'risk_level': 'Unknown', 'probability': 0.0, 'risk_score': 0.0} for _ in students_data]
+        return self.predict_risk_scaled(features_scaled)
+
+    def scale_features(self, students_data):
+        """
+        Scale raw feature dicts into a float32 (n, n_features) matrix, the form
+        predict_risk_scaled and PredictionBatcher take. Returns None without a model.
+        """
         if not self.model or not self.scaler:
             logger.error("Model not loaded. Attempting to load default...")
             self.load_model()
             if not self.model:
-                 # If still no model, return default safe fallback
-                return {'risk_level': 'Unknown', 'probability': 0.0, 'risk_score': 0.0}
+                return None
+
+        features = pd.DataFrame(students_data, columns=self.feature_names)
+        return self.scaler.transform(features).astype(np.float32)
+
+    def predict_risk_scaled(self, features_scaled):
+        """Predict risk from already-scaled feature rows, skipping the scaler"""
+        if not self.model:
+            return [{'risk_level': 'Unknown', 'probability': 0.0, 'risk_score': 0.0} for _ in features_scaled]
 
         try:
-            # Prepare input
-            features = pd.DataFrame([student_data], columns=self.feature_names)
-            features_scaled = self.scaler.transform(features)
-            
-            # Predict
-            prediction = self.model.predict(features_scaled)[0]
-            probabilities = self.model.predict_proba(features_scaled)[0]
-            max_prob = max(probabilities)
+            # Predict; a forest's predicted class is the argmax of its class probabilities,
+            # so one predict_proba pass gives both
+            probabilities = self.proba_model.predict_proba(features_scaled)
+            classes = self.model.classes_
+            predictions = classes[np.argmax(probabilities, axis=1)]
+            max_probs = probabilities.max(axis=1)
             
             # Calculate a continuous risk score (0-100) based on 'High' probability
             # We need to know which index corresponds to 'High'
-            classes = self.model.classes_
-            
             high_risk_idx = np.where(classes == 'High')[0]
             medium_risk_idx = np.where(classes == 'Medium')[0]
             
-            high_prob = probabilities[high_risk_idx][0] if len(high_risk_idx) > 0 else 0
-            medium_prob = probabilities[medium_risk_idx][0] if len(medium_risk_idx) > 0 else 0
+            high_probs = probabilities[:, high_risk_idx[0]] if len(high_risk_idx) > 0 else np.zeros(len(features_scaled))
+            medium_probs = probabilities[:, medium_risk_idx[0]] if len(medium_risk_idx) > 0 else np.zeros(len(features_scaled))
             
             # Synthetic risk score calculation
-            risk_score = (high_prob * 100) + (medium_prob * 50)
+            risk_scores = (high_probs * 100) + (medium_probs * 50)
             
-            return {
+            return [{
                 'risk_level': prediction,
                 'probability': float(max_prob),
                 'risk_score': float(risk_score)
-            }
+            } for prediction, max_prob, risk_score in zip(predictions, max_probs, risk_scores)]
             
         except Exception as e:
-            logger.error(f"Prediction error: {str(e)}")
-            return {'risk_level': 'Error', 'probability': 0.0, 'risk_score': 0.0}
+            logger.error("Prediction error: %s", e)
+            return [{'risk_level': 'Error', 'probability': 0.0, 'risk_score': 0.0} for _ in features_scaled]
+
+class PredictionBatcher:
+    """
+    Coalesces concurrent single-student predictions into batched model calls.
+    Callers submit one already-scaled feature row (see scale_features); rows
+    queue up for at most `max_wait` seconds (or until `max_batch_size` are
+    pending) and a background thread scores them with one predict_risk_scaled.
+    """
+    
+    def __init__(self, model, max_batch_size=32, max_wait=0.005):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def submit(self, features_scaled):
+        """Queue one scaled feature row and return a Future for its result dict"""
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((features_scaled, future))
+        return future
+
+    def predict(self, features_scaled, timeout=1.0):
+        """Blocking helper for request handlers"""
+        return self.submit(features_scaled).result(timeout=timeout)
+
+    def _ensure_worker(self):
+        # Started lazily so forked server workers each get their own thread
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='ml-prediction-batcher', daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                results = self.model.predict_risk_scaled(np.vstack([features for features, _ in batch]))
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
 
 # Singleton instance
 ml_service = RiskPredictionModel()
+ml_batcher = PredictionBatcher(ml_service)
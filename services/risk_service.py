@@ -39,7 +39,7 @@ class DropoutRiskService:
             RiskCalculationError: If calculation fails
         """
         try:
-            student = Student.query.get(student_id)
+            student = db.session.get(Student, student_id)
             if not student:
                 raise RiskCalculationError(f"Student not found: {student_id}")
             
@@ -69,11 +69,11 @@ class DropoutRiskService:
                 attendance_data, academic_data, behavioral_data
             )
             
-            logger.info(f"Risk calculated for student {student.full_name}: {risk_level.value} ({risk_score:.2f})")
+            logger.info("Risk calculated for student %s: %s (%.2f)", student.full_name, risk_level.value, risk_score)
             return risk_profile
             
         except Exception as e:
-            logger.error(f"Risk calculation error for student {student_id}: {str(e)}")
+            logger.error("Risk calculation error for student %s: %s", student_id, e)
             raise RiskCalculationError(f"Failed to calculate risk: {str(e)}")
     
     @classmethod
@@ -124,7 +124,7 @@ class DropoutRiskService:
             }
             
         except Exception as e:
-            logger.error(f"Attendance risk calculation error: {str(e)}")
+            logger.error("Attendance risk calculation error: %s", e)
             return {
                 'rate': 100.0,
                 'risk_factor': 0.0,
@@ -185,7 +185,7 @@ class DropoutRiskService:
             }
             
         except Exception as e:
-            logger.error(f"Academic risk calculation error: {str(e)}")
+            logger.error("Academic risk calculation error: %s", e)
             return {
                 'average_score': 100.0,
                 'risk_factor': 0.0,
@@ -244,7 +244,7 @@ class DropoutRiskService:
             }
             
         except Exception as e:
-            logger.error(f"Behavioral risk calculation error: {str(e)}")
+            logger.error("Behavioral risk calculation error: %s", e)
             return {
                 'risk_factor': 0.0,
                 'total_interventions': 0,
@@ -318,7 +318,7 @@ class DropoutRiskService:
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Risk profile update error: {str(e)}")
+            logger.error("Risk profile update error: %s", e)
             raise RiskCalculationError(f"Failed to update risk profile: {str(e)}")
     
     @classmethod
@@ -413,11 +413,11 @@ class DropoutRiskService:
                 'errors': errors
             }
             
-            logger.info(f"Batch risk update completed: {updated_count}/{len(students)} successful")
+            logger.info("Batch risk update completed: %s/%s successful", updated_count, len(students))
             return result
             
         except Exception as e:
-            logger.error(f"Batch risk update error: {str(e)}")
+            logger.error("Batch risk update error: %s", e)
             raise RiskCalculationError(f"Batch update failed: {str(e)}")
     
     @classmethod
@@ -454,7 +454,7 @@ class DropoutRiskService:
             }
             
         except Exception as e:
-            logger.error(f"Risk statistics error: {str(e)}")
+            logger.error("Risk statistics error: %s", e)
             return {
                 'total_students': 0,
                 'risk_distribution': {'Low': 0, 'Medium': 0, 'High': 0},
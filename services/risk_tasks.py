@@ -0,0 +1,86 @@
+"""
+EduGuard Risk Tasks
+Debounced background recomputation of a student's risk profile after data writes
+"""
+
+from datetime import date, timedelta
+from flask import current_app, g
+from models import db, Student, Attendance
+from services.alert_tasks import celery, _get_worker_app
+
+# Writes for the same student inside this window collapse into one recompute.
+# The task clears the lock before reading, so the TTL only matters if it never runs
+RISK_REFRESH_COUNTDOWN = 5
+RISK_REFRESH_LOCK_TTL = 10
+RISK_ATTENDANCE_WINDOW_DAYS = 30
+
+
+def _risk_lock_key(student_id):
+    return f'risk_lock:{student_id}'
+
+
+def refresh_student_risk(student_id):
+    """Recompute a student's attendance rate and risk score; needs an app context"""
+    student = db.session.get(Student, student_id)
+    if student is None or student.risk_profile is None:
+        return
+
+    since = date.today() - timedelta(days=RISK_ATTENDANCE_WINDOW_DAYS)
+    risk_profile = student.risk_profile
+    risk_profile.attendance_rate = Attendance.rate_since(
+        since, default=risk_profile.attendance_rate, student_id=student_id
+    )
+    risk_profile.update_risk_score()
+    db.session.commit()
+
+    from routes import invalidate_dashboard_caches
+    invalidate_dashboard_caches()
+
+
+if celery is not None:
+    @celery.task(name='risk.refresh_student_risk')
+    def refresh_student_risk_task(student_id):
+        with _get_worker_app().app_context():
+            # Release the lock before reading so writes landing during the
+            # recompute queue a fresh refresh instead of being dropped
+            from app import cache
+            cache.delete(_risk_lock_key(student_id))
+            try:
+                refresh_student_risk(student_id)
+            except Exception:
+                db.session.rollback()
+                raise
+
+
+def schedule_risk_refresh(student_id):
+    """
+    Mark a student's risk profile stale. The request's dirty set is flushed
+    once at teardown, so many writes for one student in a request queue one
+    recompute. Without a broker the daily AutoDataUpdater run picks it up.
+    """
+    if celery is None:
+        return
+    g.setdefault('risk_dirty', set()).add(student_id)
+
+
+def flush_risk_refreshes(exc=None):
+    """teardown_request hook: queue one recompute per student marked this request"""
+    dirty = g.pop('risk_dirty', None)
+    if not dirty or exc is not None:
+        return
+    for student_id in dirty:
+        _queue_risk_refresh(student_id)
+
+
+def _queue_risk_refresh(student_id):
+    """Enqueue a recompute a few seconds out, at most once per lock window across requests"""
+    from app import cache
+    # add() is set-if-not-exists, so only the first write in the window enqueues
+    if not cache.add(_risk_lock_key(student_id), True, timeout=RISK_REFRESH_LOCK_TTL):
+        return
+
+    try:
+        refresh_student_risk_task.apply_async(args=[student_id], countdown=RISK_REFRESH_COUNTDOWN)
+    except Exception as e:
+        cache.delete(_risk_lock_key(student_id))
+        current_app.logger.warning("Could not queue risk refresh for student %s: %s", student_id, e)
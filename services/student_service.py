@@ -126,7 +126,7 @@ class MLService:
             return X, y
             
         except Exception as e:
-            logger.error(f"Error preparing training data: {str(e)}")
+            logger.error("Error preparing training data: %s", e)
             return pd.DataFrame(), pd.Series()
     
     def train_model(self) -> Dict:
@@ -181,7 +181,7 @@ class MLService:
                         self.model.feature_importances_
             )
             
-            logger.info(f"Model trained successfully with accuracy: {accuracy:.4f}")
+            logger.info("Model trained successfully with accuracy: %.4f", accuracy)
             
             return {
                 'success': True,
@@ -193,7 +193,7 @@ class MLService:
             }
             
         except Exception as e:
-            logger.error(f"Error training model: {str(e)}")
+            logger.error("Error training model: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -208,7 +208,7 @@ class MLService:
                     'error': 'ML model not available'
                 }
             
-            student = Student.query.get(student_id)
+            student = db.session.get(Student, student_id)
             if not student:
                 return {
                     'success': False,
@@ -276,7 +276,7 @@ class MLService:
             }
             
         except Exception as e:
-            logger.error(f"Error predicting risk for student {student_id}: {str(e)}")
+            logger.error("Error predicting risk for student %s: %s", student_id, e)
             return {
                 'success': False,
                 'error': str(e)
@@ -303,7 +303,7 @@ class MLService:
             }
             
         except Exception as e:
-            logger.error(f"Error in batch risk prediction: {str(e)}")
+            logger.error("Error in batch risk prediction: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -332,7 +332,7 @@ class BackgroundTaskService:
             logger.info("Starting risk assessment for all students")
             result = RiskCalculationService.batch_update_risk_scores()
             
-            logger.info(f"Risk assessment completed: {result}")
+            logger.info("Risk assessment completed: %s", result)
             
             # Trigger alerts for high-risk students
             if result['high_risk_students'] > 0:
@@ -341,7 +341,7 @@ class BackgroundTaskService:
             return result
             
         except Exception as e:
-            logger.error(f"Error in risk assessment task: {str(e)}")
+            logger.error("Error in risk assessment task: %s", e)
             return {'success': False, 'error': str(e)}
     
     @staticmethod
@@ -391,7 +391,7 @@ class BackgroundTaskService:
                         alerts_created += 1
                 
             db.session.commit()
-            logger.info(f"Created {alerts_created} attendance alerts")
+            logger.info("Created %s attendance alerts", alerts_created)
             
             return {
                 'success': True,
@@ -399,7 +399,7 @@ class BackgroundTaskService:
             }
             
         except Exception as e:
-            logger.error(f"Error in attendance alert task: {str(e)}")
+            logger.error("Error in attendance alert task: %s", e)
             return {'success': False, 'error': str(e)}
     
     @staticmethod
@@ -446,7 +446,7 @@ class BackgroundTaskService:
                     alerts_created += 1
             
             db.session.commit()
-            logger.info(f"Created {alerts_created} performance alerts")
+            logger.info("Created %s performance alerts", alerts_created)
             
             return {
                 'success': True,
@@ -454,7 +454,7 @@ class BackgroundTaskService:
             }
             
         except Exception as e:
-            logger.error(f"Error in performance alert task: {str(e)}")
+            logger.error("Error in performance alert task: %s", e)
             return {'success': False, 'error': str(e)}
 
 class AnalyticsService:
@@ -489,7 +489,7 @@ class AnalyticsService:
             ]
             
         except Exception as e:
-            logger.error(f"Error getting attendance trends: {str(e)}")
+            logger.error("Error getting attendance trends: %s", e)
             return []
     
     @staticmethod
@@ -520,7 +520,7 @@ class AnalyticsService:
             ]
             
         except Exception as e:
-            logger.error(f"Error getting performance trends: {str(e)}")
+            logger.error("Error getting performance trends: %s", e)
             return []
     
     @staticmethod
@@ -600,7 +600,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating monthly report: {str(e)}")
+            logger.error("Error generating monthly report: %s", e)
             return {
                 'month': month,
                 'year': year,
@@ -627,7 +627,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating monthly report: {str(e)}")
+            logger.error("Error generating monthly report: %s", e)
             return {
                 'month': month,
                 'year': year,
@@ -654,7 +654,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating monthly report: {str(e)}")
+            logger.error("Error generating monthly report: %s", e)
             return {
                 'month': month,
                 'year': year,
@@ -680,7 +680,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating monthly report: {str(e)}")
+            logger.error("Error generating monthly report: %s", e)
             return {
                 'month': month,
                 'year': year,
@@ -706,7 +706,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating monthly report: {str(e)}")
+            logger.error("Error generating monthly report: %s", e)
             return {
                 'month': month,
                 'year': year,
@@ -732,7 +732,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating monthly report: {str(e)}")
+            logger.error("Error generating monthly report: %s", e)
             return {
                 'month': month,
                 'year': year,
@@ -758,7 +758,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating monthly report: {str(e)}")
+            logger.error("Error generating monthly report: %s", e)
             return {
                 'month': month,
                 'year': year,
@@ -783,7 +783,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating monthly report: {str(e)}")
+            logger.error("Error generating monthly report: %s", e)
             return {
                 'month': month,
                 'year': year,
@@ -871,7 +871,7 @@ class AnalyticsService:
             }
             
         except Exception as e:
-            logger.error(f"Error getting risk statistics: {str(e)}")
+            logger.error("Error getting risk statistics: %s", e)
             return {
                 'total_students': 0,
                 'risk_distribution': {'LOW': 0, 'MEDIUM': 0, 'HIGH': 0, 'CRITICAL': 0},
@@ -908,7 +908,7 @@ class AnalyticsService:
             ]
             
         except Exception as e:
-            logger.error(f"Error getting performance trends: {str(e)}")
+            logger.error("Error getting performance trends: %s", e)
             return []
 
 # Initialize Celery
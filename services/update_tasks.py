@@ -0,0 +1,47 @@
+"""
+EduGuard Update Tasks
+Daily data refresh jobs run on a Celery worker instead of web worker threads
+"""
+
+import threading
+from services.alert_tasks import celery, UPDATES_QUEUE
+
+
+def _daily_updater():
+    # DailyUpdateSystem builds its own app at import, so only load it where a job runs
+    from daily_update_system import daily_updater
+    return daily_updater
+
+
+def run_update_job(job):
+    """Run one daily update job: 'all', 'attendance' or 'user_data'"""
+    updater = _daily_updater()
+    if job == 'all':
+        updater.manual_update_now()
+        return
+
+    with updater.app.app_context():
+        if job == 'attendance':
+            updater.update_daily_attendance()
+        elif job == 'user_data':
+            updater.update_user_data()
+        else:
+            raise ValueError(f"Unknown update job: {job}")
+
+
+if celery is not None:
+    @celery.task(name='updates.run_update_job')
+    def run_update_job_task(job):
+        run_update_job(job)
+
+
+def start_update_job(job):
+    """
+    Start a daily update job without blocking the request. Goes to the Celery
+    updates queue when a broker is configured, else a daemon thread here.
+    Run the worker with: celery -A services.alert_tasks.celery worker -Q updates -c 1
+    """
+    if celery is not None:
+        run_update_job_task.apply_async(args=[job], queue=UPDATES_QUEUE)
+    else:
+        threading.Thread(target=run_update_job, args=(job,), daemon=True).start()
@@ -5,13 +5,14 @@ Initialize database with sample data
 
 from app import create_app
 from models import db, User, Student, Attendance, RiskProfile
-from datetime import date, timedelta
+from datetime import date
 import hashlib
-import random
+import numpy as np
 
 def setup_database():
     """Setup database with initial data"""
-    app = create_app('development')
+    # The schema is created below, in this script's own app context
+    app = create_app('development', auto_create_tables=False)
     
     with app.app_context():
         try:
@@ -53,6 +54,7 @@ def setup_database():
                     ('ST005', 'Alex', 'Brown', 'alex.brown@eduguard.edu', 'Science')
                 ]
                 
+                students = []
                 for student_id, first_name, last_name, email, department in sample_students:
                     # Create user
                     student_user = User(
@@ -61,12 +63,11 @@ def setup_database():
                         role='student'
                     )
                     student_user.password_hash = hashlib.sha256('student123'.encode()).hexdigest()
-                    db.session.add(student_user)
-                    db.session.flush()  # Get the user ID
                     
-                    # Create student profile
+                    # Create student profile with its risk profile; the user and
+                    # student ids are filled in by the single flush below
                     student = Student(
-                        user_id=student_user.id,
+                        user=student_user,
                         student_id=student_id,
                         first_name=first_name,
                         last_name=last_name,
@@ -76,32 +77,33 @@ def setup_database():
                         semester=1,
                         gpa=3.5,
                         enrollment_date=date(2022, 9, 1),
-                        credits_completed=60
+                        credits_completed=60,
+                        risk_profile=RiskProfile(
+                            risk_score=25.0,
+                            risk_level='Low',
+                            attendance_rate=85.0,
+                            academic_performance=75.0
+                        )
                     )
-                    db.session.add(student)
-                    db.session.flush()  # Get the student ID
-                    
-                    # Create risk profile
-                    risk_profile = RiskProfile(
-                        student_id=student.id,
-                        risk_score=25.0,
-                        risk_level='Low',
-                        attendance_rate=85.0,
-                        academic_performance=75.0
+                    students.append(student)
+                db.session.add_all(students)
+                db.session.flush()
+                
+                # Sample attendance for the last 30 days, generated for every
+                # (student, day) pair at once and inserted in one executemany
+                student_ids, days_ago = np.meshgrid(
+                    [student.id for student in students], np.arange(30), indexing='ij'
+                )
+                dates = np.datetime64(date.today(), 'D') - days_ago
+                statuses = np.random.choice(['Present', 'Present', 'Present', 'Absent', 'Late'], size=days_ago.shape)
+                courses = np.random.randint(100, 1000, size=days_ago.shape)
+                db.session.bulk_insert_mappings(Attendance, [
+                    {'student_id': student_id, 'date': day, 'status': status, 'course': f'Course {course}'}
+                    for student_id, day, status, course in zip(
+                        student_ids.ravel().tolist(), dates.ravel().tolist(),
+                        statuses.ravel().tolist(), courses.ravel().tolist()
                     )
-                    db.session.add(risk_profile)
-                    
-                    # Create sample attendance records
-                    for i in range(30):
-                        attendance_date = date.today() - timedelta(days=i)
-                        status = random.choice(['Present', 'Present', 'Present', 'Absent', 'Late'])
-                        attendance = Attendance(
-                            student_id=student.id,
-                            date=attendance_date,
-                            status=status,
-                            course=f'Course {random.randint(100, 999)}'
-                        )
-                        db.session.add(attendance)
+                ])
                 
                 print("✅ Created sample students with data")
             
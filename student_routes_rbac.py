@@ -182,7 +182,7 @@ def add_goal():
     try:
         target_date = None
         if target_date_str:
-            target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+            target_date = date.fromisoformat(target_date_str)
         
         goal = StudentGoal(
             student_id=student.id,  # Ensure only current student's goal
@@ -0,0 +1,63 @@
+"""
+Test Alerts API
+Keyset pages of /api/alerts cover every active alert exactly once, newest first
+"""
+
+from datetime import datetime, timedelta
+
+from app import create_app
+from models import db, User, Student, Alert
+
+def test_alert_cursor_pagination():
+    """Following X-Next-Cursor walks all active alerts, ties on created_at included"""
+    app = create_app('testing')
+    with app.app_context():
+        user = User(username='alertadmin', email='alerts@eduguard.edu', role='admin')
+        user.set_password('alerts123')
+        student = Student(student_id='AL001', first_name='Alert', last_name='Student',
+                          email='alert.student@eduguard.edu')
+        db.session.add_all([user, student])
+        db.session.flush()
+        
+        # Pairs of alerts share a timestamp so page boundaries fall inside ties
+        base = datetime(2026, 1, 1, 9, 0)
+        db.session.add_all(
+            Alert(student_id=student.id, title=f'Alert {i}', severity='High',
+                  status='Resolved' if i % 5 == 0 else 'Active',
+                  created_at=base + timedelta(minutes=i // 2))
+            for i in range(25)
+        )
+        db.session.commit()
+        expected = [
+            alert.id for alert in
+            Alert.query.filter_by(status='Active').order_by(Alert.created_at.desc(), Alert.id.desc())
+        ]
+        
+        client = app.test_client()
+        client.post('/login', data={'email': 'alerts@eduguard.edu', 'password': 'alerts123'})
+        
+        seen = []
+        cursor = None
+        while True:
+            params = {'per_page': 3}
+            if cursor:
+                params['cursor'] = cursor
+            response = client.get('/api/alerts', query_string=params)
+            assert response.status_code == 200
+            page = response.get_json()
+            assert 0 < len(page) <= 3
+            assert all(alert['student_name'] == 'Alert Student' for alert in page)
+            seen.extend(alert['id'] for alert in page)
+            cursor = response.headers.get('X-Next-Cursor')
+            if cursor is None:
+                break
+        assert seen == expected
+        
+        assert client.get('/api/alerts?cursor=not-a-cursor').status_code == 400
+        
+        db.session.remove()
+        db.drop_all()
+
+if __name__ == '__main__':
+    test_alert_cursor_pagination()
+    print("✅ Alerts API cursor pagination passed")
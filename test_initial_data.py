@@ -0,0 +1,62 @@
+"""
+Test Initial Data
+Sample students are only seeded into an empty or near-empty database
+"""
+
+from app import create_app, create_initial_data, SAMPLE_STUDENTS
+from models import db, User, Student
+
+def _student_ids():
+    return sorted(s.student_id for s in Student.query.all())
+
+def test_seeds_empty_database():
+    """A fresh database gets the admin, faculty and every sample student"""
+    app = create_app('testing')
+    with app.app_context():
+        create_initial_data()
+        assert _student_ids() == sorted(fixture[0] for fixture in SAMPLE_STUDENTS)
+        assert User.query.filter_by(email='admin@eduguard.edu').count() == 1
+        assert User.query.filter_by(email='faculty@eduguard.edu').count() == 1
+        
+        # Running again adds nothing
+        create_initial_data()
+        assert len(_student_ids()) == len(SAMPLE_STUDENTS)
+        db.session.remove()
+        db.drop_all()
+
+def test_leaves_populated_database_alone():
+    """A database that already has real students gets no sample students"""
+    app = create_app('testing')
+    with app.app_context():
+        db.session.add_all(
+            Student(student_id=f'CS{i:03d}', first_name='Real', last_name=f'Student{i}',
+                    email=f'real{i}@college.edu')
+            for i in range(10)
+        )
+        db.session.commit()
+        
+        create_initial_data()
+        assert not any(student_id.startswith('ST') for student_id in _student_ids())
+        assert User.query.filter_by(email='admin@eduguard.edu').count() == 1
+        db.session.remove()
+        db.drop_all()
+
+def test_skips_fixtures_whose_user_exists():
+    """A fixture email already taken by a user doesn't abort the whole seed"""
+    app = create_app('testing')
+    with app.app_context():
+        _, _, _, email, _ = SAMPLE_STUDENTS[0]
+        db.session.add(User(username='existing', email=email, role='student'))
+        db.session.commit()
+        
+        create_initial_data()
+        assert _student_ids() == sorted(fixture[0] for fixture in SAMPLE_STUDENTS[1:])
+        assert User.query.filter_by(email='admin@eduguard.edu').count() == 1
+        db.session.remove()
+        db.drop_all()
+
+if __name__ == '__main__':
+    test_seeds_empty_database()
+    test_leaves_populated_database_alone()
+    test_skips_fixtures_whose_user_exists()
+    print("✅ Initial data seeding checks passed")
@@ -0,0 +1,55 @@
+"""
+Test Keyword Matcher
+The automaton must pick the same payload as the first-group-wins linear scan it replaced
+"""
+
+import random
+
+from keyword_matcher import KeywordMatcher
+from ai_chatbot_service import FALLBACK_KEYWORDS, EMOTION_KEYWORDS
+from routes import CHAT_RESPONSES
+
+def _linear_search(keyword_groups, text, default=None):
+    """The original dispatch: first group with any keyword in the text"""
+    for payload, keywords in keyword_groups:
+        if any(keyword in text for keyword in keywords):
+            return payload
+    return default
+
+def _random_texts(keyword_groups, count, seed=0):
+    """Messages mixing keywords, keyword fragments and filler words"""
+    rng = random.Random(seed)
+    keywords = [keyword for _, group in keyword_groups for keyword in group]
+    fragments = [keyword[:rng.randint(1, len(keyword))] for keyword in keywords]
+    filler = ['the', 'a', 'i', 'am', 'really', 'feel', 'about', 'my', 'xyz', '', ' ']
+    pool = keywords + fragments + filler
+    for _ in range(count):
+        words = [rng.choice(pool) for _ in range(rng.randint(0, 8))]
+        yield rng.choice((' ', '')).join(words)
+
+def test_overlapping_keywords():
+    """Keywords that overlap or nest inside each other still respect group order"""
+    groups = (('she', ['she']), ('he', ['he']), ('hers', ['hers', 'his']), ('s', ['s']),
+              ('abcd', ['abcd']), ('bc', ['bc']))
+    matcher = KeywordMatcher(groups)
+    for text in ('ushers', 'he', 'his', 'hers', 'sh', 's', 'ahishers', 'abce', 'abcd', '', 'xyz'):
+        assert matcher.search(text) == _linear_search(groups, text), text
+
+def test_matches_linear_scan():
+    """Every keyword table in the app dispatches like the linear scan"""
+    tables = (
+        FALLBACK_KEYWORDS,
+        EMOTION_KEYWORDS,
+        tuple((reply, [keyword]) for keyword, reply in CHAT_RESPONSES),
+    )
+    for groups in tables:
+        matcher = KeywordMatcher(groups)
+        for keyword in (keyword for _, group in groups for keyword in group):
+            assert matcher.search(keyword) == _linear_search(groups, keyword), keyword
+        for text in _random_texts(groups, 2000):
+            assert matcher.search(text, 'none') == _linear_search(groups, text, 'none'), text
+
+if __name__ == '__main__':
+    test_overlapping_keywords()
+    test_matches_linear_scan()
+    print("✅ Keyword matcher agrees with the linear scan")
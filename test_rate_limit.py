@@ -0,0 +1,61 @@
+"""
+Test Rate Limit
+Token bucket bursts, refill and pruning against a fake clock
+"""
+
+import time
+
+import rate_limit
+from rate_limit import TokenBucket
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+
+def _with_fake_clock():
+    clock = FakeClock()
+    rate_limit.time = clock
+    return clock
+
+def test_burst_then_refill():
+    """A bucket allows `capacity` requests at once, then refills at `rate`"""
+    clock = _with_fake_clock()
+    try:
+        bucket = TokenBucket(rate=1, capacity=3)
+        assert [bucket.allow('a') for _ in range(4)] == [True, True, True, False]
+        
+        clock.now += 1
+        assert bucket.allow('a')
+        assert not bucket.allow('a')
+        
+        # Refill is capped at capacity
+        clock.now += 60
+        assert [bucket.allow('a') for _ in range(4)] == [True, True, True, False]
+        
+        # Other clients have their own bucket
+        assert bucket.allow('b')
+    finally:
+        rate_limit.time = time
+
+def test_prune_keeps_limits():
+    """Pruning only drops full buckets, so an empty bucket stays limited"""
+    clock = _with_fake_clock()
+    try:
+        bucket = TokenBucket(rate=1, capacity=2, max_keys=2)
+        assert bucket.allow('busy', tokens_required=2)
+        assert bucket.allow('idle')
+        
+        clock.now += 1
+        assert bucket.allow('new')
+        assert 'idle' not in bucket._buckets
+        assert not bucket.allow('busy', tokens_required=2)
+    finally:
+        rate_limit.time = time
+
+if __name__ == '__main__':
+    test_burst_then_refill()
+    test_prune_keeps_limits()
+    print("✅ Token bucket checks passed")
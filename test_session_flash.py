@@ -0,0 +1,40 @@
+"""
+Test Session Flash
+The signed session cookie, flashed messages included, round-trips through the JSON provider
+"""
+
+from app import create_app
+from models import db, User
+
+def test_login_flash_round_trip():
+    """A flash stored at login survives the cookie and is rendered on the next page"""
+    app = create_app('testing')
+    with app.app_context():
+        user = User(username='flashuser', email='flash@eduguard.edu', role='admin')
+        user.set_password('flash123')
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+        
+        client = app.test_client()
+        response = client.post('/login', data={'email': 'flash@eduguard.edu', 'password': 'flash123'})
+        assert response.status_code == 302
+        
+        # Flashes are stored as (category, message) tuples, which the session
+        # serializer tags; they must come back as tuples, not raw tag dicts
+        with client.session_transaction() as sess:
+            assert sess['_user_id'] == str(user_id)
+            assert ('success', 'Login successful!') in sess['_flashes']
+        
+        response = client.get('/login')
+        assert response.status_code == 200
+        assert b'Login successful!' in response.data
+        with client.session_transaction() as sess:
+            assert '_flashes' not in sess
+        
+        db.session.remove()
+        db.drop_all()
+
+if __name__ == '__main__':
+    test_login_flash_round_trip()
+    print("✅ Session flash round-trip passed")
@@ -3,7 +3,7 @@
 Test script to check student login and navigation
 """
 
-from models import User, Student
+from models import User, Student, db
 from app import create_app
 
 def test_student_access():
@@ -24,7 +24,7 @@ def test_student_access():
             print(f"Email: {student.email}")
             
             # Check user account
-            user = User.query.get(student.user_id)
+            user = db.session.get(User, student.user_id)
             if user:
                 print(f"User account: {user.email} (Role: {user.role})")
             else:
@@ -0,0 +1,46 @@
+"""
+Test Student Search
+Search results stay correct when the database is dropped and reseeded
+"""
+
+from app import create_app
+from models import db, Student, student_search_filter
+
+SEED_STUDENTS = (
+    ('ST001', 'John', 'Doe'),
+    ('ST002', 'Jane', 'Smith'),
+    ('ST003', 'Li', 'Wei'),
+)
+
+def _seed():
+    db.session.add_all(
+        Student(student_id=student_id, first_name=first_name, last_name=last_name,
+                email=f'{first_name.lower()}.{last_name.lower()}@eduguard.edu')
+        for student_id, first_name, last_name in SEED_STUDENTS
+    )
+    db.session.commit()
+
+def _search(term):
+    return sorted(s.student_id for s in Student.query.filter(student_search_filter(term)))
+
+def test_search_after_reseed():
+    """drop_all/create_all must not leave stale search rows behind"""
+    app = create_app('testing')
+    with app.app_context():
+        for _ in range(2):
+            db.drop_all()
+            db.create_all()
+            _seed()
+            assert _search('Jane') == ['ST002']
+            assert _search('smith') == ['ST002']
+            assert _search('eduguard') == ['ST001', 'ST002', 'ST003']
+            # Terms too short for trigrams still match names, not just roll numbers
+            assert _search('Jo') == ['ST001']
+            assert _search('Li') == ['ST003']
+            assert _search('ST') == ['ST001', 'ST002', 'ST003']
+        db.session.remove()
+        db.drop_all()
+
+if __name__ == '__main__':
+    test_search_after_reseed()
+    print("✅ Student search survives a reseed")
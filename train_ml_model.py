@@ -127,11 +127,11 @@ def train_and_save_model():
     
     # Get training data
     training_df = prepare_training_data()
-    logger.info(f"Prepared {len(training_df)} training samples")
+    logger.info("Prepared %s training samples", len(training_df))
     
     # Generate training data with labels
     training_data = predictor.generate_training_data(training_df)
-    logger.info(f"Generated {len(training_data)} labeled training samples")
+    logger.info("Generated %s labeled training samples", len(training_data))
     
     # Train models
     success = predictor.train_models(training_data)
@@ -141,12 +141,12 @@ def train_and_save_model():
         model_path = os.path.join(os.path.dirname(__file__), 'ml_models', 'risk_predictor.joblib')
         os.makedirs(os.path.dirname(model_path), exist_ok=True)
         predictor.save_model(model_path)
-        logger.info(f"Model saved successfully to {model_path}")
+        logger.info("Model saved successfully to %s", model_path)
         
         # Test the model with a sample
         test_student = training_data.iloc[0].to_dict()
         prediction = predictor.predict_risk(test_student)
-        logger.info(f"Sample prediction: {prediction}")
+        logger.info("Sample prediction: %s", prediction)
         
         return True
     else:
@@ -203,10 +203,10 @@ def update_existing_risk_profiles():
                 updated_count += 1
                 
             except Exception as e:
-                logger.error(f"Error updating student {student.student_id}: {e}")
+                logger.error("Error updating student %s: %s", student.student_id, e)
         
         db.session.commit()
-        logger.info(f"Updated {updated_count} student risk profiles with ML predictions")
+        logger.info("Updated %s student risk profiles with ML predictions", updated_count)
         return True
 
 if __name__ == '__main__':
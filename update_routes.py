@@ -8,8 +8,10 @@ from flask_login import login_required, current_user
 from models import db
 from sqlalchemy import text
 from datetime import datetime, date
+from response_cache import cached_json_response
+from rbac_system import session_login_required
+from services.update_tasks import start_update_job
 # Imports will be done inside functions to avoid circular import
-import threading
 
 update_bp = Blueprint('update', __name__, url_prefix='/update')
 
@@ -42,13 +44,8 @@ def manual_update():
                 'error': 'Permission denied'
             }), 403
         
-        # Run manual update in background thread
-        def run_update():
-            from daily_update_system import manual_update_now
-            manual_update_now()
-        
-        update_thread = threading.Thread(target=run_update, daemon=True)
-        update_thread.start()
+        # Run manual update in the background
+        start_update_job('all')
         
         return jsonify({
             'success': True,
@@ -125,15 +122,7 @@ def attendance_update():
                 'error': 'Permission denied'
             }), 403
         
-        from daily_update_system import DailyUpdateSystem
-        updater = DailyUpdateSystem()
-        
-        def run_attendance_update():
-            with updater.app.app_context():
-                updater.update_daily_attendance()
-        
-        update_thread = threading.Thread(target=run_attendance_update, daemon=True)
-        update_thread.start()
+        start_update_job('attendance')
         
         return jsonify({
             'success': True,
@@ -158,15 +147,7 @@ def user_data_update():
                 'error': 'Permission denied'
             }), 403
         
-        from daily_update_system import DailyUpdateSystem
-        updater = DailyUpdateSystem()
-        
-        def run_user_update():
-            with updater.app.app_context():
-                updater.update_user_data()
-        
-        update_thread = threading.Thread(target=run_user_update, daemon=True)
-        update_thread.start()
+        start_update_job('user_data')
         
         return jsonify({
             'success': True,
@@ -199,9 +180,14 @@ def update_dashboard():
             'error': str(e)
         }), 500
 
-# API endpoints for frontend
+# API endpoints for frontend; both are polled by the dashboard and change on a minute scale
+ATTENDANCE_STATS_CACHE_KEY = 'attendance_stats'
+USER_STATS_CACHE_KEY = 'user_stats'
+STATS_CACHE_TIMEOUT = 60
+
 @update_bp.route('/api/attendance-stats')
-@login_required
+@session_login_required
+@cached_json_response(ATTENDANCE_STATS_CACHE_KEY, timeout=STATS_CACHE_TIMEOUT)
 def attendance_stats():
     """Get attendance statistics"""
     try:
@@ -210,25 +196,16 @@ def attendance_stats():
                    COUNT(*) as total_students,
                    SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END) as present_students,
                    SUM(CASE WHEN status = 'Absent' THEN 1 ELSE 0 END) as absent_students,
-                   SUM(CASE WHEN status = 'Late' THEN 1 ELSE 0 END) as late_students
+                   SUM(CASE WHEN status = 'Late' THEN 1 ELSE 0 END) as late_students,
+                   SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as attendance_rate
             FROM attendance 
             WHERE date >= date('now', '-7 days')
             GROUP BY date
             ORDER BY date DESC
         """)
         
-        result = db.session.execute(query)
-        stats = []
-        
-        for row in result:
-            stats.append({
-                'date': row[0],
-                'total_students': row[1],
-                'present_students': row[2],
-                'absent_students': row[3],
-                'late_students': row[4],
-                'attendance_rate': (row[2] / row[1] * 100) if row[1] > 0 else 0
-            })
+        # Rows come back already keyed by the response field names
+        stats = [dict(row) for row in db.session.execute(query).mappings()]
         
         return jsonify({
             'success': True,
@@ -242,7 +219,8 @@ def attendance_stats():
         }), 500
 
 @update_bp.route('/api/user-stats')
-@login_required
+@session_login_required
+@cached_json_response(USER_STATS_CACHE_KEY, timeout=STATS_CACHE_TIMEOUT)
 def user_stats():
     """Get user statistics"""
     try: